@@ -1,12 +1,19 @@
 """The SMHI ODP integration."""
 import logging
-from datetime import timedelta
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from functools import partial
+from pathlib import Path
+import time
+
 import httpx
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers import httpx_client
+from homeassistant.helpers import config_validation as cv, httpx_client
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from homeassistant.const import (
     CONF_LATITUDE,
     CONF_LONGITUDE,
@@ -15,12 +22,68 @@ from homeassistant.const import (
 )
 
 # This import must match your folder name and const.py
-from .const import DOMAIN
+from .const import (
+    CONF_ARCHIVE,
+    CONF_COOLING_BASE,
+    CONF_FORECAST_EVENTS,
+    CONF_FROST_RISK,
+    CONF_FROST_THRESHOLD,
+    CONF_GUST_THRESHOLD,
+    CONF_HEATING_BASE,
+    CONF_IMPORT_STATISTICS,
+    CONF_INTERPOLATION,
+    CONF_NOWCAST,
+    CONF_OBSERVATIONS,
+    CONF_PRECIPITATION_THRESHOLD,
+    CONF_PRODUCTS,
+    CONF_SHARED_CACHE,
+    CONF_WARNINGS,
+    CONF_WIND_CHILL,
+    DATA_OBSERVATIONS,
+    DATA_POINT_CACHE,
+    DATA_PRODUCTS,
+    DATA_SEEDS,
+    DATA_SNAPSHOTS,
+    DATA_WARNINGS,
+    DOMAIN,
+    FORECAST_TYPES,
+    INTERPOLATION_OFF,
+    SEED_MAX_AGE,
+    SHARED_CACHE_MAX_AGE,
+    SIGNAL_NEW_GENERATION,
+    SIGNAL_VERIFICATION,
+)
+from .core.adapters import grid_point
+from .core.archive import ForecastArchive, verify
+from .core.cache import DiskCache
+from .core.changes import EVENT_FORECAST_CHANGED, ChangeThresholds, diff_forecasts
+from .core.client import SmhiClient
+from .core.degree_days import DegreeDay, DegreeDaySettings, degree_days
+from .core.events import EventIndex, detect_events
+from .core.frost import FrostNight, frost_nights
+from .core.interpolation import PointCache, async_fetch_interpolated
+from .core.model import SmhiView, build_forecast, build_view
+from .core.snapshot import build_snapshot
+from .core.sun import night_window
+from .metrics import SmhiMetricsView
+from .nowcast_coordinator import SmhiNowcastCoordinator
+from .observations import SmhiObservationsCoordinator, apply_observations
+from .product_coordinator import SmhiProductsCoordinator
+from .services import async_setup_services
+from .statistics import async_import_forecast
+from .weather_warnings import SmhiWarningsCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 # Define the platform you want to load (sensor)
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WEATHER]
+PLATFORMS: list[Platform] = [
+    Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
+    Platform.SENSOR,
+    Platform.WEATHER,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 class SmhiDataUpdateCoordinator(DataUpdateCoordinator):
@@ -30,9 +93,63 @@ class SmhiDataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize the coordinator."""
         # --- DEBUG LOG REMOVED ---
         
+        self.entry = entry
         self.latitude = entry.data.get(CONF_LATITUDE)
         self.longitude = entry.data.get(CONF_LONGITUDE)
-        self.client = httpx_client.get_async_client(hass)
+        self.client = SmhiClient(httpx_client.get_async_client(hass))
+
+        # Shared metobs coordinator, if observations are enabled
+        self.observations: SmhiObservationsCoordinator | None = None
+
+        # Shared warnings coordinator, if warnings are enabled
+        self.warnings: SmhiWarningsCoordinator | None = None
+
+        # Shared coordinator of the other SMHI products, if any are enabled
+        self.products: SmhiProductsCoordinator | None = None
+
+        # Precipitation nowcast of this location, if enabled
+        self.nowcast: SmhiNowcastCoordinator | None = None
+
+        # Forecast cache shared with other instances, opened on first use
+        self._shared_cache: DiskCache | None = None
+
+        # Archive of past runs and its verification, if enabled
+        self.archive: ForecastArchive | None = None
+        self.verification: dict[int, dict[str, dict]] = {}
+
+        # Degree-days of every forecast day, computed once per generation
+        self.degree_days: dict[date, DegreeDay] = {}
+
+        # Weather events of the calendar, detected once per generation
+        self.events = EventIndex()
+
+        # Frost risk of every forecast night, computed once per generation,
+        # and the sunset-to-sunrise window of every night by starting day
+        self.frost_nights: list[FrostNight] = []
+        self._night_windows: dict[date, tuple[datetime, datetime]] = {}
+
+        # Parsed forecast of the current data, parsed once per payload
+        self._forecast = None
+        self._forecast_source = None
+
+        # Values of all entities of this entry, rebuilt once per refresh
+        self._view = SmhiView()
+        self._view_source = None
+
+        # View keys of the entities that are enabled and added, with counts
+        self._tracked_keys: dict[str, int] = {}
+
+        # Forecast types whose content changed in the last view rebuild
+        self.changed_forecasts: set[str] = set()
+
+        # Seconds the last successful download and parse took
+        self.fetch_duration: float | None = None
+        self.parse_duration: float | None = None
+
+        # Incremented for every new payload (not for failed refreshes)
+        self.generation = 0
+        self._generation_source = None
+        self._previous_forecast = None
         
         super().__init__(
             hass,
@@ -41,24 +158,221 @@ class SmhiDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(minutes=60),
         )
 
+    @property
+    def view(self) -> SmhiView:
+        """Return the precomputed entity values for the current data."""
+        if self._view_source is not self.data:
+            self._rebuild_view()
+        return self._view
+
+    def _rebuild_view(self) -> None:
+        """Compute every entity value of the current data in one pass.
+
+        The payload is only parsed when the data object changed, so
+        observation ticks and listener fan-outs reuse the parsed forecast.
+        """
+        if self._forecast_source is not self.data:
+            started = time.perf_counter()
+            self._forecast = build_forecast(self.data, dt_util.DEFAULT_TIME_ZONE)
+            self.parse_duration = time.perf_counter() - started
+            self._forecast_source = self.data
+        self._view = build_view(self._forecast, dt_util.now(), self._tracked_keys)
+        self._view_source = self.data
+        if self.observations is not None:
+            apply_observations(
+                self._view, self.observations.readings_for(self.entry.entry_id)
+            )
+
+    @callback
+    def async_track_key(self, key: str) -> Callable[[], None]:
+        """Compute a view key while an entity using it is added.
+
+        Disabled entities are never added, so their values are not computed.
+        Returns a callback that stops tracking the key.
+        """
+        self._tracked_keys[key] = self._tracked_keys.get(key, 0) + 1
+        if key not in self._view.entities:
+            # Rebuild on next access so the new entity gets its value
+            self._view_source = None
+
+        @callback
+        def untrack() -> None:
+            count = self._tracked_keys.pop(key, 0) - 1
+            if count > 0:
+                self._tracked_keys[key] = count
+
+        return untrack
+
+    @callback
+    def async_attach_observations(
+        self, observations: SmhiObservationsCoordinator
+    ) -> None:
+        """Overlay the nearest stations' readings on the current sensors."""
+        self.observations = observations
+        observations.async_register(self.entry.entry_id, self.latitude, self.longitude)
+        self.entry.async_on_unload(
+            observations.async_add_listener(self.async_update_listeners)
+        )
+
+    @callback
+    def async_attach_warnings(self, warnings: SmhiWarningsCoordinator) -> None:
+        """Match this location against the shared warnings index."""
+        self.warnings = warnings
+        warnings.async_register(self.entry.entry_id, self.latitude, self.longitude)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Rebuild the view before fanning the update out to the entities."""
+        previous = self._view
+        self._rebuild_view()
+        self.changed_forecasts = {
+            forecast_type
+            for forecast_type in FORECAST_TYPES
+            if getattr(previous, f"{forecast_type}_forecast")
+            != getattr(self._view, f"{forecast_type}_forecast")
+        }
+        if self.data is not None and self.data is not self._generation_source:
+            self._generation_source = self.data
+            self.generation += 1
+            self._async_new_generation()
+        super().async_update_listeners()
+
+    @callback
+    def _async_new_generation(self) -> None:
+        """Run the per-forecast work that only depends on new data."""
+        forecast = self._view.forecast
+        if forecast is None:
+            return
+        self._async_publish_snapshot(forecast)
+        self.degree_days = {
+            day.date: day for day in degree_days(forecast, self.degree_day_settings)
+        }
+        self.events = EventIndex(detect_events(forecast, self.change_thresholds))
+        if self.entry.options.get(CONF_FROST_RISK):
+            self.frost_nights = frost_nights(forecast, self._nights(forecast))
+        if self.entry.options.get(CONF_IMPORT_STATISTICS):
+            async_import_forecast(self.hass, self.entry, forecast)
+        if self.entry.options.get(CONF_FORECAST_EVENTS):
+            self._async_fire_change_events(self._previous_forecast, forecast)
+        if self.archive is not None:
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_update_archive(forecast),
+                "smhi_odp.archive",
+            )
+        self._previous_forecast = forecast
+
+    @property
+    def change_thresholds(self) -> ChangeThresholds:
+        """Return the event thresholds of this entry's options."""
+        options = self.entry.options
+        defaults = ChangeThresholds()
+        return ChangeThresholds(
+            precipitation=options.get(
+                CONF_PRECIPITATION_THRESHOLD, defaults.precipitation
+            ),
+            frost=options.get(CONF_FROST_THRESHOLD, defaults.frost),
+            wind_gust=options.get(CONF_GUST_THRESHOLD, defaults.wind_gust),
+        )
+
+    @property
+    def degree_day_settings(self) -> DegreeDaySettings:
+        """Return the degree-day settings of this entry's options."""
+        options = self.entry.options
+        defaults = DegreeDaySettings()
+        return DegreeDaySettings(
+            heating_base=options.get(CONF_HEATING_BASE, defaults.heating_base),
+            cooling_base=options.get(CONF_COOLING_BASE, defaults.cooling_base),
+            wind_chill=options.get(CONF_WIND_CHILL, defaults.wind_chill),
+        )
+
+    def _nights(self, forecast) -> list[tuple[date, datetime, datetime]]:
+        """Return the nights of the forecast days, from last night on.
+
+        Sunset and sunrise only depend on the day, so each night's window
+        is computed once and kept until the night is over.
+        """
+        if not forecast.days:
+            return []
+        first = forecast.days[0].date - timedelta(days=1)
+        days = [first, *(day.date for day in forecast.days)]
+        for day in days:
+            if day not in self._night_windows:
+                self._night_windows[day] = night_window(
+                    day, self.latitude, self.longitude, dt_util.DEFAULT_TIME_ZONE
+                )
+        for day in [day for day in self._night_windows if day < first]:
+            del self._night_windows[day]
+        return [(day, *self._night_windows[day]) for day in days]
+
+    def frost_night(self, night_offset: int) -> FrostNight | None:
+        """Return the frost risk of a night, 0 being the current or next one."""
+        now = dt_util.utcnow()
+        upcoming = [night for night in self.frost_nights if night.end > now]
+        return upcoming[night_offset] if night_offset < len(upcoming) else None
+
+    def degree_day(self, day_offset: int) -> DegreeDay | None:
+        """Return the degree-days of a day relative to today, if forecast."""
+        day = dt_util.now().date() + timedelta(days=day_offset)
+        return self.degree_days.get(day)
+
+    @callback
+    def _async_publish_snapshot(self, forecast) -> None:
+        """Share the parsed forecast with other integrations (see api.py)."""
+        snapshot = build_snapshot(
+            forecast,
+            self._view,
+            entry_id=self.entry.entry_id,
+            name=self.entry.data.get(CONF_NAME),
+            latitude=self.latitude,
+            longitude=self.longitude,
+            generation=self.generation,
+        )
+        self.hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SNAPSHOTS, {})[
+            self.entry.entry_id
+        ] = snapshot
+        async_dispatcher_send(self.hass, SIGNAL_NEW_GENERATION, snapshot)
+
+    async def _async_update_archive(self, forecast) -> None:
+        """Archive a new run and recompute the verification."""
+        self.verification = await self.hass.async_add_executor_job(
+            self._archive_and_verify, forecast
+        )
+        async_dispatcher_send(
+            self.hass, SIGNAL_VERIFICATION.format(self.entry.entry_id)
+        )
+
+    def _archive_and_verify(self, forecast) -> dict[int, dict[str, dict]]:
+        """Append a run to the archive and verify it (runs in the executor)."""
+        self.archive.append_run(forecast)
+        return verify(self.archive.records(), self.archive.parameters)
+
+    @callback
+    def _async_fire_change_events(self, previous, forecast) -> None:
+        """Fire an event for every relevant change against the last forecast."""
+        for change in diff_forecasts(previous, forecast, self.change_thresholds):
+            self.hass.bus.async_fire(
+                EVENT_FORECAST_CHANGED,
+                {
+                    "entry_id": self.entry.entry_id,
+                    "name": self.entry.data.get(CONF_NAME),
+                    **change,
+                },
+            )
+
     async def _async_update_data(self):
         """Fetch data from API."""
         # --- DEBUG LOG REMOVED ---
-        
-        # Format coordinates to 6 decimal places
-        lat_str = f"{self.latitude:.6f}"
-        lon_str = f"{self.longitude:.6f}"
-        
-        # *** FIX: Reverted to your 'snow1g' API URL ***
-        api_url = f"https://opendata-download-metfcst.smhi.se/api/category/snow1g/version/1/geotype/point/lon/{lon_str}/lat/{lat_str}/data.json"
-        
+
         try:
-            # --- DEBUG LOG REMOVED ---
-            response = await self.client.get(api_url)
-            response.raise_for_status()  # Raises error for 4xx or 5xx status
-            
-            # --- DEBUG LOG REMOVED ---
-            return response.json()
+            started = time.perf_counter()
+            shared_cache = self.entry.options.get(CONF_SHARED_CACHE)
+            if shared_cache:
+                payload = await self._async_fetch_shared(Path(shared_cache))
+            else:
+                payload = await self._async_fetch()
+            self.fetch_duration = time.perf_counter() - started
+            return payload
         
         except httpx.HTTPStatusError as err:
             _LOGGER.error(f"SMHI ODP API error: {err}")
@@ -66,6 +380,96 @@ class SmhiDataUpdateCoordinator(DataUpdateCoordinator):
         except httpx.RequestError as err:
             _LOGGER.error(f"SMHI ODP connection error: {err}")
             raise UpdateFailed(f"Connection error fetching data from SMHI: {err}") from err
+        except ValueError as err:
+            _LOGGER.error(f"SMHI ODP returned an unusable forecast: {err}")
+            raise UpdateFailed(f"Invalid forecast data from SMHI: {err}") from err
+
+    async def _async_fetch(self):
+        """Download this location's forecast from SMHI."""
+        method = self.entry.options.get(CONF_INTERPOLATION, INTERPOLATION_OFF)
+        if method != INTERPOLATION_OFF:
+            # Blend the surrounding grid points, shared between entries
+            cache = self.hass.data.setdefault(DOMAIN, {}).setdefault(
+                DATA_POINT_CACHE, PointCache()
+            )
+            return await async_fetch_interpolated(
+                self.client.client, self.latitude, self.longitude, method, cache
+            )
+
+        # Tries snow1g first and falls back to the legacy pmp3g endpoint;
+        # the payload format is detected once when the view is built
+        return await self.client.forecast(self.latitude, self.longitude)
+
+    async def _async_fetch_shared(self, directory: Path):
+        """Reuse a forecast another instance stored, or fetch and store it.
+
+        The key's lock is held while fetching, so instances polling the
+        same location wait for the first one's download instead of
+        fetching it again. If the shared directory is unusable, the
+        forecast is fetched directly.
+        """
+        method = self.entry.options.get(CONF_INTERPOLATION, INTERPOLATION_OFF)
+        key = ("forecast", method, self.latitude, self.longitude)
+        try:
+            if self._shared_cache is None:
+                self._shared_cache = await self.hass.async_add_executor_job(
+                    DiskCache, directory, SHARED_CACHE_MAX_AGE
+                )
+            cache = self._shared_cache
+            lock = await self.hass.async_add_executor_job(cache.lock, key)
+        except OSError as err:
+            _LOGGER.warning("Shared forecast cache %s is unusable: %s", directory, err)
+            return await self._async_fetch()
+
+        try:
+            payload = await self.hass.async_add_executor_job(cache.get, key)
+            if payload is not None:
+                return payload
+            payload = await self._async_fetch()
+            try:
+                await self.hass.async_add_executor_job(cache.put, key, payload)
+            except OSError as err:
+                _LOGGER.warning("Could not store the forecast in %s: %s", directory, err)
+            return payload
+        finally:
+            if lock is not None:
+                await self.hass.async_add_executor_job(lock.release)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Register the integration's services and metrics export."""
+    async_setup_services(hass)
+    hass.http.register_view(SmhiMetricsView())
+    return True
+
+
+@callback
+def _async_migrate_unique_id(
+    hass: HomeAssistant, entry: ConfigEntry, payload
+) -> None:
+    """Rewrite a unique ID from the requested coordinates to the grid point.
+
+    Entries created before unique IDs followed the SMHI grid point are keyed
+    by their raw coordinates, so adding the same location again would not
+    be detected. The grid point is only known from a plain point forecast,
+    not from an interpolated one.
+    """
+    lat, lon = entry.data.get(CONF_LATITUDE), entry.data.get(CONF_LONGITUDE)
+    interpolation = entry.options.get(CONF_INTERPOLATION, INTERPOLATION_OFF)
+    if entry.unique_id != f"{lat}-{lon}" or interpolation != INTERPOLATION_OFF:
+        return
+    grid_lat, grid_lon = grid_point(payload, lat, lon)
+    unique_id = f"{grid_lat}-{grid_lon}"
+    if unique_id == entry.unique_id:
+        return
+    if hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_id):
+        _LOGGER.warning(
+            "%s is the same SMHI grid point as another location; "
+            "remove one of them to avoid fetching it twice",
+            entry.title,
+        )
+        return
+    hass.config_entries.async_update_entry(entry, unique_id=unique_id)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -76,21 +480,89 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create the coordinator
     coordinator = SmhiDataUpdateCoordinator(hass, entry)
 
-    # Fetch initial data so we have it when platforms are set up
-    #_LOGGER.warning("SMHI_ODP: Performing first data refresh...")
-    await coordinator.async_config_entry_first_refresh()
-    #_LOGGER.warning("SMHI_ODP: First data refresh complete.")
+    if entry.options.get(CONF_ARCHIVE):
+        # Opened before the first refresh so its run is archived too
+        coordinator.archive = await hass.async_add_executor_job(
+            ForecastArchive, archive_path(hass, entry)
+        )
+
+    # Fetch initial data so we have it when platforms are set up.
+    # If the config flow just validated this location, reuse its payload
+    # instead of downloading the same forecast a second time.
+    seed = hass.data.get(DOMAIN, {}).get(DATA_SEEDS, {}).pop(entry.unique_id, None)
+    if seed is not None and dt_util.utcnow() - seed[0] < SEED_MAX_AGE:
+        coordinator.async_set_updated_data(seed[1])
+    else:
+        #_LOGGER.warning("SMHI_ODP: Performing first data refresh...")
+        await coordinator.async_config_entry_first_refresh()
+        #_LOGGER.warning("SMHI_ODP: First data refresh complete.")
+
+    _async_migrate_unique_id(hass, entry, coordinator.data)
 
     # Store the coordinator in hass.data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    if entry.options.get(CONF_OBSERVATIONS):
+        observations = hass.data[DOMAIN].get(DATA_OBSERVATIONS)
+        if observations is None:
+            observations = SmhiObservationsCoordinator(hass)
+            hass.data[DOMAIN][DATA_OBSERVATIONS] = observations
+        coordinator.async_attach_observations(observations)
+        if observations.data is None:
+            # Observations are optional, so a failure must not block setup
+            await observations.async_refresh()
+
+    if entry.options.get(CONF_WARNINGS):
+        warnings = hass.data[DOMAIN].get(DATA_WARNINGS)
+        if warnings is None:
+            warnings = SmhiWarningsCoordinator(hass)
+            hass.data[DOMAIN][DATA_WARNINGS] = warnings
+        coordinator.async_attach_warnings(warnings)
+        if warnings.data is None:
+            # Warnings are optional, so a failure must not block setup
+            await warnings.async_refresh()
+
+    if entry.options.get(CONF_PRODUCTS):
+        products = hass.data[DOMAIN].get(DATA_PRODUCTS)
+        if products is None:
+            products = SmhiProductsCoordinator(hass)
+            hass.data[DOMAIN][DATA_PRODUCTS] = products
+        products.async_register(
+            entry.entry_id,
+            coordinator.latitude,
+            coordinator.longitude,
+            entry.options[CONF_PRODUCTS],
+        )
+        coordinator.products = products
+        # Polls the new location's products now; they are optional, so a
+        # failure must not block setup
+        await products.async_refresh()
+
+    if entry.options.get(CONF_NOWCAST):
+        coordinator.nowcast = SmhiNowcastCoordinator(hass, entry)
+        # The nowcast is optional, so a failure must not block setup
+        await coordinator.nowcast.async_refresh()
+
     # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Reload the entry when its options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     return True
 
 
+def archive_path(hass: HomeAssistant, entry: ConfigEntry) -> Path:
+    """Return the forecast archive file of a config entry."""
+    return Path(hass.config.path(".storage", f"{DOMAIN}.archive.{entry.entry_id}"))
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options were updated."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     #_LOGGER.warning("SMHI_ODP: Unloading config entry.")
@@ -100,6 +572,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # Remove the coordinator from hass.data
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].get(DATA_SNAPSHOTS, {}).pop(entry.entry_id, None)
+        if coordinator.archive is not None:
+            await hass.async_add_executor_job(coordinator.archive.close)
+
+        # Drop the shared observations coordinator with its last location
+        observations = hass.data[DOMAIN].get(DATA_OBSERVATIONS)
+        if observations is not None and observations.async_unregister(entry.entry_id):
+            hass.data[DOMAIN].pop(DATA_OBSERVATIONS)
+
+        # Likewise the shared warnings coordinator
+        warnings = hass.data[DOMAIN].get(DATA_WARNINGS)
+        if warnings is not None and warnings.async_unregister(entry.entry_id):
+            hass.data[DOMAIN].pop(DATA_WARNINGS)
+
+        # And the shared products coordinator
+        products = hass.data[DOMAIN].get(DATA_PRODUCTS)
+        if products is not None and products.async_unregister(entry.entry_id):
+            hass.data[DOMAIN].pop(DATA_PRODUCTS)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the forecast archive of a removed config entry."""
+    await hass.async_add_executor_job(
+        partial(archive_path(hass, entry).unlink, missing_ok=True)
+    )
@@ -0,0 +1,51 @@
+"""Read-only forecast API for other integrations.
+
+The coordinator of every config entry publishes an immutable
+`ForecastSnapshot` of its parsed forecast in hass.data once per forecast
+generation and announces it with a dispatcher signal, so other code can use
+the hourly series and daily aggregates without parsing entity attributes:
+
+    from homeassistant.helpers.dispatcher import async_dispatcher_connect
+    from custom_components.smhi_odp.api import (
+        SIGNAL_NEW_GENERATION,
+        async_get_snapshots,
+    )
+
+    for snapshot in async_get_snapshots(hass).values():
+        temperatures = snapshot.hourly.values["air_temperature"]
+
+    async_dispatcher_connect(hass, SIGNAL_NEW_GENERATION, on_new_forecast)
+
+The signal's only argument is the new snapshot.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SNAPSHOTS, DOMAIN, SIGNAL_NEW_GENERATION
+from .core.snapshot import DailySummary, ForecastSnapshot, HourlySeries
+
+__all__ = [
+    "SIGNAL_NEW_GENERATION",
+    "DailySummary",
+    "ForecastSnapshot",
+    "HourlySeries",
+    "async_get_snapshot",
+    "async_get_snapshots",
+]
+
+
+@callback
+def async_get_snapshots(hass: HomeAssistant) -> Mapping[str, ForecastSnapshot]:
+    """Return the latest snapshot of every loaded entry, by entry ID."""
+    return MappingProxyType(hass.data.get(DOMAIN, {}).get(DATA_SNAPSHOTS, {}))
+
+
+@callback
+def async_get_snapshot(hass: HomeAssistant, entry_id: str) -> ForecastSnapshot | None:
+    """Return the latest snapshot of one entry, if it has a forecast."""
+    return async_get_snapshots(hass).get(entry_id)
@@ -0,0 +1,68 @@
+"""Binary sensor platform for SMHI ODP weather warnings."""
+import logging
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.const import CONF_NAME
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import ATTRIBUTION, DOMAIN
+from .core.warning_areas import highest_level
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up the SMHI ODP binary sensor platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if coordinator.warnings is None:
+        return
+    async_add_entities([SmhiWarningBinarySensor(coordinator.warnings, entry)])
+
+
+class SmhiWarningBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """On while an SMHI weather warning is in effect at the location."""
+
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, entry):
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._entry_id = entry.entry_id
+        self._attr_name = "Weather Warning"
+        self._attr_unique_id = f"{entry.entry_id}_weather_warning"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
+
+    @property
+    def is_on(self):
+        """Return True if any warning covering the location is active.
+
+        Informational messages are listed in the attributes but do not turn
+        the sensor on.
+        """
+        now = dt_util.utcnow()
+        return any(
+            area.is_warning and area.is_active(now)
+            for area in self.coordinator.warnings_for(self._entry_id)
+        )
+
+    @property
+    def extra_state_attributes(self):
+        """Return the current and upcoming warnings at the location."""
+        now = dt_util.utcnow()
+        areas = self.coordinator.warnings_for(self._entry_id)
+        return {
+            "level": highest_level([a for a in areas if a.is_active(now)]),
+            "warnings": [area.as_dict(now) for area in areas],
+        }
@@ -0,0 +1,65 @@
+"""Calendar platform for SMHI ODP weather events."""
+from datetime import datetime
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.const import CONF_NAME
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import ATTRIBUTION, DOMAIN
+from .core.events import WeatherEvent
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up the SMHI ODP calendar platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([SmhiWeatherCalendar(coordinator, entry)])
+
+
+def _calendar_event(event: WeatherEvent) -> CalendarEvent:
+    """Convert a weather event to a calendar event."""
+    return CalendarEvent(
+        start=event.start,
+        end=event.end,
+        summary=event.summary,
+        uid=event.uid,
+    )
+
+
+class SmhiWeatherCalendar(CoordinatorEntity, CalendarEntity):
+    """Frost, rain, snow and strong wind periods of the forecast.
+
+    The coordinator detects the events once per forecast; the calendar
+    only looks them up in its sorted index.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, entry):
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_name = "Weather Events"
+        self._attr_unique_id = f"{entry.entry_id}_weather_events"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next weather event."""
+        event = self.coordinator.events.current_or_next(dt_util.utcnow())
+        return _calendar_event(event) if event is not None else None
+
+    async def async_get_events(
+        self, hass, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the weather events within a time range."""
+        return [
+            _calendar_event(event)
+            for event in self.coordinator.events.between(start_date, end_date)
+        ]
@@ -3,10 +3,44 @@ import logging
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME, CONF_LATITUDE, CONF_LONGITUDE
-from homeassistant.helpers import httpx_client, selector as sel
+from homeassistant.core import callback
+from homeassistant.helpers import (
+    config_validation as cv,
+    httpx_client,
+    selector as sel,
+)
+from homeassistant.util import dt as dt_util
 
 # This import now correctly references the smhi_odp domain
-from .const import DOMAIN
+from .const import (
+    CONF_ARCHIVE,
+    CONF_COOLING_BASE,
+    CONF_DEGREE_DAYS,
+    CONF_FROST_RISK,
+    CONF_FORECAST_ATTRIBUTE,
+    CONF_FORECAST_EVENTS,
+    CONF_FROST_THRESHOLD,
+    CONF_GUST_THRESHOLD,
+    CONF_HEATING_BASE,
+    CONF_IMPORT_STATISTICS,
+    CONF_INTERPOLATION,
+    CONF_NOWCAST,
+    CONF_OBSERVATIONS,
+    CONF_PRECIPITATION_THRESHOLD,
+    CONF_PRODUCTS,
+    CONF_SHARED_CACHE,
+    CONF_WARNINGS,
+    CONF_WIND_CHILL,
+    DATA_SEEDS,
+    DOMAIN,
+    INTERPOLATION_OFF,
+)
+from .core.adapters import grid_point, in_coverage
+from .core.changes import ChangeThresholds
+from .core.client import SmhiClient
+from .core.degree_days import DegreeDaySettings
+from .core.interpolation import METHODS
+from .core.products import PRODUCTS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +50,12 @@ class SmhiOdpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return SmhiOdpOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
@@ -27,18 +67,32 @@ class SmhiOdpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             lat = location_data[CONF_LATITUDE]
             lon = location_data[CONF_LONGITUDE]
 
-            # Create a unique ID for this config entry
-            await self.async_set_unique_id(f"{lat}-{lon}")
-            self._abort_if_unique_id_configured()
-
-            try:
-                # Test the API connection
-                await self._test_api_connection(lat, lon)
-            except Exception as e:
-                _LOGGER.error("SMHI ODP API connection error: %s", e)
-                errors["base"] = "cannot_connect"
-            
+            payload = None
+            if not in_coverage(lat, lon):
+                # No need to ask the API about a location it does not cover
+                errors["location"] = "outside_coverage"
+            else:
+                try:
+                    # Test the API connection, keeping the forecast it returns
+                    payload = await self._test_api_connection(lat, lon)
+                except Exception as e:
+                    _LOGGER.error("SMHI ODP API connection error: %s", e)
+                    errors["base"] = "cannot_connect"
+
             if not errors:
+                # Create a unique ID from the grid point SMHI snapped us to,
+                # so nearby coordinates in the same cell are not added twice
+                grid_lat, grid_lon = grid_point(payload, lat, lon)
+                await self.async_set_unique_id(f"{grid_lat}-{grid_lon}")
+                self._abort_if_unique_id_configured()
+
+                # Hand the validated forecast to the coordinator so the
+                # first refresh does not download it again
+                seeds = self.hass.data.setdefault(DOMAIN, {}).setdefault(
+                    DATA_SEEDS, {}
+                )
+                seeds[self.unique_id] = (dt_util.utcnow(), payload)
+
                 # Input is valid, create the config entry.
                 # We save the name and location data together
                 data_to_save = {
@@ -74,12 +128,121 @@ class SmhiOdpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=data_schema, errors=errors
         )
 
+    async def async_step_import(self, import_data):
+        """Create an entry for a location validated by the import service.
+
+        The service has already fetched the forecast and seeded it under
+        the grid point's unique ID, so no request is made here.
+        """
+        await self.async_set_unique_id(import_data["unique_id"])
+        self._abort_if_unique_id_configured()
+        name = import_data[CONF_NAME]
+        return self.async_create_entry(
+            title=f"SMHI ODP ({name})",
+            data={
+                CONF_NAME: name,
+                CONF_LATITUDE: import_data[CONF_LATITUDE],
+                CONF_LONGITUDE: import_data[CONF_LONGITUDE],
+            },
+        )
+
     async def _test_api_connection(self, lat, lon):
-        """Test the API connection with SMHI."""
-        client = httpx_client.get_async_client(self.hass)
-        api_url = f"https://opendata-download-metfcst.smhi.se/api/category/snow1g/version/1/geotype/point/lon/{lon:.6f}/lat/{lat:.6f}/data.json"
-        
-        _LOGGER.debug("Connecting to SMHI ODP API at: %s", api_url)
-        response = await client.get(api_url)
-        _LOGGER.debug("API response status code: %s", response.status_code)
-        response.raise_for_status()
+        """Test the API connection with SMHI and return the forecast payload."""
+        client = SmhiClient(httpx_client.get_async_client(self.hass))
+
+        _LOGGER.debug("Connecting to SMHI ODP API for %s, %s", lat, lon)
+        return await client.forecast(lat, lon)
+
+
+class SmhiOdpOptionsFlow(config_entries.OptionsFlow):
+    """Handle opt-in features of an SMHI ODP location."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        thresholds = ChangeThresholds()
+        degree_days = DegreeDaySettings()
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_IMPORT_STATISTICS,
+                    default=options.get(CONF_IMPORT_STATISTICS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_FORECAST_ATTRIBUTE,
+                    default=options.get(CONF_FORECAST_ATTRIBUTE, True),
+                ): bool,
+                vol.Optional(
+                    CONF_INTERPOLATION,
+                    default=options.get(CONF_INTERPOLATION, INTERPOLATION_OFF),
+                ): vol.In([INTERPOLATION_OFF, *METHODS]),
+                vol.Optional(
+                    CONF_SHARED_CACHE,
+                    default=options.get(CONF_SHARED_CACHE, ""),
+                ): str,
+                vol.Optional(
+                    CONF_OBSERVATIONS,
+                    default=options.get(CONF_OBSERVATIONS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_WARNINGS,
+                    default=options.get(CONF_WARNINGS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_NOWCAST,
+                    default=options.get(CONF_NOWCAST, False),
+                ): bool,
+                vol.Optional(
+                    CONF_PRODUCTS,
+                    default=options.get(CONF_PRODUCTS, []),
+                ): cv.multi_select(
+                    {key: product.name for key, product in PRODUCTS.items()}
+                ),
+                vol.Optional(
+                    CONF_ARCHIVE,
+                    default=options.get(CONF_ARCHIVE, False),
+                ): bool,
+                vol.Optional(
+                    CONF_DEGREE_DAYS,
+                    default=options.get(CONF_DEGREE_DAYS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_HEATING_BASE,
+                    default=options.get(CONF_HEATING_BASE, degree_days.heating_base),
+                ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_COOLING_BASE,
+                    default=options.get(CONF_COOLING_BASE, degree_days.cooling_base),
+                ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_WIND_CHILL,
+                    default=options.get(CONF_WIND_CHILL, degree_days.wind_chill),
+                ): bool,
+                vol.Optional(
+                    CONF_FROST_RISK,
+                    default=options.get(CONF_FROST_RISK, False),
+                ): bool,
+                vol.Optional(
+                    CONF_FORECAST_EVENTS,
+                    default=options.get(CONF_FORECAST_EVENTS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_PRECIPITATION_THRESHOLD,
+                    default=options.get(
+                        CONF_PRECIPITATION_THRESHOLD, thresholds.precipitation
+                    ),
+                ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_FROST_THRESHOLD,
+                    default=options.get(CONF_FROST_THRESHOLD, thresholds.frost),
+                ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_GUST_THRESHOLD,
+                    default=options.get(CONF_GUST_THRESHOLD, thresholds.wind_gust),
+                ): vol.Coerce(float),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -8,3 +8,61 @@ SCAN_INTERVAL = timedelta(hours=1)
 
 # This is the new line that was missing
 ATTRIBUTION = "Weather data from SMHI Open Data (https://opendata.smhi.se/)"
+
+# hass.data[DOMAIN] key for payloads fetched during config flow validation,
+# keyed by config entry unique_id and consumed by the first refresh
+DATA_SEEDS = "seeds"
+
+# hass.data[DOMAIN] key for the observations coordinator shared by all entries
+DATA_OBSERVATIONS = "observations"
+
+# hass.data[DOMAIN] key for the warnings coordinator shared by all entries
+DATA_WARNINGS = "warnings"
+
+# hass.data[DOMAIN] key for the products coordinator shared by all entries
+DATA_PRODUCTS = "products"
+
+# hass.data[DOMAIN] key for the grid point forecasts shared by interpolation
+DATA_POINT_CACHE = "point_cache"
+
+# hass.data[DOMAIN] key for the latest forecast snapshot of every entry,
+# read through api.py
+DATA_SNAPSHOTS = "snapshots"
+
+# Dispatcher signal sent with the new snapshot after each forecast generation
+SIGNAL_NEW_GENERATION = f"{DOMAIN}_new_generation"
+
+# Dispatcher signal sent when an entry's forecast verification is updated
+SIGNAL_VERIFICATION = f"{DOMAIN}_verification_{{}}"
+
+# A forecast in the shared cache newer than this is used instead of fetching
+SHARED_CACHE_MAX_AGE = timedelta(minutes=50)
+
+# A validated payload older than this is not used to seed the coordinator
+SEED_MAX_AGE = timedelta(minutes=10)
+
+# Options
+CONF_IMPORT_STATISTICS = "import_statistics"
+CONF_FORECAST_ATTRIBUTE = "forecast_attribute"
+CONF_FORECAST_EVENTS = "forecast_events"
+CONF_PRECIPITATION_THRESHOLD = "precipitation_threshold"
+CONF_FROST_THRESHOLD = "frost_threshold"
+CONF_GUST_THRESHOLD = "gust_threshold"
+CONF_OBSERVATIONS = "observations"
+CONF_WARNINGS = "warnings"
+CONF_NOWCAST = "nowcast"
+CONF_INTERPOLATION = "interpolation"
+CONF_ARCHIVE = "archive"
+CONF_DEGREE_DAYS = "degree_days"
+CONF_HEATING_BASE = "heating_base"
+CONF_COOLING_BASE = "cooling_base"
+CONF_WIND_CHILL = "wind_chill"
+CONF_PRODUCTS = "products"
+CONF_SHARED_CACHE = "shared_cache"
+CONF_FROST_RISK = "frost_risk"
+
+# Values of the interpolation option besides the interpolation methods
+INTERPOLATION_OFF = "off"
+
+# Forecast types the weather entity pushes to subscribers
+FORECAST_TYPES = ("daily", "hourly")
@@ -0,0 +1,41 @@
+"""Home Assistant independent core of the SMHI ODP integration.
+
+Fetching, schema detection, the forecast model and its daily and hourly
+aggregation live here without any Home Assistant imports, so the same
+engine runs in the integration, in batch scripts and in fast unit tests.
+The integration's platforms are thin wrappers around it.
+
+Submodules are imported on first use: importing the package itself does
+not pull in httpx, and NumPy is only imported by the array helpers.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "SmhiClient": "client",
+    "async_fetch_payload": "client",
+    "UnknownSchemaError": "adapters",
+    "detect_adapter": "adapters",
+    "SmhiForecast": "model",
+    "SmhiView": "model",
+    "build_forecast": "model",
+    "build_view": "model",
+    "DiskCache": "cache",
+    "PRODUCTS": "products",
+    "Product": "products",
+    "register_product": "products",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining a public name on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,218 @@
+"""Schema adapters for the SMHI point forecast endpoints.
+
+SMHI has published point forecasts in two formats:
+
+* snow1g: each time series entry is ``{"time": ..., "data": {name: value}}``
+  with CF-style parameter names (``air_temperature``, ``symbol_code``, ...).
+* pmp3g (legacy): each entry is ``{"validTime": ..., "parameters": [...]}``
+  with short names (``t``, ``Wsymb2``, ...) and one-element value arrays.
+
+An adapter detects its format once per payload and compiles an extractor
+that turns the time series into parsed times, snow1g-named data dicts and
+symbol codes without probing keys for every entry.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import datetime
+
+# Keys that have carried the weather symbol, in order of preference
+SYMBOL_KEYS = ("symbol_code", "weather_symbol", "Wsymb2")
+
+# Approximate extent of the SMHI point forecast grid (degrees); points
+# outside it are rejected without asking the API
+COVERAGE_LATITUDE = (52.5, 72.0)
+COVERAGE_LONGITUDE = (-8.0, 38.0)
+
+# pmp3g parameter name -> snow1g parameter name
+PMP3G_PARAMETERS = {
+    "t": "air_temperature",
+    "r": "relative_humidity",
+    "ws": "wind_speed",
+    "wd": "wind_from_direction",
+    "gust": "wind_speed_of_gust",
+    "msl": "air_pressure_at_mean_sea_level",
+    "vis": "visibility_in_air",
+    "tcc_mean": "cloud_area_fraction",
+    "tstm": "thunderstorm_probability",
+    "pmean": "precipitation_amount_mean",
+    "pmin": "precipitation_amount_min",
+    "pmedian": "precipitation_amount_median",
+    "pmax": "precipitation_amount_max",
+    "spp": "precipitation_frozen_part",
+    "Wsymb2": "symbol_code",
+}
+
+# snow1g parameter name -> factor converting its pmp3g unit to snow1g's;
+# pmp3g gives the frozen part of precipitation in percent, snow1g as a
+# fraction. Negative fill values are kept as they are.
+PMP3G_SCALES = {"precipitation_frozen_part": 0.01}
+
+# (times, rows, symbols) extracted from a payload
+Extracted = tuple[list[datetime], list[dict], list[int | None]]
+
+
+class UnknownSchemaError(ValueError):
+    """Raised when no adapter recognizes a forecast payload."""
+
+
+def parse_time(time_str: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp from the API."""
+    if not time_str:
+        return None
+    try:
+        return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _to_symbol(value) -> int | None:
+    """Convert a raw symbol value to an int code."""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class SchemaAdapter(ABC):
+    """Base class for a point forecast format."""
+
+    name: str
+    api_url: str
+
+    @abstractmethod
+    def matches(self, payload: dict) -> bool:
+        """Return True if the payload is in this adapter's format."""
+
+    @abstractmethod
+    def compile(self, payload: dict) -> Callable[[list], Extracted]:
+        """Return an extractor specialised for this payload."""
+
+    def extract(self, payload: dict) -> Extracted:
+        """Extract times, data rows and symbol codes from a payload."""
+        return self.compile(payload)(payload["timeSeries"])
+
+
+def _first_entry(payload: dict) -> dict | None:
+    """Return the first time series entry of a payload, if any."""
+    time_series = payload.get("timeSeries") if isinstance(payload, dict) else None
+    if not time_series or not isinstance(time_series, list):
+        return None
+    return time_series[0] if isinstance(time_series[0], dict) else None
+
+
+class Snow1gAdapter(SchemaAdapter):
+    """The current snow1g format with flat data dicts."""
+
+    name = "snow1g"
+    api_url = (
+        "https://opendata-download-metfcst.smhi.se/api/category/snow1g/version/1"
+        "/geotype/point/lon/{lon:.6f}/lat/{lat:.6f}/data.json"
+    )
+
+    def matches(self, payload: dict) -> bool:
+        """Return True if entries carry a flat `data` dict."""
+        entry = _first_entry(payload)
+        return entry is not None and isinstance(entry.get("data"), dict)
+
+    def compile(self, payload: dict) -> Callable[[list], Extracted]:
+        """Resolve the time and symbol keys once from the first entry."""
+        entry = _first_entry(payload)
+        time_key = "time" if "time" in entry else "validTime"
+        symbol_key = next((k for k in SYMBOL_KEYS if k in entry["data"]), None)
+
+        def extract(time_series: list) -> Extracted:
+            times, rows, symbols = [], [], []
+            for item in time_series:
+                entry_time = parse_time(item.get(time_key))
+                data = item.get("data")
+                if entry_time is None or not data:
+                    continue
+                times.append(entry_time)
+                rows.append(data)
+                symbols.append(_to_symbol(data.get(symbol_key)) if symbol_key else None)
+            return times, rows, symbols
+
+        return extract
+
+
+class Pmp3gAdapter(SchemaAdapter):
+    """The legacy pmp3g format with per-entry parameter arrays."""
+
+    name = "pmp3g"
+    api_url = (
+        "https://opendata-download-metfcst.smhi.se/api/category/pmp3g/version/2"
+        "/geotype/point/lon/{lon:.6f}/lat/{lat:.6f}/data.json"
+    )
+
+    def matches(self, payload: dict) -> bool:
+        """Return True if entries carry a `parameters` list."""
+        entry = _first_entry(payload)
+        return entry is not None and isinstance(entry.get("parameters"), list)
+
+    def compile(self, payload: dict) -> Callable[[list], Extracted]:
+        """Return an extractor renaming pmp3g parameters to snow1g names."""
+        names = PMP3G_PARAMETERS
+
+        def extract(time_series: list) -> Extracted:
+            times, rows, symbols = [], [], []
+            for item in time_series:
+                entry_time = parse_time(item.get("validTime"))
+                if entry_time is None:
+                    continue
+                data = {
+                    names.get(parameter["name"], parameter["name"]): (
+                        parameter["values"][0] if parameter.get("values") else None
+                    )
+                    for parameter in item.get("parameters", ())
+                }
+                if not data:
+                    continue
+                for key, factor in PMP3G_SCALES.items():
+                    value = data.get(key)
+                    if value is not None and value >= 0:
+                        data[key] = value * factor
+                times.append(entry_time)
+                rows.append(data)
+                symbols.append(_to_symbol(data.get("symbol_code")))
+            return times, rows, symbols
+
+        return extract
+
+
+# Adapters in order of preference; later ones are fallbacks
+ADAPTERS: tuple[SchemaAdapter, ...] = (Snow1gAdapter(), Pmp3gAdapter())
+
+
+def detect_adapter(payload: dict | None) -> SchemaAdapter | None:
+    """Return the adapter for a payload's format, if any matches."""
+    if not payload:
+        return None
+    return next((a for a in ADAPTERS if a.matches(payload)), None)
+
+
+def grid_point(payload, lat, lon):
+    """Return the (lat, lon) of the SMHI grid point that served a forecast.
+
+    SMHI snaps requested coordinates to the nearest grid cell and reports that
+    cell in the response geometry. snow1g uses a flat [lon, lat] pair while
+    older endpoints nest it as [[lon, lat]]. Falls back to the requested
+    coordinates if the payload carries no usable geometry.
+    """
+    try:
+        coordinates = payload["geometry"]["coordinates"]
+        if isinstance(coordinates[0], (list, tuple)):
+            coordinates = coordinates[0]
+        return round(float(coordinates[1]), 6), round(float(coordinates[0]), 6)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return round(lat, 6), round(lon, 6)
+
+
+def in_coverage(lat: float, lon: float) -> bool:
+    """Return True if a location lies within the SMHI forecast grid."""
+    return (
+        COVERAGE_LATITUDE[0] <= lat <= COVERAGE_LATITUDE[1]
+        and COVERAGE_LONGITUDE[0] <= lon <= COVERAGE_LONGITUDE[1]
+    )
@@ -0,0 +1,214 @@
+"""On-disk archive of forecast runs and their verification.
+
+Every model run of a location is appended to a memory-mapped file of
+fixed-size binary records (issue time, valid time and one float32 per
+archived parameter). The file is a ring buffer: once it is full the oldest
+records are overwritten, so its size never grows past `capacity` records,
+and records older than `max_age` are ignored when reading.
+
+Verification compares what each run predicted `lead` hours ahead with the
+shortest-lead value archived for the same valid time, which stands in for
+the analysed weather, and reports bias and mean absolute error per
+parameter and lead time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+import math
+import mmap
+from pathlib import Path
+import struct
+
+from .model import SmhiForecast
+
+# Parameters archived per time step, in record order
+ARCHIVE_PARAMETERS = (
+    "air_temperature",
+    "wind_speed",
+    "wind_speed_of_gust",
+    "relative_humidity",
+    "air_pressure_at_mean_sea_level",
+    "precipitation_amount_mean",
+)
+
+# Lead times (hours) verified
+VERIFICATION_LEADS = (24, 48, 72)
+
+# Steps further ahead than this are not archived
+MAX_LEAD = timedelta(hours=max(VERIFICATION_LEADS))
+
+# Values forecast at most this far ahead count as the analysed weather
+TRUTH_MAX_LEAD = timedelta(hours=3)
+
+# Default ring size: about a month of hourly runs of 73 hourly steps
+DEFAULT_CAPACITY = 65536
+DEFAULT_MAX_AGE = timedelta(days=30)
+
+_MAGIC = b"SMHIARC1"
+# magic, parameter count, capacity, next slot, records written, last issue
+_HEADER = struct.Struct("<8sIIIIq")
+_HEADER_SIZE = 64
+
+
+def _record_struct(parameters: int) -> struct.Struct:
+    """Return the layout of one record."""
+    return struct.Struct(f"<qq{parameters}f")
+
+
+class ForecastArchive:
+    """A memory-mapped ring buffer of archived forecast steps.
+
+    All methods do blocking file I/O; call them from an executor.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        capacity: int = DEFAULT_CAPACITY,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+        parameters: tuple[str, ...] = ARCHIVE_PARAMETERS,
+    ) -> None:
+        """Open the archive, creating or resetting it if its layout differs."""
+        self.path = path
+        self.capacity = capacity
+        self.max_age = max_age
+        self.parameters = parameters
+        self._record = _record_struct(len(parameters))
+        size = _HEADER_SIZE + capacity * self._record.size
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fresh = not path.exists() or path.stat().st_size != size
+        self._file = open(path, "w+b" if fresh else "r+b")
+        if fresh:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        magic, count, stored_capacity, *_ = _HEADER.unpack_from(self._map)
+        if fresh or magic != _MAGIC or (count, stored_capacity) != (
+            len(parameters),
+            capacity,
+        ):
+            self._write_header(0, 0, 0)
+
+    def _write_header(self, head: int, written: int, last_issue: int) -> None:
+        """Store the ring position and the last archived run."""
+        _HEADER.pack_into(
+            self._map,
+            0,
+            _MAGIC,
+            len(self.parameters),
+            self.capacity,
+            head,
+            written,
+            last_issue,
+        )
+
+    def _state(self) -> tuple[int, int, int]:
+        """Return the next slot, the records written and the last issue time."""
+        _, _, _, head, written, last_issue = _HEADER.unpack_from(self._map)
+        return head, written, last_issue
+
+    def __len__(self) -> int:
+        """Return the number of records held."""
+        return min(self._state()[1], self.capacity)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+    def append_run(self, forecast: SmhiForecast) -> int:
+        """Archive the steps of a run up to MAX_LEAD. Returns the steps written.
+
+        A run whose reference time is not newer than the last archived one
+        is skipped.
+        """
+        issued = forecast.reference_time
+        if issued is None:
+            return 0
+        issue_time = int(issued.timestamp())
+        head, written, last_issue = self._state()
+        if issue_time <= last_issue:
+            return 0
+
+        columns = [forecast.column(name) for name in self.parameters]
+        horizon = issued + MAX_LEAD
+        steps = 0
+        for i, valid in enumerate(forecast.times):
+            if valid > horizon:
+                break
+            values = [
+                math.nan if column[i] is None else float(column[i])
+                for column in columns
+            ]
+            self._record.pack_into(
+                self._map,
+                _HEADER_SIZE + head * self._record.size,
+                issue_time,
+                int(valid.timestamp()),
+                *values,
+            )
+            head = (head + 1) % self.capacity
+            steps += 1
+        self._write_header(head, min(written + steps, 2**32 - 1), issue_time)
+        self._map.flush()
+        return steps
+
+    def records(self, now: datetime | None = None) -> Iterator[tuple]:
+        """Yield (issue, valid, *values) records newer than max_age."""
+        now = now or datetime.now(timezone.utc)
+        oldest = int((now - self.max_age).timestamp())
+        end = _HEADER_SIZE + len(self) * self._record.size
+        for record in self._record.iter_unpack(self._map[_HEADER_SIZE:end]):
+            if record[1] >= oldest:
+                yield record
+
+
+def verify(
+    records: Iterable[tuple],
+    parameters: tuple[str, ...] = ARCHIVE_PARAMETERS,
+    leads: tuple[int, ...] = VERIFICATION_LEADS,
+) -> dict[int, dict[str, dict]]:
+    """Compute bias and MAE per lead time and parameter.
+
+    Returns lead -> parameter -> {"bias", "mae", "samples"}. The records
+    are read once; forecasts within half an hour of a lead time count.
+    """
+    truth_limit = TRUTH_MAX_LEAD.total_seconds()
+    truth: dict[int, tuple[int, tuple]] = {}
+    candidates: dict[int, list[tuple]] = {lead: [] for lead in leads}
+    for issue, valid, *values in records:
+        lead_seconds = valid - issue
+        if 0 <= lead_seconds <= truth_limit:
+            known = truth.get(valid)
+            if known is None or lead_seconds < known[0]:
+                truth[valid] = (lead_seconds, values)
+        lead = round(lead_seconds / 3600)
+        if lead in candidates and abs(lead_seconds - lead * 3600) <= 1800:
+            candidates[lead].append((valid, values))
+
+    results = {}
+    for lead, forecasts in candidates.items():
+        sums = [[0.0, 0.0, 0] for _ in parameters]
+        for valid, values in forecasts:
+            observed = truth.get(valid)
+            if observed is None:
+                continue
+            for total, predicted, actual in zip(sums, values, observed[1]):
+                if math.isnan(predicted) or math.isnan(actual):
+                    continue
+                error = predicted - actual
+                total[0] += error
+                total[1] += abs(error)
+                total[2] += 1
+        results[lead] = {
+            name: {
+                "bias": round(bias / n, 2) if n else None,
+                "mae": round(mae / n, 2) if n else None,
+                "samples": n,
+            }
+            for name, (bias, mae, n) in zip(parameters, sums)
+        }
+    return results
@@ -0,0 +1,366 @@
+"""Fetch and aggregate point forecasts for many locations from the command line.
+
+    cd custom_components/smhi_odp
+    python -m core.batch locations.csv --output daily.ndjson
+    python -m core.batch locations.csv --hourly --format csv --output hourly.csv
+
+The locations file is a CSV with `lat`/`latitude` and `lon`/`longitude`
+columns and an optional `id`/`name` column, or plain `lat,lon` lines.
+Forecasts are fetched by a fixed pool of workers with a shared rate limit
+and an optional disk cache, and each location's rows are written as soon
+as it is done, so memory use does not grow with the number of locations.
+Parquet output needs pyarrow, which is only imported for that format.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterator
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import json
+import logging
+from pathlib import Path
+import sys
+import time
+from zoneinfo import ZoneInfo
+
+from .cache import DiskCache
+from .client import SmhiClient
+from .model import build_forecast, build_view
+
+_LOGGER = logging.getLogger(__name__)
+
+# Columns of the daily and hourly output, after the location columns
+LOCATION_FIELDS = ("location", "latitude", "longitude")
+DAILY_FIELDS = (
+    "datetime",
+    "native_temperature",
+    "native_templow",
+    "condition",
+    "native_precipitation",
+    "precipitation_min",
+    "precipitation_median",
+    "precipitation_max",
+    "precipitation_probability",
+    "wind_bearing",
+    "native_wind_speed",
+    "snowfall",
+    "snowfall_water_equivalent",
+)
+HOURLY_FIELDS = (
+    "datetime",
+    "native_temperature",
+    "condition",
+    "native_precipitation",
+    "precipitation_probability",
+    "humidity",
+    "native_pressure",
+    "wind_bearing",
+    "native_wind_speed",
+    "native_wind_gust_speed",
+)
+
+# Columns that are not numeric
+TEXT_FIELDS = ("location", "datetime", "condition")
+
+# Rows buffered per Parquet row group
+PARQUET_BATCH_ROWS = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class Location:
+    """One location of the input file."""
+
+    key: str
+    latitude: float
+    longitude: float
+
+
+def read_locations(path: Path) -> Iterator[Location]:
+    """Yield the locations of a CSV file, with or without a header."""
+    with path.open(newline="", encoding="utf-8") as file:
+        rows = csv.reader(line for line in file if line.strip())
+        first = next(rows, None)
+        if first is None:
+            return
+        header = [column.strip().lower() for column in first]
+        lat_col = _column(header, "lat", "latitude")
+        lon_col = _column(header, "lon", "longitude")
+        key_col = _column(header, "id", "name")
+        if lat_col is None or lon_col is None:
+            # No header: plain "lat,lon" lines
+            lat_col, lon_col, key_col = 0, 1, None
+            rows = _chain(first, rows)
+        for number, row in enumerate(rows, start=1):
+            try:
+                lat, lon = float(row[lat_col]), float(row[lon_col])
+            except (IndexError, ValueError):
+                _LOGGER.warning("Skipping invalid location on row %d: %s", number, row)
+                continue
+            key = row[key_col] if key_col is not None else f"{lat},{lon}"
+            yield Location(key, lat, lon)
+
+
+def _column(header: list[str], *names: str) -> int | None:
+    """Return the index of the first of some column names in a header."""
+    return next((header.index(name) for name in names if name in header), None)
+
+
+def _chain(first: list, rows: Iterator[list]) -> Iterator[list]:
+    """Yield a row that was already read, then the rest."""
+    yield first
+    yield from rows
+
+
+class RateLimiter:
+    """Space out requests to at most `rate` per second across all workers."""
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the limiter; a rate of 0 disables it."""
+        self._interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until the next request may be sent."""
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class NdjsonWriter:
+    """Write rows as one JSON object per line."""
+
+    def __init__(self, file, fields: tuple[str, ...]) -> None:
+        """Write to an open text file."""
+        self._file = file
+
+    def write(self, rows: list[dict]) -> None:
+        """Write some rows."""
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """Flush the output."""
+        self._file.flush()
+
+
+class CsvWriter:
+    """Write rows as CSV with a header."""
+
+    def __init__(self, file, fields: tuple[str, ...]) -> None:
+        """Write the header to an open text file."""
+        self._file = file
+        self._writer = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        """Write some rows."""
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        """Flush the output."""
+        self._file.flush()
+
+
+class ParquetWriter:
+    """Write rows to a Parquet file in row groups."""
+
+    def __init__(self, path: Path, fields: tuple[str, ...]) -> None:
+        """Open the Parquet file; needs pyarrow."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as err:
+            raise SystemExit("Parquet output requires pyarrow") from err
+        self._pa = pa
+        self._fields = fields
+        self._schema = pa.schema(
+            [
+                (name, pa.string() if name in TEXT_FIELDS else pa.float64())
+                for name in fields
+            ]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._pending: list[dict] = []
+
+    def write(self, rows: list[dict]) -> None:
+        """Buffer rows and write a row group when enough are pending."""
+        self._pending.extend(rows)
+        if len(self._pending) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the pending rows as one row group."""
+        if not self._pending:
+            return
+        columns = {
+            name: [row.get(name) for row in self._pending] for name in self._fields
+        }
+        self._writer.write_table(
+            self._pa.Table.from_pydict(columns, schema=self._schema)
+        )
+        self._pending = []
+
+    def close(self) -> None:
+        """Write the remaining rows and close the file."""
+        self._flush()
+        self._writer.close()
+
+
+WRITERS = {"ndjson": NdjsonWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+
+def location_rows(
+    location: Location, payload: dict, tz, now: datetime, hourly: bool
+) -> list[dict]:
+    """Aggregate one location's forecast into output rows."""
+    view = build_view(build_forecast(payload, tz), now)
+    items = view.hourly_forecast if hourly else view.daily_forecast
+    prefix = {
+        "location": location.key,
+        "latitude": location.latitude,
+        "longitude": location.longitude,
+    }
+    return [{**prefix, **item} for item in items]
+
+
+async def run_batch(
+    locations: Iterator[Location],
+    writer,
+    *,
+    client: SmhiClient,
+    tz,
+    hourly: bool = False,
+    concurrency: int = 8,
+    rate: float = 10.0,
+    cache: DiskCache | None = None,
+) -> tuple[int, int]:
+    """Fetch, aggregate and write every location. Returns (done, failed)."""
+    limiter = RateLimiter(rate)
+    now = datetime.now(timezone.utc)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    counts = {"done": 0, "failed": 0}
+
+    async def worker() -> None:
+        while (location := await queue.get()) is not None:
+            try:
+                lat, lon = location.latitude, location.longitude
+                payload = cache.get((lat, lon)) if cache else None
+                if payload is None:
+                    await limiter.wait()
+                    payload = await client.forecast(lat, lon)
+                    if cache:
+                        cache.put((lat, lon), payload)
+                writer.write(location_rows(location, payload, tz, now, hourly))
+                counts["done"] += 1
+            except Exception as err:
+                # One bad location must not stop the batch
+                _LOGGER.warning("Failed %s: %s", location.key, err)
+                counts["failed"] += 1
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    for location in locations:
+        await queue.put(location)
+    for _ in workers:
+        await queue.put(None)
+    await asyncio.gather(*workers)
+    return counts["done"], counts["failed"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the batch command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m core.batch", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("locations", type=Path, help="CSV file of locations")
+    parser.add_argument(
+        "-o", "--output", type=Path, help="output file (default: stdout)"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=WRITERS,
+        help="output format (default: from the output suffix, else ndjson)",
+    )
+    parser.add_argument(
+        "--hourly", action="store_true", help="write hourly instead of daily rows"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="parallel requests (default: 8)"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=10.0,
+        help="max requests per second, 0 for no limit (default: 10)",
+    )
+    parser.add_argument(
+        "--cache", type=Path, help="directory to cache forecast payloads in"
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=60.0,
+        help="minutes a cached payload is reused (default: 60)",
+    )
+    parser.add_argument(
+        "--tz", default="Europe/Stockholm", help="time zone of the daily aggregates"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    suffix = args.output.suffix.lstrip(".").lower() if args.output else ""
+    fmt = args.format or (suffix if suffix in WRITERS else "ndjson")
+    if fmt == "parquet" and args.output is None:
+        parser.error("parquet output needs --output")
+    fields = LOCATION_FIELDS + (HOURLY_FIELDS if args.hourly else DAILY_FIELDS)
+    cache = (
+        DiskCache(args.cache, timedelta(minutes=args.cache_max_age))
+        if args.cache
+        else None
+    )
+
+    async def run(writer) -> tuple[int, int]:
+        async with SmhiClient() as client:
+            return await run_batch(
+                read_locations(args.locations),
+                writer,
+                client=client,
+                tz=ZoneInfo(args.tz),
+                hourly=args.hourly,
+                concurrency=max(1, args.concurrency),
+                rate=args.rate,
+                cache=cache,
+            )
+
+    if fmt == "parquet":
+        writer = ParquetWriter(args.output, fields)
+        try:
+            done, failed = asyncio.run(run(writer))
+        finally:
+            writer.close()
+    else:
+        with (
+            args.output.open("w", newline="", encoding="utf-8")
+            if args.output
+            else open(sys.stdout.fileno(), "w", newline="", closefd=False)
+        ) as file:
+            writer = WRITERS[fmt](file, fields)
+            done, failed = asyncio.run(run(writer))
+            writer.close()
+
+    _LOGGER.info("%d locations written, %d failed", done, failed)
+    return 1 if failed and not done else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
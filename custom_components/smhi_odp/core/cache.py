@@ -0,0 +1,125 @@
+"""Disk cache of downloaded SMHI payloads.
+
+Payloads are stored as JSON files named by a hash of their key, so the
+batch command line and the integration can reuse a download across runs,
+restarts and, on shared storage, across Home Assistant instances. Files
+are written to a temporary name and renamed into place, so a reader never
+sees a partial file. A per-key lock file lets one process fetch while the
+others wait for its result instead of fetching too. All methods do
+blocking file I/O.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; locking is skipped there
+    fcntl = None
+
+# Seconds to wait for another process holding a key's lock
+LOCK_TIMEOUT = 30.0
+LOCK_POLL_INTERVAL = 0.1
+
+
+def cache_key(key: tuple) -> str:
+    """Return the name of a key; coordinates are rounded consistently."""
+    return ",".join(
+        f"{part:.6f}" if isinstance(part, float) else str(part) for part in key
+    )
+
+
+class CacheLock:
+    """An exclusive lock on one cache key, held until released."""
+
+    def __init__(self, file) -> None:
+        """Hold the lock of an open lock file."""
+        self._file = file
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self._file is None:
+            return
+        try:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> CacheLock:
+        """Enter a context that releases the lock on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Release the lock."""
+        self.release()
+
+
+class DiskCache:
+    """Payloads stored as JSON files, keyed by product and location."""
+
+    def __init__(self, directory: Path, max_age: timedelta) -> None:
+        """Use a cache directory, creating it if needed."""
+        self.directory = directory
+        self.max_age = max_age
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: tuple, suffix: str = ".json") -> Path:
+        """Return the file of a key."""
+        name = hashlib.sha1(cache_key(key).encode()).hexdigest()
+        return self.directory / f"{name}{suffix}"
+
+    def lock(self, key: tuple, timeout: float = LOCK_TIMEOUT) -> CacheLock | None:
+        """Take the exclusive lock of a key, waiting up to `timeout` seconds.
+
+        Returns None if locking is not supported or the lock is still held
+        by someone else after the timeout; the caller then goes ahead
+        without it.
+        """
+        if fcntl is None:
+            return None
+        file = open(self._path(key, ".lock"), "a+b")
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return CacheLock(file)
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    file.close()
+                    return None
+                time.sleep(LOCK_POLL_INTERVAL)
+
+    def get(self, key: tuple, max_age: timedelta | None = None):
+        """Return a cached payload that is fresh enough, or None.
+
+        `max_age` overrides the cache's default for this lookup.
+        """
+        max_age = max_age if max_age is not None else self.max_age
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > max_age.total_seconds():
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: tuple, payload) -> None:
+        """Store a payload, replacing the previous one atomically."""
+        path = self._path(key)
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(payload, file)
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
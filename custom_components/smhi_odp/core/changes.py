@@ -0,0 +1,153 @@
+"""Detect meaningful changes between two forecast generations.
+
+The previous and the new forecast are aligned on the timestamps they share
+and compared column by column, producing typed change records that the
+coordinator fires as `smhi_odp_forecast_changed` events.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from .model import SmhiForecast
+
+EVENT_FORECAST_CHANGED = "smhi_odp_forecast_changed"
+
+# Change types carried in the event's `type` field
+CHANGE_PRECIPITATION_ONSET = "precipitation_onset"
+CHANGE_FROST = "frost"
+CHANGE_WIND_GUST = "wind_gust"
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeThresholds:
+    """Thresholds that make a forecast change worth an event."""
+
+    # Intensity (mm/h) counted as precipitation
+    precipitation: float = 0.1
+    # Onset moves of at least this many hours are reported
+    onset_shift_hours: float = 1.0
+    # Temperature (°C) at or below which a day counts as a frost day
+    frost: float = 0.0
+    # Gust speed (m/s) at or above which a time step counts as windy
+    wind_gust: float = 15.0
+
+
+def _aligned(previous: SmhiForecast, current: SmhiForecast) -> tuple[list[int], list[int]]:
+    """Return index pairs of the time steps present in both forecasts."""
+    previous_index = {t: i for i, t in enumerate(previous.times)}
+    pairs = [
+        (previous_index[t], i)
+        for i, t in enumerate(current.times)
+        if t in previous_index
+    ]
+    return [p for p, _ in pairs], [c for _, c in pairs]
+
+
+def _take(values: list, indexes: list[int]) -> list:
+    """Return the values at the given indexes."""
+    return [values[i] for i in indexes]
+
+
+def _first_time(times: list[datetime], flags: list[bool]) -> datetime | None:
+    """Return the first time whose flag is set."""
+    return next((t for t, flag in zip(times, flags) if flag), None)
+
+
+def _iso(value: datetime | None) -> str | None:
+    """Format an optional timestamp for event data."""
+    return value.isoformat() if value is not None else None
+
+
+def diff_forecasts(
+    previous: SmhiForecast | None,
+    current: SmhiForecast | None,
+    thresholds: ChangeThresholds,
+) -> list[dict]:
+    """Compare two forecast generations and return the changes found."""
+    if previous is None or current is None:
+        return []
+    prev_idx, cur_idx = _aligned(previous, current)
+    if not cur_idx:
+        return []
+    times = _take(current.times, cur_idx)
+    changes = []
+
+    # Precipitation onset: first aligned step at or above the threshold
+    prev_rain = [
+        v is not None and v >= thresholds.precipitation
+        for v in _take(previous.column("precipitation_amount_mean"), prev_idx)
+    ]
+    cur_rain = [
+        v is not None and v >= thresholds.precipitation
+        for v in _take(current.column("precipitation_amount_mean"), cur_idx)
+    ]
+    prev_onset = _first_time(times, prev_rain)
+    cur_onset = _first_time(times, cur_rain)
+    if prev_onset != cur_onset and (
+        prev_onset is None
+        or cur_onset is None
+        or abs((cur_onset - prev_onset).total_seconds()) / 3600
+        >= thresholds.onset_shift_hours
+    ):
+        changes.append(
+            {
+                "type": CHANGE_PRECIPITATION_ONSET,
+                "previous": _iso(prev_onset),
+                "current": _iso(cur_onset),
+            }
+        )
+
+    # Frost: local days whose minimum crosses the threshold
+    dates = [t.astimezone(current.tz).date() for t in times]
+    prev_min: dict = {}
+    cur_min: dict = {}
+    for day, prev_t, cur_t in zip(
+        dates,
+        _take(previous.column("air_temperature"), prev_idx),
+        _take(current.column("air_temperature"), cur_idx),
+    ):
+        if prev_t is not None:
+            prev_min[day] = min(prev_min.get(day, prev_t), prev_t)
+        if cur_t is not None:
+            cur_min[day] = min(cur_min.get(day, cur_t), cur_t)
+    for day in sorted(prev_min.keys() & cur_min.keys()):
+        was_frost = prev_min[day] <= thresholds.frost
+        is_frost = cur_min[day] <= thresholds.frost
+        if was_frost != is_frost:
+            changes.append(
+                {
+                    "type": CHANGE_FROST,
+                    "date": day.isoformat(),
+                    "expected": is_frost,
+                    "previous_min_temperature": prev_min[day],
+                    "min_temperature": cur_min[day],
+                }
+            )
+
+    # Wind gusts: steps that newly reach or drop below the threshold
+    prev_gusts = _take(previous.column("wind_speed_of_gust"), prev_idx)
+    cur_gusts = _take(current.column("wind_speed_of_gust"), cur_idx)
+    prev_windy = [v is not None and v >= thresholds.wind_gust for v in prev_gusts]
+    cur_windy = [v is not None and v >= thresholds.wind_gust for v in cur_gusts]
+    appeared = [c and not p for p, c in zip(prev_windy, cur_windy)]
+    cleared = [p and not c for p, c in zip(prev_windy, cur_windy)]
+    for expected, flags, gusts in (
+        (True, appeared, cur_gusts),
+        (False, cleared, prev_gusts),
+    ):
+        start = _first_time(times, flags)
+        if start is None:
+            continue
+        changes.append(
+            {
+                "type": CHANGE_WIND_GUST,
+                "expected": expected,
+                "start": _iso(start),
+                # Strongest gust of the forecast that exceeds the threshold
+                "max_gust": max(g for g, flag in zip(gusts, flags) if flag),
+            }
+        )
+
+    return changes
@@ -0,0 +1,135 @@
+"""Async client for the SMHI open data endpoints.
+
+Wraps an httpx-style async client; pass Home Assistant's shared client in
+the integration, or let the client create and close its own in scripts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import logging
+
+import httpx
+
+from .adapters import ADAPTERS, UnknownSchemaError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for an SMHI response when the client creates its own
+DEFAULT_TIMEOUT = 30.0
+
+# Forecast requests in flight at once when fetching many locations
+DEFAULT_CONCURRENCY = 4
+
+
+class SmhiClient:
+    """Fetch SMHI forecasts, observations and warnings."""
+
+    def __init__(self, client=None, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Use the given async client, or create one on first use."""
+        self._client = client
+        self._owns_client = client is None
+        self._timeout = timeout
+
+    @property
+    def client(self):
+        """Return the underlying async client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying client if this instance created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> SmhiClient:
+        """Enter an async context that closes the client on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the client."""
+        await self.aclose()
+
+    async def get_json(self, url: str):
+        """Download and decode one JSON document."""
+        response = await self.client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_json_if_modified(
+        self, url: str, validators: dict[str, str]
+    ) -> tuple[object | None, dict[str, str]]:
+        """Download a JSON document unless it is unchanged since the last time.
+
+        `validators` holds the ETag and Last-Modified headers of the previous
+        response. Returns the payload, or None on a 304, and the validators
+        to send next time.
+        """
+        headers = {}
+        if validators.get("ETag"):
+            headers["If-None-Match"] = validators["ETag"]
+        if validators.get("Last-Modified"):
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+        response = await self.client.get(url, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return None, validators
+        response.raise_for_status()
+        return response.json(), {
+            key: response.headers[key]
+            for key in ("ETag", "Last-Modified")
+            if response.headers.get(key)
+        }
+
+    async def forecast(self, lat: float, lon: float) -> dict:
+        """Fetch the point forecast payload of a location."""
+        return await async_fetch_payload(self.client, lat, lon)
+
+    async def forecasts(
+        self,
+        points: Iterable[tuple[float, float]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[dict | Exception]:
+        """Fetch the forecasts of many locations, a few at a time.
+
+        Returns one payload per point in order, or the error that point
+        failed with, so one bad location does not fail the others.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(lat: float, lon: float) -> dict | Exception:
+            async with semaphore:
+                try:
+                    return await self.forecast(lat, lon)
+                except (httpx.HTTPError, ValueError) as err:
+                    return err
+
+        return await asyncio.gather(*(fetch(lat, lon) for lat, lon in points))
+
+
+async def async_fetch_payload(client, lat: float, lon: float) -> dict:
+    """Fetch a point forecast, falling back to the next endpoint on failure.
+
+    `client` is an httpx-style async client. The error of the last endpoint
+    tried is raised if none of them returns a recognizable payload.
+    """
+    last_error: Exception = UnknownSchemaError("No forecast endpoint configured")
+    for adapter in ADAPTERS:
+        api_url = adapter.api_url.format(lat=lat, lon=lon)
+        try:
+            response = await client.get(api_url)
+            response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, ValueError) as err:
+            _LOGGER.debug("SMHI %s endpoint failed: %s", adapter.name, err)
+            last_error = err
+            continue
+        if adapter.matches(payload):
+            return payload
+        _LOGGER.debug("SMHI %s endpoint returned an unknown format", adapter.name)
+        last_error = UnknownSchemaError(
+            f"Unrecognized payload from the {adapter.name} endpoint"
+        )
+    raise last_error
@@ -0,0 +1,136 @@
+"""Heating and cooling degree-days from the temperature forecast.
+
+Every time step contributes (base - temperature) heating degree-hours, or
+(temperature - base) cooling degree-hours, over the hours of its step, so
+the hourly and the later 3-12 hour steps of the forecast are weighted by
+the time they cover. A local day's degree-hours divided by 24 are its
+degree-days. With the wind-chill adjustment, cold and windy steps count
+with their wind chill temperature, which follows the extra heat loss of
+exposed buildings.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from .model import SmhiForecast
+
+# Wind chill is only defined at or below this temperature (°C) and from
+# this wind speed (m/s, 4.8 km/h) upwards
+WIND_CHILL_MAX_TEMPERATURE = 10.0
+WIND_CHILL_MIN_WIND_SPEED = 4.8 / 3.6
+
+
+@dataclass(frozen=True, slots=True)
+class DegreeDaySettings:
+    """Base temperatures and adjustments of the degree-day calculation."""
+
+    # Heating base (°C); 17 °C is the Swedish convention
+    heating_base: float = 17.0
+    # Cooling base (°C)
+    cooling_base: float = 20.0
+    # Use the wind chill temperature where it applies
+    wind_chill: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class DegreeDay:
+    """Degree-days of one local day."""
+
+    date: date
+    heating: float
+    cooling: float
+    # Time-weighted mean of the temperatures used, in °C
+    mean_temperature: float | None
+    # Forecast hours covering the day; less than 24 on the first and last day
+    hours: float
+
+    def as_dict(self) -> dict:
+        """Return the day as service response data."""
+        return {
+            "date": self.date.isoformat(),
+            "heating_degree_days": self.heating,
+            "cooling_degree_days": self.cooling,
+            "mean_temperature": self.mean_temperature,
+            "hours": self.hours,
+        }
+
+
+def wind_chill(temperature: float, wind_speed: float) -> float:
+    """Return the wind chill temperature (°C) for a wind speed in m/s.
+
+    Uses the JAG/TI formula. Outside its range the air temperature is
+    returned unchanged.
+    """
+    if (
+        temperature > WIND_CHILL_MAX_TEMPERATURE
+        or wind_speed < WIND_CHILL_MIN_WIND_SPEED
+    ):
+        return temperature
+    factor = (wind_speed * 3.6) ** 0.16
+    return 13.12 + 0.6215 * temperature - 11.37 * factor + 0.3965 * temperature * factor
+
+
+def effective_temperatures(
+    forecast: SmhiForecast, settings: DegreeDaySettings
+) -> list[float | None]:
+    """Return the temperature counted for every time step."""
+    temperatures = forecast.column("air_temperature")
+    if not settings.wind_chill:
+        return temperatures
+    return [
+        wind_chill(temperature, wind)
+        if temperature is not None and wind is not None
+        else temperature
+        for temperature, wind in zip(temperatures, forecast.column("wind_speed"))
+    ]
+
+
+def degree_days(
+    forecast: SmhiForecast, settings: DegreeDaySettings = DegreeDaySettings()
+) -> list[DegreeDay]:
+    """Compute the degree-days of every local day of a forecast.
+
+    The per-step degree-hours are computed column-wise in one pass and
+    summed over the day ranges the forecast already indexed.
+    """
+    temperatures = effective_temperatures(forecast, settings)
+    hours = [
+        step if temperature is not None else 0.0
+        for temperature, step in zip(temperatures, forecast.step_hours)
+    ]
+    weighted = [
+        temperature * step if temperature is not None else 0.0
+        for temperature, step in zip(temperatures, hours)
+    ]
+    heating = [
+        max(settings.heating_base - temperature, 0.0) * step
+        if temperature is not None
+        else 0.0
+        for temperature, step in zip(temperatures, hours)
+    ]
+    cooling = [
+        max(temperature - settings.cooling_base, 0.0) * step
+        if temperature is not None
+        else 0.0
+        for temperature, step in zip(temperatures, hours)
+    ]
+
+    days = []
+    for day in forecast.days:
+        covered = sum(hours[day.start : day.end])
+        days.append(
+            DegreeDay(
+                date=day.date,
+                heating=round(sum(heating[day.start : day.end]) / 24, 2),
+                cooling=round(sum(cooling[day.start : day.end]) / 24, 2),
+                mean_temperature=(
+                    round(sum(weighted[day.start : day.end]) / covered, 1)
+                    if covered
+                    else None
+                ),
+                hours=covered,
+            )
+        )
+    return days
@@ -0,0 +1,149 @@
+"""Weather events derived from the forecast for the calendar.
+
+Each time step is flagged for frost, rain, snow and strong wind against
+the same thresholds as the change events, and runs of consecutive flagged
+steps become one event each. A step stands for the interval ending at its
+time, so an event runs from the start of its first step to the time of
+its last one. Events are detected once per forecast and kept sorted by
+start in an `EventIndex`, which answers range queries by binary search.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from .changes import ChangeThresholds
+from .model import SmhiForecast
+
+EVENT_FROST = "frost"
+EVENT_RAIN = "rain"
+EVENT_SNOW = "snow"
+EVENT_WIND = "wind"
+
+# Snowfall (mm water equivalent per hour) counted as a snow step
+SNOW_THRESHOLD = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherEvent:
+    """One run of forecast steps meeting an event's condition."""
+
+    kind: str
+    start: datetime
+    end: datetime
+    summary: str
+    # Lowest temperature, precipitation total or strongest gust of the run
+    peak: float
+
+    @property
+    def uid(self) -> str:
+        """Return an identifier that is stable while the event does not move."""
+        return f"{self.kind}-{self.start.isoformat()}"
+
+
+def _runs(flags: list[bool]) -> list[tuple[int, int]]:
+    """Return the (start, end) index ranges of consecutive set flags."""
+    runs = []
+    start = None
+    for i, flag in enumerate(flags):
+        if flag and start is None:
+            start = i
+        elif not flag and start is not None:
+            runs.append((start, i))
+            start = None
+    if start is not None:
+        runs.append((start, len(flags)))
+    return runs
+
+
+def detect_events(
+    forecast: SmhiForecast, thresholds: ChangeThresholds = ChangeThresholds()
+) -> list[WeatherEvent]:
+    """Find the frost, rain, snow and wind events of a forecast, by start."""
+    temperatures = forecast.column("air_temperature")
+    rates = forecast.column("precipitation_amount_mean")
+    gusts = forecast.column("wind_speed_of_gust")
+    amounts = forecast.amounts["precipitation"]
+    snowfall = forecast.snowfall
+    snow_steps = [
+        snow is not None and snow >= SNOW_THRESHOLD * step
+        for snow, step in zip(snowfall, forecast.step_hours)
+    ]
+
+    # kind -> (flag per step, peak of a run's values, its summary)
+    conditions: dict[str, tuple[list[bool], Callable, Callable]] = {
+        EVENT_FROST: (
+            [t is not None and t <= thresholds.frost for t in temperatures],
+            lambda start, end: min(temperatures[start:end]),
+            lambda peak: f"Frost (down to {peak:.1f} °C)",
+        ),
+        EVENT_RAIN: (
+            [
+                rate is not None and rate >= thresholds.precipitation and not snow
+                for rate, snow in zip(rates, snow_steps)
+            ],
+            lambda start, end: round(sum(a or 0.0 for a in amounts[start:end]), 1),
+            lambda peak: f"Rain ({peak:.1f} mm)",
+        ),
+        EVENT_SNOW: (
+            snow_steps,
+            lambda start, end: round(sum(s or 0.0 for s in snowfall[start:end]), 1),
+            lambda peak: f"Snow ({peak:.1f} mm water equivalent)",
+        ),
+        EVENT_WIND: (
+            [g is not None and g >= thresholds.wind_gust for g in gusts],
+            lambda start, end: max(gusts[start:end]),
+            lambda peak: f"Strong wind (gusts up to {peak:.0f} m/s)",
+        ),
+    }
+
+    events = []
+    for kind, (flags, peak_of, summary_of) in conditions.items():
+        for start, end in _runs(flags):
+            peak = peak_of(start, end)
+            events.append(
+                WeatherEvent(
+                    kind=kind,
+                    start=forecast.times[start]
+                    - timedelta(hours=forecast.step_hours[start]),
+                    end=forecast.times[end - 1],
+                    summary=summary_of(peak),
+                    peak=peak,
+                )
+            )
+    events.sort(key=lambda event: (event.start, event.kind))
+    return events
+
+
+class EventIndex:
+    """Weather events sorted by start, for range queries."""
+
+    def __init__(self, events: list[WeatherEvent] = ()) -> None:
+        """Index events that are already sorted by start."""
+        self.events = list(events)
+        self._starts = [event.start for event in self.events]
+        # Longest event, so a query knows how far back overlaps can start
+        self._max_span = max(
+            (event.end - event.start for event in self.events),
+            default=timedelta(0),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self.events)
+
+    def between(self, start: datetime, end: datetime) -> list[WeatherEvent]:
+        """Return the events overlapping [start, end), by start."""
+        first = bisect_left(self._starts, start - self._max_span)
+        last = bisect_left(self._starts, end)
+        return [event for event in self.events[first:last] if event.end > start]
+
+    def current_or_next(self, now: datetime) -> WeatherEvent | None:
+        """Return the earliest event that has not ended yet."""
+        first = bisect_left(self._starts, now - self._max_span)
+        return next(
+            (event for event in self.events[first:] if event.end > now), None
+        )
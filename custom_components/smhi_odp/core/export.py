@@ -0,0 +1,174 @@
+"""Forecast series as OpenMetrics text and InfluxDB line protocol.
+
+Both formats are rendered as UTF-8 bytes from the immutable
+`ForecastSnapshot` of a location, so one rendering stays valid for the
+whole forecast generation and can be cached by whoever serves it.
+
+OpenMetrics has no use for future timestamps, so every step is a sample
+labelled with its lead time in hours from the model run's reference time
+(or the first step when the run is unknown), and the reference time is a
+gauge of its own. OpenMetrics also requires all samples of a family to
+be adjacent, so a location is rendered family by family and the server
+interleaves the locations per family. Line protocol carries the valid
+time of every step, one line per step with all parameters as fields.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .snapshot import ForecastSnapshot
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+LINE_PROTOCOL_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+METRIC_PREFIX = "smhi_odp"
+INFLUX_MEASUREMENT = "smhi_odp_forecast"
+INFLUX_TIMINGS_MEASUREMENT = "smhi_odp_timings"
+
+
+@dataclass(frozen=True, slots=True)
+class Timings:
+    """Refresh timings of one location, in seconds."""
+
+    entry_id: str
+    name: str | None
+    generation: int
+    fetch: float | None
+    parse: float | None
+
+
+def _label_value(value: str) -> str:
+    """Escape an OpenMetrics label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(entry_id: str, name: str | None) -> str:
+    """Return the location labels shared by all of a location's samples."""
+    return f'entry_id="{_label_value(entry_id)}",location="{_label_value(name or "")}"'
+
+
+def _tag_value(value: str) -> str:
+    """Escape a line protocol tag value."""
+    for char in ("\\", ",", "=", " "):
+        value = value.replace(char, f"\\{char}")
+    return value or "-"
+
+
+def _tags(entry_id: str, name: str | None) -> str:
+    """Return the location tags shared by all of a location's lines."""
+    return f"entry_id={_tag_value(entry_id)},location={_tag_value(name or '')}"
+
+
+def _number(value) -> bool:
+    """Return True for values that can be exported as a sample."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _series(snapshot: ForecastSnapshot) -> dict[str, tuple]:
+    """Return every numeric series of a snapshot by exported name."""
+    series = {
+        name: values
+        for name, values in snapshot.hourly.values.items()
+        if any(_number(value) for value in values)
+    }
+    for band, amounts in snapshot.hourly.precipitation.items():
+        series[f"{band}_amount"] = amounts
+    return series
+
+
+def openmetrics_families(snapshot: ForecastSnapshot) -> dict[str, bytes]:
+    """Render a location's samples, by metric family name."""
+    hourly = snapshot.hourly
+    if not hourly.times:
+        return {}
+    reference = snapshot.reference_time or hourly.times[0]
+    labels = _labels(snapshot.entry_id, snapshot.name)
+    leads = [
+        f'{labels},lead_hours="{round((time - reference).total_seconds() / 3600)}"'
+        for time in hourly.times
+    ]
+
+    families = {
+        f"{METRIC_PREFIX}_forecast_reference_timestamp_seconds": (
+            f"{METRIC_PREFIX}_forecast_reference_timestamp_seconds"
+            f"{{{labels}}} {reference.timestamp()}\n"
+        ).encode()
+    }
+    for name, values in _series(snapshot).items():
+        family = f"{METRIC_PREFIX}_forecast_{name}"
+        families[family] = "".join(
+            f"{family}{{{lead}}} {value}\n"
+            for lead, value in zip(leads, values)
+            if _number(value)
+        ).encode()
+    return families
+
+
+def render_openmetrics(
+    locations: Iterable[dict[str, bytes]], timings: Iterable[Timings]
+) -> Iterator[bytes]:
+    """Yield a document of many locations' families, one family at a time.
+
+    `locations` are the results of `openmetrics_families`. Every family is
+    written once with the samples of all locations that have it, followed
+    by the refresh timings and the closing EOF marker.
+    """
+    locations = list(locations)
+    names = dict.fromkeys(family for families in locations for family in families)
+    for family in names:
+        yield f"# TYPE {family} gauge\n".encode() + b"".join(
+            families[family] for families in locations if family in families
+        )
+
+    timings = list(timings)
+    for family, field, unit in (
+        (f"{METRIC_PREFIX}_fetch_duration_seconds", "fetch", "seconds"),
+        (f"{METRIC_PREFIX}_parse_duration_seconds", "parse", "seconds"),
+        (f"{METRIC_PREFIX}_forecast_generation", "generation", None),
+    ):
+        lines = [f"# TYPE {family} gauge\n"]
+        if unit:
+            lines.append(f"# UNIT {family} {unit}\n")
+        for timing in timings:
+            value = getattr(timing, field)
+            if value is not None:
+                lines.append(
+                    f"{family}{{{_labels(timing.entry_id, timing.name)}}} {value}\n"
+                )
+        yield "".join(lines).encode()
+    yield b"# EOF\n"
+
+
+def line_protocol(snapshot: ForecastSnapshot) -> bytes:
+    """Render a location's series as one line per time step."""
+    hourly = snapshot.hourly
+    measurement = f"{INFLUX_MEASUREMENT},{_tags(snapshot.entry_id, snapshot.name)}"
+    series = _series(snapshot)
+    lines = []
+    for i, time in enumerate(hourly.times):
+        fields = ",".join(
+            f"{name}={float(values[i])}"
+            for name, values in series.items()
+            if _number(values[i])
+        )
+        if fields:
+            lines.append(f"{measurement} {fields} {int(time.timestamp()) * 10**9}\n")
+    return "".join(lines).encode()
+
+
+def timings_line_protocol(timings: Iterable[Timings]) -> bytes:
+    """Render the refresh timings, stamped by the server on write."""
+    lines = []
+    for timing in timings:
+        fields = [f"generation={timing.generation}i"]
+        if timing.fetch is not None:
+            fields.append(f"fetch_seconds={timing.fetch}")
+        if timing.parse is not None:
+            fields.append(f"parse_seconds={timing.parse}")
+        lines.append(
+            f"{INFLUX_TIMINGS_MEASUREMENT},{_tags(timing.entry_id, timing.name)} "
+            f"{','.join(fields)}\n"
+        )
+    return "".join(lines).encode()
@@ -0,0 +1,98 @@
+"""SMHI fire risk forecast (fwif1g).
+
+The daily fire weather forecast gives the Canadian Fire Weather Index
+system's components per day and SMHI's fire risk index from 1 (very low)
+to 6 (extremely high). It is only published during the fire season.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from .adapters import detect_adapter
+
+FIRE_RISK_URL = (
+    "https://opendata-download-metfcst.smhi.se/api/category/fwif1g/version/1"
+    "/daily/geotype/point/lon/{lon:.6f}/lat/{lat:.6f}/data.json"
+)
+
+# fwiindex value -> fire risk level
+FIRE_RISK_LEVELS = {
+    1: "very_low",
+    2: "low",
+    3: "moderate",
+    4: "high",
+    5: "very_high",
+    6: "extreme",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FireRiskDay:
+    """The fire weather forecast of one day."""
+
+    date: date
+    # SMHI fire risk index, 1-6
+    index: int | None
+    # Fire Weather Index and its components
+    fwi: float | None
+    isi: float | None
+    bui: float | None
+    ffmc: float | None
+    dmc: float | None
+    dc: float | None
+    # Grass fire risk index
+    grass_fire: float | None
+
+    @property
+    def level(self) -> str | None:
+        """Return the fire risk level of the index."""
+        return FIRE_RISK_LEVELS.get(self.index)
+
+    def as_dict(self) -> dict:
+        """Return the day as attribute data."""
+        return {
+            "date": self.date.isoformat(),
+            "level": self.level,
+            "index": self.index,
+            "fwi": self.fwi,
+            "isi": self.isi,
+            "bui": self.bui,
+            "ffmc": self.ffmc,
+            "dmc": self.dmc,
+            "dc": self.dc,
+            "grass_fire": self.grass_fire,
+        }
+
+
+def _number(value) -> float | None:
+    """Return a numeric value, or None for missing or negative fill values."""
+    if not isinstance(value, (int, float)) or value < 0:
+        return None
+    return value
+
+
+def parse_fire_risk(payload: dict) -> tuple[FireRiskDay, ...]:
+    """Parse a fwif1g daily payload into one entry per day."""
+    adapter = detect_adapter(payload)
+    if adapter is None:
+        raise ValueError("Unrecognized fire risk payload")
+    times, rows, _ = adapter.extract(payload)
+    days = []
+    for valid, row in zip(times, rows):
+        index = _number(row.get("fwiindex"))
+        days.append(
+            FireRiskDay(
+                date=valid.date(),
+                index=int(index) if index is not None and index >= 1 else None,
+                fwi=_number(row.get("fwi")),
+                isi=_number(row.get("isi")),
+                bui=_number(row.get("bui")),
+                ffmc=_number(row.get("ffmc")),
+                dmc=_number(row.get("dmc")),
+                dc=_number(row.get("dc")),
+                grass_fire=_number(row.get("grassfire")),
+            )
+        )
+    return tuple(days)
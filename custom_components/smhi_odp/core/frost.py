@@ -0,0 +1,182 @@
+"""Night frost risk from temperature, humidity, cloud cover and wind.
+
+The forecast temperature is the air 2 m above ground, while frost damage
+happens at the surface, which cools further on clear and calm nights.
+Every time step gets an estimated surface temperature: the air
+temperature minus up to `RADIATIVE_COOLING` °C, scaled down by the cloud
+cover and by the wind mixing the air, but not more than `DEW_MARGIN` °C
+below the dew point, where dew or hoar frost forming releases heat.
+
+A night runs from sunset to sunrise. Its frost probability follows the
+lowest surface estimate of the night through a logistic curve, so the
+forecast's uncertainty gives 50 % at 0 °C, and its severity follows how
+far below freezing that estimate goes.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime
+from math import exp, log
+
+from .model import SmhiForecast
+
+# Largest surface cooling below the air temperature (°C), clear and calm
+RADIATIVE_COOLING = 4.0
+
+# Wind speed (m/s) from which the air is mixed enough to stop it
+MIXING_WIND_SPEED = 6.0
+
+# Cloud cover is forecast in octas
+CLOUD_OCTAS = 8.0
+
+# How far below the dew point the surface can cool (°C)
+DEW_MARGIN = 1.0
+
+# Spread (°C) of the logistic curve turning the estimate into a probability
+UNCERTAINTY = 1.0
+
+# Severity of frost by lowest surface temperature (°C): the first bound
+# the temperature is at or above, and severe below them all
+SEVERITY_NONE = "none"
+SEVERITY_LIGHT = "light"
+SEVERITY_MODERATE = "moderate"
+SEVERITY_SEVERE = "severe"
+SEVERITY_BOUNDS = (
+    (0.0, SEVERITY_NONE),
+    (-2.0, SEVERITY_LIGHT),
+    (-4.0, SEVERITY_MODERATE),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FrostNight:
+    """The frost risk of one night, named after the day it starts."""
+
+    date: date
+    start: datetime
+    end: datetime
+    # Probability of frost at the surface, 0-100 %
+    probability: int
+    severity: str
+    # Lowest estimated surface and forecast air temperatures, °C
+    surface_temperature: float
+    min_temperature: float
+    # Conditions at the coldest step of the night
+    dew_point: float | None
+    cloud_cover: float | None
+    wind_speed: float | None
+
+    def as_dict(self) -> dict:
+        """Return the night as attribute data."""
+        return {
+            "date": self.date.isoformat(),
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "severity": self.severity,
+            "surface_temperature": self.surface_temperature,
+            "min_temperature": self.min_temperature,
+            "dew_point": self.dew_point,
+            "cloud_cover": self.cloud_cover,
+            "wind_speed": self.wind_speed,
+        }
+
+
+def dew_point(temperature: float, humidity: float) -> float:
+    """Return the dew point (°C) with the Magnus formula."""
+    gamma = log(max(humidity, 1.0) / 100) + 17.62 * temperature / (
+        243.12 + temperature
+    )
+    return 243.12 * gamma / (17.62 - gamma)
+
+
+def surface_temperatures(
+    temperatures: list,
+    dew_points: list,
+    clouds: list,
+    winds: list,
+) -> list[float | None]:
+    """Estimate the surface temperature of every time step.
+
+    A missing cloud cover or wind counts as clear or calm, which errs on
+    the side of frost.
+    """
+    surfaces = []
+    for temperature, dew, cloud, wind in zip(temperatures, dew_points, clouds, winds):
+        if temperature is None:
+            surfaces.append(None)
+            continue
+        clear = 1.0 - min(max(cloud or 0.0, 0.0), CLOUD_OCTAS) / CLOUD_OCTAS
+        calm = max(1.0 - (wind or 0.0) / MIXING_WIND_SPEED, 0.0)
+        surface = temperature - RADIATIVE_COOLING * clear * calm
+        if dew is not None:
+            surface = max(surface, min(dew, temperature) - DEW_MARGIN)
+        surfaces.append(surface)
+    return surfaces
+
+
+def severity(surface_temperature: float) -> str:
+    """Return the severity of frost down to a surface temperature."""
+    for bound, name in SEVERITY_BOUNDS:
+        if surface_temperature >= bound:
+            return name
+    return SEVERITY_SEVERE
+
+
+def probability(surface_temperature: float) -> int:
+    """Return the frost probability (%) of a surface temperature estimate."""
+    return round(100 / (1 + exp(min(surface_temperature / UNCERTAINTY, 50.0))))
+
+
+def frost_nights(
+    forecast: SmhiForecast, nights: list[tuple[date, datetime, datetime]]
+) -> list[FrostNight]:
+    """Return the frost risk of every night the forecast covers.
+
+    `nights` are (date, sunset, sunrise) windows in order. The surface
+    estimate is computed column-wise once; each night takes the minimum of
+    the steps ending within it.
+    """
+    temperatures = forecast.column("air_temperature")
+    humidities = forecast.column("relative_humidity")
+    dew_points = [
+        dew_point(temperature, humidity)
+        if temperature is not None and humidity is not None
+        else None
+        for temperature, humidity in zip(temperatures, humidities)
+    ]
+    clouds = forecast.column("cloud_area_fraction")
+    winds = forecast.column("wind_speed")
+    surfaces = surface_temperatures(temperatures, dew_points, clouds, winds)
+
+    result = []
+    for day, start, end in nights:
+        first = bisect_right(forecast.times, start)
+        last = bisect_left(forecast.times, end) + 1
+        steps = [
+            i for i in range(first, min(last, len(surfaces))) if surfaces[i] is not None
+        ]
+        if not steps:
+            continue
+        coldest = min(steps, key=surfaces.__getitem__)
+        surface = surfaces[coldest]
+        result.append(
+            FrostNight(
+                date=day,
+                start=start,
+                end=end,
+                probability=probability(surface),
+                severity=severity(surface),
+                surface_temperature=round(surface, 1),
+                min_temperature=min(temperatures[i] for i in steps),
+                dew_point=(
+                    round(dew_points[coldest], 1)
+                    if dew_points[coldest] is not None
+                    else None
+                ),
+                cloud_cover=clouds[coldest],
+                wind_speed=winds[coldest],
+            )
+        )
+    return result
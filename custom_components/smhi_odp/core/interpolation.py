@@ -0,0 +1,288 @@
+"""Point forecasts blended from the surrounding grid points.
+
+SMHI answers a point request with the forecast of the grid cell the point
+falls in, so values jump where a location sits near a cell boundary or a
+coastline. In interpolation mode the four corners of a fixed lattice cell
+around the location are fetched instead, aligned on the timestamps they
+share and blended into one series, either bilinearly by the location's
+position in the lattice cell or by inverse distance to the grid points
+SMHI actually answered with.
+
+Requests go to fixed lattice corners, so neighbouring locations share
+corners and a shared `PointCache` serves them with one download each. The
+result is a snow1g-shaped payload, so the rest of the integration handles
+it like any other forecast.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import math
+import time
+
+from .adapters import SYMBOL_KEYS, detect_adapter, grid_point
+from .client import async_fetch_payload
+from .stations import distance_km
+
+# Lattice cell size in degrees latitude and longitude, about one
+# snow1g grid cell in Sweden
+LATTICE = (0.025, 0.045)
+
+METHOD_BILINEAR = "bilinear"
+METHOD_IDW = "idw"
+METHODS = (METHOD_BILINEAR, METHOD_IDW)
+
+# Inverse distance weighting power
+IDW_POWER = 2
+
+# Parameters in degrees, blended as unit vectors
+CIRCULAR_PARAMETERS = ("wind_from_direction",)
+
+# Category codes (precipitation type), taken from the heaviest point like
+# the weather symbol since a mean of two codes is no code at all
+CATEGORICAL_PARAMETERS = frozenset(
+    {"predominant_precipitation_type_at_surface", "pcat"}
+)
+
+# Parameters that cannot be negative, where SMHI marks an unknown value
+# with a negative fill value such as -9
+FILL_VALUED_PARAMETERS = frozenset(
+    {
+        "precipitation_frozen_part",
+        "precipitation_amount_mean",
+        "precipitation_amount_min",
+        "precipitation_amount_median",
+        "precipitation_amount_max",
+        "probability_of_precipitation",
+        "probability_of_frozen_precipitation",
+        "thunderstorm_probability",
+        "cloud_area_fraction",
+        "low_type_cloud_area_fraction",
+        "medium_type_cloud_area_fraction",
+        "high_type_cloud_area_fraction",
+        "relative_humidity",
+        "visibility_in_air",
+        "wind_speed",
+        "wind_speed_of_gust",
+    }
+)
+
+# Corner requests in flight at once per location
+MAX_CONCURRENT_POINTS = 4
+
+# A cached corner forecast older than this is fetched again
+POINT_CACHE_MAX_AGE = timedelta(minutes=50)
+
+
+def lattice_corners(
+    lat: float, lon: float
+) -> tuple[list[tuple[float, float]], float, float]:
+    """Return the SW, SE, NW, NE lattice corners around a location.
+
+    Also returns the location's fractional position (north, east) within
+    the lattice cell.
+    """
+    step_lat, step_lon = LATTICE
+    row, col = math.floor(lat / step_lat), math.floor(lon / step_lon)
+    south, west = round(row * step_lat, 6), round(col * step_lon, 6)
+    north, east = round(south + step_lat, 6), round(west + step_lon, 6)
+    corners = [(south, west), (south, east), (north, west), (north, east)]
+    return corners, (lat - south) / step_lat, (lon - west) / step_lon
+
+
+def bilinear_weights(north: float, east: float) -> list[float]:
+    """Return the SW, SE, NW, NE weights of a fractional position."""
+    return [
+        (1 - north) * (1 - east),
+        (1 - north) * east,
+        north * (1 - east),
+        north * east,
+    ]
+
+
+def idw_weights(
+    lat: float, lon: float, points: list[tuple[float, float]]
+) -> list[float]:
+    """Return inverse distance weights of some points from a location."""
+    distances = [distance_km(lat, lon, p_lat, p_lon) for p_lat, p_lon in points]
+    if any(d < 1e-3 for d in distances):
+        # The location is on a grid point
+        return [1.0 if d < 1e-3 else 0.0 for d in distances]
+    return [1 / d**IDW_POWER for d in distances]
+
+
+class PointCache:
+    """Forecast payloads of lattice corners, shared between locations."""
+
+    def __init__(self, max_age: timedelta = POINT_CACHE_MAX_AGE) -> None:
+        """Initialize an empty cache."""
+        self.max_age = max_age.total_seconds()
+        self._entries: dict[tuple[float, float], tuple[float, asyncio.Future]] = {}
+
+    def fetch(self, client, lat: float, lon: float) -> asyncio.Future:
+        """Return the pending or finished download of a corner.
+
+        Concurrent requests for the same corner share one download, and a
+        failed download is not cached.
+        """
+        key = (lat, lon)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched, future = entry
+            if now - fetched < self.max_age and not _failed(future):
+                return future
+        future = asyncio.ensure_future(async_fetch_payload(client, lat, lon))
+        self._entries[key] = (now, future)
+        # Drop finished entries that have expired
+        for other, (fetched, pending) in list(self._entries.items()):
+            if now - fetched >= self.max_age and pending.done():
+                del self._entries[other]
+        return future
+
+
+def _failed(future: asyncio.Future) -> bool:
+    """Return True if a download finished without a payload."""
+    return future.done() and (future.cancelled() or future.exception() is not None)
+
+
+def _weighted_mean(values: tuple, weights: list[float]) -> float | None:
+    """Return the weighted mean of the known values."""
+    total = sum(w for v, w in zip(values, weights) if v is not None)
+    if not total:
+        return None
+    weighted = sum(v * w for v, w in zip(values, weights) if v is not None)
+    return round(weighted / total, 2)
+
+
+def _circular_mean(values: tuple, weights: list[float]) -> float | None:
+    """Return the weighted mean of some directions in degrees."""
+    x = y = 0.0
+    for value, weight in zip(values, weights):
+        if value is not None:
+            x += weight * math.cos(math.radians(value))
+            y += weight * math.sin(math.radians(value))
+    if not x and not y:
+        return None
+    return round(math.degrees(math.atan2(y, x)) % 360, 1)
+
+
+def _heaviest(values: tuple, weights: list[float]):
+    """Return the known value of the most heavily weighted point."""
+    known = [(v, w) for v, w in zip(values, weights) if v is not None]
+    if not known:
+        return None
+    return max(known, key=lambda pair: pair[1])[0]
+
+
+def blend(
+    payloads: list[dict], weights: list[float], lat: float, lon: float
+) -> dict:
+    """Blend point payloads into one snow1g-shaped payload.
+
+    Series are aligned on the timestamps all of them share. Each parameter
+    is blended column by column over the aligned rows; a missing value or
+    a fill value drops out and the remaining weights are renormalized. The weather
+    symbol and category codes are taken from the heaviest point that has
+    one.
+    """
+    extracted = []
+    for payload in payloads:
+        adapter = detect_adapter(payload)
+        if adapter is None:
+            raise ValueError("Unrecognized forecast payload for interpolation")
+        extracted.append(adapter.extract(payload))
+
+    shared = set.intersection(*(set(times) for times, _, _ in extracted))
+    times: list[datetime] = sorted(shared)
+    if not times:
+        raise ValueError("Neighbouring grid points share no forecast times")
+    aligned_rows = []
+    aligned_symbols = []
+    for series_times, rows, symbols in extracted:
+        index = {t: i for i, t in enumerate(series_times)}
+        aligned_rows.append([rows[index[t]] for t in times])
+        aligned_symbols.append([symbols[index[t]] for t in times])
+
+    names = sorted(
+        {name for rows in aligned_rows for row in rows for name in row}
+        - set(SYMBOL_KEYS)
+    )
+    columns: dict[str, list] = {}
+    for name in names:
+        series = [[row.get(name) for row in rows] for rows in aligned_rows]
+        if not all(
+            v is None or isinstance(v, (int, float))
+            for column in series
+            for v in column
+        ):
+            continue
+        if name in FILL_VALUED_PARAMETERS:
+            series = [
+                [v if v is None or v >= 0 else None for v in column]
+                for column in series
+            ]
+        if name in CATEGORICAL_PARAMETERS:
+            mean = _heaviest
+        elif name in CIRCULAR_PARAMETERS:
+            mean = _circular_mean
+        else:
+            mean = _weighted_mean
+        columns[name] = [mean(values, weights) for values in zip(*series)]
+
+    order = sorted(range(len(weights)), key=lambda i: weights[i], reverse=True)
+    time_series = []
+    for step, step_time in enumerate(times):
+        data = {name: column[step] for name, column in columns.items()}
+        data["symbol_code"] = next(
+            (
+                aligned_symbols[i][step]
+                for i in order
+                if aligned_symbols[i][step] is not None
+            ),
+            None,
+        )
+        time_series.append({"time": step_time.isoformat(), "data": data})
+
+    return {
+        "referenceTime": payloads[0].get("referenceTime"),
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "timeSeries": time_series,
+    }
+
+
+async def async_fetch_interpolated(
+    client,
+    lat: float,
+    lon: float,
+    method: str = METHOD_BILINEAR,
+    cache: PointCache | None = None,
+) -> dict:
+    """Fetch the lattice corners around a location and blend them."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown interpolation method: {method}")
+    corners, north, east = lattice_corners(lat, lon)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_POINTS)
+
+    async def fetch(corner_lat: float, corner_lon: float) -> dict:
+        async with semaphore:
+            if cache is not None:
+                # A shared download must survive this caller being cancelled
+                return await asyncio.shield(
+                    cache.fetch(client, corner_lat, corner_lon)
+                )
+            return await async_fetch_payload(client, corner_lat, corner_lon)
+
+    payloads = await asyncio.gather(*(fetch(*corner) for corner in corners))
+
+    if method == METHOD_BILINEAR:
+        weights = bilinear_weights(north, east)
+    else:
+        # Corners that snapped to the same grid cell count once
+        points = {}
+        for corner, payload in zip(corners, payloads):
+            points.setdefault(grid_point(payload, *corner), payload)
+        payloads = list(points.values())
+        weights = idw_weights(lat, lon, list(points))
+    return blend(payloads, weights, lat, lon)
@@ -0,0 +1,424 @@
+"""Parsed forecast model and precomputed entity values for SMHI ODP.
+
+The coordinator keeps the raw API payload as its data. After each refresh it
+parses the payload once into a `SmhiForecast` and derives a `SmhiView` holding
+the final value and attributes of every entity of the config entry, so the
+entities themselves only look up their slot.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, tzinfo
+from typing import Any
+
+from .adapters import detect_adapter, parse_time
+from .snow import (
+    SNOW_WINDOWS,
+    SnowTotals,
+    melt_amounts,
+    snowfall_amounts,
+    totals,
+    window_totals,
+)
+
+# SMHI Wsymb2 code mapping to HA conditions
+CONDITION_CLASSES = {
+    "clear-night": [1],  # Clear sky
+    "sunny": [1, 2],  # Clear sky, Nearly clear sky
+    "partlycloudy": [3, 4],  # Variable cloudiness, Halfclear sky
+    "cloudy": [5, 6],  # Cloudy sky, Overcast
+    "fog": [7],  # Fog
+    "rainy": [
+        8,
+        9,
+        10,
+        18,
+        19,
+        20,
+    ],  # Light rain showers, Moderate rain showers, Heavy rain showers, Light rain, Moderate rain, Heavy rain
+    "lightning-rainy": [11, 21],  # Thunderstorm, Thunder
+    "snowy-rainy": [
+        12,
+        13,
+        14,
+        22,
+        23,
+        24,
+    ],  # Light sleet showers, Moderate sleet showers, Heavy sleet showers, Light sleet, Moderate sleet, Heavy sleet
+    "snowy": [
+        15,
+        16,
+        17,
+        25,
+        26,
+        27,
+    ],  # Light snow showers, Moderate snow showers, Heavy snow showers, Light snowfall, Moderate snowfall, Heavy snowfall
+}
+
+# Entity key -> SMHI parameter for the current condition sensors
+CURRENT_PARAMETERS = {
+    "temperature": "air_temperature",
+    "humidity": "relative_humidity",
+    "wind_speed": "wind_speed",
+    "wind_direction": "wind_from_direction",
+    "pressure": "air_pressure_at_mean_sea_level",
+    "precipitation": "precipitation_amount_mean",
+}
+
+# Number of daily forecast sensors / days in the weather forecast
+FORECAST_DAYS = 10
+
+# Daily precipitation total -> SMHI intensity parameter (mm/h) it integrates.
+# snow1g publishes the spread of its ensemble alongside the mean.
+PRECIPITATION_BANDS = {
+    "precipitation": "precipitation_amount_mean",
+    "precipitation_min": "precipitation_amount_min",
+    "precipitation_median": "precipitation_amount_median",
+    "precipitation_max": "precipitation_amount_max",
+}
+
+
+def daily_key(day_offset: int) -> str:
+    """Return the view key of the daily forecast sensor for a day offset."""
+    return f"day_{day_offset}"
+
+
+def snowfall_key(hours: int) -> str:
+    """Return the view key of the snowfall sensor of a window."""
+    return f"snowfall_{hours}h"
+
+
+def condition_for(symbol: int | None) -> str | None:
+    """Map an SMHI symbol code to a Home Assistant condition."""
+    return next(
+        (k for k, v in CONDITION_CLASSES.items() if symbol in v),
+        None,
+    )
+
+
+def _numpy():
+    """Import NumPy on demand for the array helpers."""
+    try:
+        import numpy
+    except ImportError as err:
+        raise ImportError("NumPy is required for array output") from err
+    return numpy
+
+
+def _sum(values: list) -> float | None:
+    """Sum the known values, or None if there are none."""
+    known = [value for value in values if value is not None]
+    return round(sum(known), 1) if known else None
+
+
+def _max(values: list) -> float | None:
+    """Return the largest known value, or None if there are none."""
+    known = [value for value in values if value is not None]
+    return max(known) if known else None
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastDay:
+    """Index of the time series entries that fall on one local date."""
+
+    date: date
+    start: int
+    end: int
+    max_index: int | None
+    min_index: int | None
+    noon_index: int
+    # Precipitation totals in mm per PRECIPITATION_BANDS key
+    precipitation: dict[str, float | None]
+    precipitation_probability: float | None
+    snow: SnowTotals
+
+
+class SmhiForecast:
+    """A forecast time series parsed once per refresh.
+
+    Entries are kept in API order (ascending time). Parameter values are
+    available column-wise so aggregations do not walk the raw dicts again.
+
+    SMHI precipitation parameters are mean intensities over the interval
+    ending at an entry's time. The interval grows from 1 h to 12 h along the
+    forecast, so amounts are integrated over each entry's actual time step
+    rather than assuming hourly data.
+    """
+
+    def __init__(
+        self,
+        times: list[datetime],
+        rows: list[dict],
+        symbols: list[int | None],
+        tz: tzinfo,
+        source: str,
+        reference_time: datetime | None = None,
+    ) -> None:
+        """Initialize the forecast from extracted times, data and symbols."""
+        self.times = times
+        self.rows = rows
+        self.symbols = symbols
+        self.tz = tz
+        # Name of the schema adapter the payload was parsed with
+        self.source = source
+        # Analysis time of the model run the forecast was issued from
+        self.reference_time = reference_time
+        self._columns: dict[str, list] = {}
+        self.step_hours = self._step_hours()
+        self.amounts = {
+            band: self._integrate(parameter)
+            for band, parameter in PRECIPITATION_BANDS.items()
+        }
+        # Snowfall and potential melt (mm water equivalent) per time step
+        temperatures = self.column("air_temperature")
+        self.snowfall = snowfall_amounts(
+            self.amounts["precipitation"],
+            self.column("precipitation_frozen_part"),
+            temperatures,
+        )
+        self.melt = melt_amounts(temperatures, self.step_hours)
+        self.days = self._index_days()
+
+    def __len__(self) -> int:
+        """Return the number of time steps."""
+        return len(self.times)
+
+    def column(self, name: str) -> list:
+        """Return the values of one parameter for every time step."""
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = [row.get(name) for row in self.rows]
+        return values
+
+    def array(self, name: str):
+        """Return one parameter as a NumPy float array, NaN where missing.
+
+        NumPy is optional and only imported here.
+        """
+        return _numpy().array(
+            [float("nan") if v is None else v for v in self.column(name)],
+            dtype=float,
+        )
+
+    def _step_hours(self) -> list[float]:
+        """Return the length in hours of the interval ending at each entry."""
+        times = self.times
+        steps = [
+            (later - earlier).total_seconds() / 3600
+            for earlier, later in zip(times, times[1:])
+        ]
+        # The first entry has no predecessor; assume it spans the next step
+        return [steps[0] if steps else 1.0, *steps]
+
+    def _integrate(self, parameter: str) -> list[float | None]:
+        """Return the amount (mm) of an intensity parameter per time step."""
+        return [
+            rate * step if rate is not None else None
+            for rate, step in zip(self.column(parameter), self.step_hours)
+        ]
+
+    def _index_days(self) -> list[ForecastDay]:
+        """Group the time steps by local date in a single pass."""
+        temperatures = self.column("air_temperature")
+        probabilities = self.column("probability_of_precipitation")
+        days = []
+        start = 0
+        local_dates = [t.astimezone(self.tz).date() for t in self.times]
+        for i in range(1, len(local_dates) + 1):
+            if i < len(local_dates) and local_dates[i] == local_dates[start]:
+                continue
+            day_date = local_dates[start]
+            max_index = min_index = None
+            for j in range(start, i):
+                temp = temperatures[j]
+                if temp is None:
+                    continue
+                if max_index is None or temp > temperatures[max_index]:
+                    max_index = j
+                if min_index is None or temp < temperatures[min_index]:
+                    min_index = j
+            noon = datetime.combine(day_date, time(12), tzinfo=self.tz)
+            noon_index = min(
+                range(start, i),
+                key=lambda j: abs((self.times[j] - noon).total_seconds()),
+            )
+            precipitation = {
+                band: _sum(amounts[start:i]) for band, amounts in self.amounts.items()
+            }
+            probability = _max(probabilities[start:i])
+            snow = totals(self.snowfall[start:i], self.melt[start:i])
+            days.append(
+                ForecastDay(
+                    day_date,
+                    start,
+                    i,
+                    max_index,
+                    min_index,
+                    noon_index,
+                    precipitation,
+                    probability,
+                    snow,
+                )
+            )
+            start = i
+        return days
+
+
+def build_forecast(payload: dict | None, tz: tzinfo) -> SmhiForecast | None:
+    """Parse an API payload into a `SmhiForecast`.
+
+    The payload format is detected once and the matching adapter's extractor
+    handles every entry, so no per-entry key probing is needed.
+    """
+    adapter = detect_adapter(payload)
+    if adapter is None:
+        return None
+
+    times, rows, symbols = adapter.extract(payload)
+    if not rows:
+        return None
+    return SmhiForecast(
+        times,
+        rows,
+        symbols,
+        tz,
+        adapter.name,
+        parse_time(payload.get("referenceTime")),
+    )
+
+
+@dataclass(slots=True)
+class EntityValue:
+    """The precomputed state of one entity."""
+
+    native_value: Any = None
+    attributes: dict | None = None
+
+
+@dataclass(slots=True)
+class SmhiView:
+    """Everything the entities of one config entry display."""
+
+    forecast: SmhiForecast | None = None
+    entities: dict[str, EntityValue] = field(default_factory=dict)
+    current: dict = field(default_factory=dict)
+    condition: str | None = None
+    daily_forecast: list[dict] = field(default_factory=list)
+    hourly_forecast: list[dict] = field(default_factory=list)
+
+    def value(self, key: str) -> EntityValue:
+        """Return the slot of an entity, empty if nothing was computed."""
+        return self.entities.get(key) or EntityValue()
+
+
+def build_view(
+    forecast: SmhiForecast | None,
+    now: datetime,
+    keys: Collection[str] | None = None,
+) -> SmhiView:
+    """Compute the values of the entities of a config entry in one pass.
+
+    If `keys` is given, only those entity slots are computed; the weather
+    entity's forecasts are always computed.
+    """
+    view = SmhiView(forecast=forecast)
+    if forecast is None:
+        return view
+    today = now.date()
+
+    current = forecast.rows[0]
+    view.current = current
+    view.condition = condition_for(forecast.symbols[0])
+    for key, parameter in CURRENT_PARAMETERS.items():
+        if keys is None or key in keys:
+            view.entities[key] = EntityValue(current.get(parameter))
+    if "temperature" in view.entities:
+        # The temperature sensor carries all current parameters as attributes
+        view.entities["temperature"].attributes = current
+
+    temperatures = forecast.column("air_temperature")
+    for day in forecast.days:
+        offset = (day.date - today).days
+        if offset < 0:
+            continue
+
+        if (
+            offset < FORECAST_DAYS
+            and day.max_index is not None
+            and (keys is None or daily_key(offset) in keys)
+        ):
+            view.entities[daily_key(offset)] = EntityValue(
+                temperatures[day.max_index],
+                {
+                    **forecast.rows[day.max_index],
+                    **day.precipitation,
+                    "precipitation_probability": day.precipitation_probability,
+                    **day.snow.as_dict(),
+                },
+            )
+
+        if len(view.daily_forecast) < FORECAST_DAYS:
+            day_data = forecast.rows[day.noon_index]
+            symbol = forecast.symbols[day.noon_index]
+            view.daily_forecast.append(
+                {
+                    "datetime": day.date.isoformat(),
+                    "native_temperature": (
+                        temperatures[day.max_index]
+                        if day.max_index is not None
+                        else None
+                    ),
+                    "native_templow": (
+                        temperatures[day.min_index]
+                        if day.min_index is not None
+                        else None
+                    ),
+                    "condition": condition_for(symbol),
+                    "native_precipitation": day.precipitation["precipitation"],
+                    "precipitation_min": day.precipitation["precipitation_min"],
+                    "precipitation_median": day.precipitation[
+                        "precipitation_median"
+                    ],
+                    "precipitation_max": day.precipitation["precipitation_max"],
+                    "precipitation_probability": day.precipitation_probability,
+                    "wind_bearing": day_data.get("wind_from_direction"),
+                    "native_wind_speed": day_data.get("wind_speed"),
+                    "snowfall": day.snow.depth,
+                    "snowfall_water_equivalent": day.snow.snowfall,
+                }
+            )
+
+    for hours in SNOW_WINDOWS:
+        if keys is None or snowfall_key(hours) in keys:
+            window = window_totals(
+                forecast.times, forecast.snowfall, forecast.melt, now, hours
+            )
+            view.entities[snowfall_key(hours)] = EntityValue(
+                window.depth, {"hours": hours, **window.as_dict()}
+            )
+
+    # One hourly forecast item per remaining time step, starting this hour
+    this_hour = now.replace(minute=0, second=0, microsecond=0)
+    amounts = forecast.amounts["precipitation"]
+    for i, entry_time in enumerate(forecast.times):
+        if entry_time < this_hour:
+            continue
+        data = forecast.rows[i]
+        view.hourly_forecast.append(
+            {
+                "datetime": entry_time.isoformat(),
+                "native_temperature": temperatures[i],
+                "condition": condition_for(forecast.symbols[i]),
+                "native_precipitation": amounts[i],
+                "precipitation_probability": data.get("probability_of_precipitation"),
+                "humidity": data.get("relative_humidity"),
+                "native_pressure": data.get("air_pressure_at_mean_sea_level"),
+                "wind_bearing": data.get("wind_from_direction"),
+                "native_wind_speed": data.get("wind_speed"),
+                "native_wind_gust_speed": data.get("wind_speed_of_gust"),
+            }
+        )
+
+    return view
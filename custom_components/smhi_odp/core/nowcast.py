@@ -0,0 +1,107 @@
+"""Precipitation nowcast: 15-minute steps for the next couple of hours.
+
+The nowcast is kept in a fixed-size ring buffer addressed by time slot, so
+a new download overwrites the slots it covers in place and steps that have
+passed drop out without reallocating anything. Entities read a small
+summary computed once per download.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from .adapters import detect_adapter
+
+NOWCAST_URL = (
+    "https://opendata-download-metfcst.smhi.se/api/category/pnowcast1g/version/1"
+    "/geotype/point/lon/{lon:.6f}/lat/{lat:.6f}/data.json"
+)
+
+# Length of one nowcast step
+NOWCAST_STEP = timedelta(minutes=15)
+
+# Slots in the buffer; covers the ~2 h horizon with room to spare
+NOWCAST_SLOTS = 16
+
+# Keys that have carried the precipitation intensity (mm/h)
+RATE_KEYS = ("precipitation_amount_mean", "precipitation_rate")
+
+# Intensity (mm/h) counted as precipitation
+NOWCAST_THRESHOLD = 0.1
+
+_STEP_SECONDS = int(NOWCAST_STEP.total_seconds())
+
+
+class NowcastBuffer:
+    """Precipitation intensity per 15-minute slot in a ring buffer."""
+
+    def __init__(self, slots: int = NOWCAST_SLOTS) -> None:
+        """Allocate the buffer; empty slots carry time 0."""
+        self._slots = slots
+        self._times = array("q", bytes(8 * slots))
+        self._rates = array("d", bytes(8 * slots))
+
+    def _slot(self, stamp: int) -> int:
+        """Return the slot index of a step start (epoch seconds)."""
+        return (stamp // _STEP_SECONDS) % self._slots
+
+    def update(self, payload: dict) -> None:
+        """Write the steps of a nowcast payload into their slots."""
+        adapter = detect_adapter(payload)
+        if adapter is None:
+            raise ValueError("Unrecognized nowcast payload")
+        times, rows, _symbols = adapter.extract(payload)
+        for time, row in zip(times, rows):
+            rate = next((row[k] for k in RATE_KEYS if row.get(k) is not None), None)
+            if time is None or rate is None:
+                continue
+            stamp = int(time.timestamp())
+            slot = self._slot(stamp)
+            self._times[slot] = stamp
+            self._rates[slot] = float(rate)
+
+    def steps(self, now: datetime) -> list[tuple[datetime, float]]:
+        """Return the consecutive (start, mm/h) steps from `now` onwards."""
+        first = int(now.timestamp()) // _STEP_SECONDS * _STEP_SECONDS
+        result = []
+        for n in range(self._slots):
+            stamp = first + n * _STEP_SECONDS
+            slot = self._slot(stamp)
+            if self._times[slot] != stamp:
+                # The nowcast may only start at the next step
+                if n == 0:
+                    continue
+                break
+            result.append(
+                (datetime.fromtimestamp(stamp, timezone.utc), self._rates[slot])
+            )
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class NowcastSummary:
+    """The values shown by the nowcast entities."""
+
+    # Precipitation (mm) expected during the next hour
+    next_hour: float | None = None
+    # Start of the first step with precipitation, if any
+    starts_at: datetime | None = None
+    # Highest intensity (mm/h) of the nowcast
+    max_intensity: float | None = None
+
+
+def summarize(
+    steps: list[tuple[datetime, float]], threshold: float = NOWCAST_THRESHOLD
+) -> NowcastSummary:
+    """Summarize nowcast steps for the entities."""
+    if not steps:
+        return NowcastSummary()
+    hour = steps[: int(timedelta(hours=1) / NOWCAST_STEP)]
+    step_hours = NOWCAST_STEP / timedelta(hours=1)
+    return NowcastSummary(
+        next_hour=round(sum(rate for _, rate in hour) * step_hours, 2),
+        starts_at=next((t for t, rate in steps if rate >= threshold), None),
+        max_intensity=max(rate for _, rate in steps),
+    )
@@ -0,0 +1,77 @@
+"""SMHI open data products polled besides the point forecast.
+
+A product is one SMHI point endpoint with its refresh interval and a
+parser that turns its payload into an immutable result. Products are
+registered in `PRODUCTS`; the integration polls the enabled products of
+every location from one shared scheduler, HTTP client and disk cache, and
+parses all payloads of a poll in one executor job. Adding a product is a
+parser here plus its entities in the sensor platform.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+from typing import Any
+
+from .fire_risk import FIRE_RISK_URL, parse_fire_risk
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    """One SMHI point product."""
+
+    key: str
+    name: str
+    # URL template with {lat} and {lon}
+    url: str
+    interval: timedelta
+    parse: Callable[[Any], Any]
+
+    def url_for(self, lat: float, lon: float) -> str:
+        """Return the URL of a location."""
+        return self.url.format(lat=lat, lon=lon)
+
+
+# Product key -> product, in registration order
+PRODUCTS: dict[str, Product] = {}
+
+
+def register_product(product: Product) -> Product:
+    """Make a product available to the integration."""
+    if product.key in PRODUCTS:
+        raise ValueError(f"Product {product.key} is already registered")
+    PRODUCTS[product.key] = product
+    return product
+
+
+def parse_payloads(jobs: list[tuple[Product, Any]]) -> list:
+    """Parse payloads of any products in one go (runs in an executor).
+
+    A payload that does not parse yields None and is logged, so one bad
+    product does not fail the others.
+    """
+    results = []
+    for product, payload in jobs:
+        try:
+            results.append(product.parse(payload))
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Unusable %s payload from SMHI: %s", product.key, err)
+            results.append(None)
+    return results
+
+
+FIRE_RISK = register_product(
+    Product(
+        key="fire_risk",
+        name="Fire risk",
+        url=FIRE_RISK_URL,
+        # Issued a few times a day
+        interval=timedelta(hours=3),
+        parse=parse_fire_risk,
+    )
+)
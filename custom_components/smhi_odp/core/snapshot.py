@@ -0,0 +1,127 @@
+"""Immutable snapshots of a parsed forecast for other code to read.
+
+A snapshot is built once per forecast generation from the model that the
+entities already use. Every series is a tuple and every mapping is
+read-only, so one snapshot can be handed to any number of consumers
+without copying or re-parsing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from types import MappingProxyType
+
+from .model import PRECIPITATION_BANDS, SmhiForecast, SmhiView, condition_for
+
+
+@dataclass(frozen=True, slots=True)
+class HourlySeries:
+    """The forecast time series, column by column.
+
+    `values` maps SMHI parameter names (``air_temperature``, ...) to one
+    value per time step. `precipitation` maps the precipitation bands to
+    the amount (mm) that falls during each step, which is `step_hours`
+    long and ends at the step's time.
+    """
+
+    times: tuple[datetime, ...]
+    step_hours: tuple[float, ...]
+    values: Mapping[str, tuple]
+    precipitation: Mapping[str, tuple]
+    conditions: tuple[str | None, ...]
+
+    def __len__(self) -> int:
+        """Return the number of time steps."""
+        return len(self.times)
+
+
+@dataclass(frozen=True, slots=True)
+class DailySummary:
+    """One local day of the forecast."""
+
+    date: date
+    temperature_max: float | None
+    temperature_min: float | None
+    condition: str | None
+    # Total for the day in mm, with the ensemble spread
+    precipitation: float | None
+    precipitation_min: float | None
+    precipitation_median: float | None
+    precipitation_max: float | None
+    precipitation_probability: float | None
+    wind_bearing: float | None
+    wind_speed: float | None
+    # Fresh snow depth in cm and its water equivalent in mm
+    snowfall: float | None
+    snowfall_water_equivalent: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastSnapshot:
+    """Everything known about one location's forecast generation."""
+
+    entry_id: str
+    name: str | None
+    latitude: float
+    longitude: float
+    generation: int
+    reference_time: datetime | None
+    source: str | None
+    hourly: HourlySeries
+    daily: tuple[DailySummary, ...]
+
+
+def build_snapshot(
+    forecast: SmhiForecast,
+    view: SmhiView,
+    *,
+    entry_id: str,
+    name: str | None,
+    latitude: float,
+    longitude: float,
+    generation: int,
+) -> ForecastSnapshot:
+    """Freeze a parsed forecast and its daily aggregates."""
+    names = sorted({key for row in forecast.rows for key in row})
+    hourly = HourlySeries(
+        times=tuple(forecast.times),
+        step_hours=tuple(forecast.step_hours),
+        values=MappingProxyType(
+            {key: tuple(forecast.column(key)) for key in names}
+        ),
+        precipitation=MappingProxyType(
+            {band: tuple(forecast.amounts[band]) for band in PRECIPITATION_BANDS}
+        ),
+        conditions=tuple(condition_for(symbol) for symbol in forecast.symbols),
+    )
+    daily = tuple(
+        DailySummary(
+            date=date.fromisoformat(item["datetime"]),
+            temperature_max=item["native_temperature"],
+            temperature_min=item["native_templow"],
+            condition=item["condition"],
+            precipitation=item["native_precipitation"],
+            precipitation_min=item["precipitation_min"],
+            precipitation_median=item["precipitation_median"],
+            precipitation_max=item["precipitation_max"],
+            precipitation_probability=item["precipitation_probability"],
+            wind_bearing=item["wind_bearing"],
+            wind_speed=item["native_wind_speed"],
+            snowfall=item["snowfall"],
+            snowfall_water_equivalent=item["snowfall_water_equivalent"],
+        )
+        for item in view.daily_forecast
+    )
+    return ForecastSnapshot(
+        entry_id=entry_id,
+        name=name,
+        latitude=latitude,
+        longitude=longitude,
+        generation=generation,
+        reference_time=forecast.reference_time,
+        source=forecast.source,
+        hourly=hourly,
+        daily=daily,
+    )
@@ -0,0 +1,134 @@
+"""Snowfall and snowmelt derived from the precipitation forecast.
+
+The solid part of each time step's precipitation amount is its snowfall in
+mm water equivalent, which is also the added snow load in kg/m². The
+frozen part comes from `precipitation_frozen_part` where SMHI publishes it
+and from the air temperature otherwise. Fresh snow depth assumes the usual
+10:1 ratio of snow to water. Melt is a degree-day estimate: every degree
+above freezing melts `MELT_FACTOR` mm of water equivalent per day.
+
+Running accumulation adds each step's snowfall and subtracts its melt,
+never going below zero, so it estimates how much of the new snow is still
+lying at the end of a window.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# cm of fresh snow per mm of water equivalent (10:1 snow to water ratio)
+SNOW_DEPTH_RATIO = 1.0
+
+# mm water equivalent melted per °C above freezing per day
+MELT_FACTOR = 3.0
+
+# Without a frozen part, precipitation is all snow at or below the first
+# temperature (°C) and all rain at or above the second
+SNOW_TEMPERATURE = 0.0
+RAIN_TEMPERATURE = 2.0
+
+# Accumulation windows (hours from now)
+SNOW_WINDOWS = (24, 48, 72)
+
+
+@dataclass(frozen=True, slots=True)
+class SnowTotals:
+    """Snowfall, melt and remaining new snow over a period."""
+
+    # Snowfall in mm water equivalent (= kg/m² snow load)
+    snowfall: float
+    # Fresh snow depth in cm
+    depth: float
+    # Potential melt in mm water equivalent
+    melt: float
+    # New snow left at the end of the period, mm water equivalent
+    accumulation: float
+
+    def as_dict(self) -> dict:
+        """Return the totals as attribute data."""
+        return {
+            "snowfall_water_equivalent": self.snowfall,
+            "snow_depth": self.depth,
+            "melt": self.melt,
+            "accumulation": self.accumulation,
+        }
+
+
+def frozen_fractions(
+    frozen_parts: list, temperatures: list
+) -> list[float | None]:
+    """Return the frozen fraction (0-1) of the precipitation of each step.
+
+    `frozen_parts` are fractions (the adapters convert pmp3g's percentages),
+    with negative fill values for unknown steps.
+    """
+    fractions = []
+    for part, temperature in zip(frozen_parts, temperatures):
+        if part is not None and part >= 0:
+            fractions.append(min(part, 1.0))
+        elif temperature is None:
+            fractions.append(None)
+        elif temperature <= SNOW_TEMPERATURE:
+            fractions.append(1.0)
+        elif temperature >= RAIN_TEMPERATURE:
+            fractions.append(0.0)
+        else:
+            fractions.append(
+                (RAIN_TEMPERATURE - temperature)
+                / (RAIN_TEMPERATURE - SNOW_TEMPERATURE)
+            )
+    return fractions
+
+
+def snowfall_amounts(
+    amounts: list, frozen_parts: list, temperatures: list
+) -> list[float | None]:
+    """Return the snowfall (mm water equivalent) of each step."""
+    return [
+        amount * fraction if amount is not None and fraction is not None else None
+        for amount, fraction in zip(
+            amounts, frozen_fractions(frozen_parts, temperatures)
+        )
+    ]
+
+
+def melt_amounts(temperatures: list, step_hours: list[float]) -> list[float | None]:
+    """Return the potential melt (mm water equivalent) of each step."""
+    return [
+        max(temperature - SNOW_TEMPERATURE, 0.0) * MELT_FACTOR * step / 24
+        if temperature is not None
+        else None
+        for temperature, step in zip(temperatures, step_hours)
+    ]
+
+
+def totals(snowfall: list, melt: list) -> SnowTotals:
+    """Sum some steps' snowfall and melt and run the accumulation."""
+    total_snow = total_melt = accumulation = 0.0
+    for snow, melted in zip(snowfall, melt):
+        snow = snow or 0.0
+        melted = melted or 0.0
+        total_snow += snow
+        total_melt += melted
+        accumulation = max(accumulation + snow - melted, 0.0)
+    return SnowTotals(
+        snowfall=round(total_snow, 1),
+        depth=round(total_snow * SNOW_DEPTH_RATIO, 1),
+        melt=round(total_melt, 1),
+        accumulation=round(accumulation, 1),
+    )
+
+
+def window_totals(
+    times: list[datetime],
+    snowfall: list,
+    melt: list,
+    now: datetime,
+    hours: int,
+) -> SnowTotals:
+    """Return the totals of the steps ending within some hours from now."""
+    first = bisect_right(times, now)
+    last = bisect_right(times, now + timedelta(hours=hours))
+    return totals(snowfall[first:last], melt[first:last])
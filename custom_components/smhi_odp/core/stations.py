@@ -0,0 +1,164 @@
+"""SMHI metobs station catalog, spatial index and latest-hour readings.
+
+The station catalog of a metobs parameter is loaded once and indexed in a
+grid of 1° cells, so the nearest active stations of a location are found
+by looking at a few neighbouring cells instead of every station in Sweden.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import math
+
+METOBS_URL = "https://opendata-download-metobs.smhi.se/api/version/1.0"
+STATIONS_URL = METOBS_URL + "/parameter/{parameter}.json"
+LATEST_HOUR_URL = (
+    METOBS_URL + "/parameter/{parameter}/station-set/all/period/latest-hour/data.json"
+)
+
+# Current condition sensor key -> metobs parameter id
+OBSERVATION_PARAMETERS = {
+    "temperature": 1,  # Air temperature, momentary, once per hour
+    "humidity": 6,  # Relative humidity, momentary, once per hour
+    "wind_speed": 4,  # Wind speed, mean 10 min, once per hour
+    "wind_direction": 3,  # Wind direction, mean 10 min, once per hour
+    "pressure": 9,  # Air pressure reduced to sea level, once per hour
+    "precipitation": 7,  # Precipitation amount, sum 1 hour
+}
+
+# Number of nearest stations kept per location, tried in order
+NEAREST_STATIONS = 3
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance between two points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+@dataclass(frozen=True, slots=True)
+class Station:
+    """An active metobs station."""
+
+    key: str
+    name: str
+    latitude: float
+    longitude: float
+
+
+@dataclass(frozen=True, slots=True)
+class Reading:
+    """The latest value reported by a station."""
+
+    time: datetime
+    value: float
+
+
+def parse_stations(payload: dict) -> list[Station]:
+    """Return the active stations of a metobs parameter catalog."""
+    stations = []
+    for item in payload.get("station") or ():
+        if not item.get("active"):
+            continue
+        try:
+            stations.append(
+                Station(
+                    str(item["key"]),
+                    item.get("name", ""),
+                    float(item["latitude"]),
+                    float(item["longitude"]),
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return stations
+
+
+def parse_latest(payload: dict) -> dict[str, Reading]:
+    """Return the latest reading per station key of a station-set payload."""
+    readings = {}
+    for item in payload.get("station") or ():
+        values = item.get("value") or ()
+        if not values:
+            continue
+        latest = values[-1]
+        try:
+            readings[str(item["key"])] = Reading(
+                datetime.fromtimestamp(latest["date"] / 1000, timezone.utc),
+                float(latest["value"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return readings
+
+
+class StationIndex:
+    """A uniform lat/lon grid of stations for nearest-neighbour lookups."""
+
+    def __init__(self, stations: list[Station], cell_degrees: float = 1.0) -> None:
+        """Bucket the stations by grid cell."""
+        self.cell = cell_degrees
+        self._cells: dict[tuple[int, int], list[Station]] = {}
+        for station in stations:
+            cell = self._cell_of(station.latitude, station.longitude)
+            self._cells.setdefault(cell, []).append(station)
+
+    def __len__(self) -> int:
+        """Return the number of indexed stations."""
+        return sum(len(stations) for stations in self._cells.values())
+
+    def _cell_of(self, lat: float, lon: float) -> tuple[int, int]:
+        """Return the grid cell containing a point."""
+        return math.floor(lat / self.cell), math.floor(lon / self.cell)
+
+    def _ring(self, center: tuple[int, int], radius: int) -> list[Station]:
+        """Return the stations in the cells exactly `radius` cells away."""
+        row, col = center
+        stations = []
+        for r in range(row - radius, row + radius + 1):
+            for c in range(col - radius, col + radius + 1):
+                if max(abs(r - row), abs(c - col)) == radius:
+                    stations.extend(self._cells.get((r, c), ()))
+        return stations
+
+    def nearest(
+        self, lat: float, lon: float, count: int = NEAREST_STATIONS
+    ) -> list[tuple[Station, float]]:
+        """Return up to `count` (station, distance in km) pairs, nearest first.
+
+        Rings of cells are visited outwards until the next ring cannot hold
+        anything closer than the current `count`-th candidate.
+        """
+        if not self._cells:
+            return []
+        center = self._cell_of(lat, lon)
+        max_radius = max(
+            max(abs(r - center[0]), abs(c - center[1])) for r, c in self._cells
+        )
+        candidates: list[tuple[Station, float]] = []
+        for radius in range(max_radius + 1):
+            candidates.extend(
+                (station, distance_km(lat, lon, station.latitude, station.longitude))
+                for station in self._ring(center, radius)
+            )
+            candidates.sort(key=lambda pair: pair[1])
+            if len(candidates) >= count:
+                # Anything in the next ring is at least `radius` full cells
+                # away; a longitude degree is shortest at the poleward edge
+                edge_lat = min(abs(lat) + (radius + 1) * self.cell, 89.9)
+                cell_km = (
+                    math.pi / 180 * EARTH_RADIUS_KM * self.cell
+                    * math.cos(math.radians(edge_lat))
+                )
+                if radius * cell_km >= candidates[count - 1][1]:
+                    break
+        return candidates[:count]
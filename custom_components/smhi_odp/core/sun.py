@@ -0,0 +1,80 @@
+"""Sunrise, sunset and night windows from a location and date.
+
+Uses the sunrise equation with the usual corrections for the equation of
+time, the apparent solar disc and refraction, which is accurate to a
+minute or two across the SMHI forecast area. It is plain arithmetic, so
+the nights of a location are computed without astral or network access.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from math import acos, asin, cos, degrees, radians, sin
+
+# Sun altitude (degrees) at sunrise and sunset: the solar disc's radius
+# and atmospheric refraction
+SUN_ALTITUDE = -0.833
+
+# Axial tilt of the Earth (degrees)
+OBLIQUITY = 23.4397
+
+# Julian date of 2000-01-01 12:00 UTC
+J2000 = 2451545.0
+_J2000_TIME = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+
+# Local evening and morning bounding the night where the sun does not set
+# or does not rise
+FALLBACK_DUSK = time(18)
+FALLBACK_DAWN = time(6)
+
+
+def _julian_to_datetime(julian: float) -> datetime:
+    """Convert a Julian date to a UTC datetime."""
+    return _J2000_TIME + timedelta(days=julian - J2000)
+
+
+def sun_times(
+    day: date, latitude: float, longitude: float
+) -> tuple[datetime | None, datetime | None]:
+    """Return the UTC sunrise and sunset of a day.
+
+    Both are None during midnight sun and polar night.
+    """
+    # Mean solar noon, days from J2000
+    noon = (day - date(2000, 1, 1)).days - longitude / 360
+    anomaly = (357.5291 + 0.98560028 * noon) % 360
+    m = radians(anomaly)
+    center = 1.9148 * sin(m) + 0.0200 * sin(2 * m) + 0.0003 * sin(3 * m)
+    ecliptic = radians((anomaly + center + 180 + 102.9372) % 360)
+    transit = J2000 + noon + 0.0053 * sin(m) - 0.0069 * sin(2 * ecliptic)
+
+    declination = asin(sin(ecliptic) * sin(radians(OBLIQUITY)))
+    lat = radians(latitude)
+    cos_hour_angle = (sin(radians(SUN_ALTITUDE)) - sin(lat) * sin(declination)) / (
+        cos(lat) * cos(declination)
+    )
+    if not -1 <= cos_hour_angle <= 1:
+        return None, None
+    half_day = degrees(acos(cos_hour_angle)) / 360
+    return (
+        _julian_to_datetime(transit - half_day),
+        _julian_to_datetime(transit + half_day),
+    )
+
+
+def night_window(
+    day: date, latitude: float, longitude: float, tz: tzinfo
+) -> tuple[datetime, datetime]:
+    """Return the night that starts in the evening of a local day.
+
+    The night runs from the day's sunset to the next day's sunrise, or
+    between fixed local hours when the sun does not set or rise.
+    """
+    _, sunset = sun_times(day, latitude, longitude)
+    sunrise, _ = sun_times(day + timedelta(days=1), latitude, longitude)
+    if sunset is None or sunrise is None:
+        return (
+            datetime.combine(day, FALLBACK_DUSK, tz),
+            datetime.combine(day + timedelta(days=1), FALLBACK_DAWN, tz),
+        )
+    return sunset, sunrise
@@ -0,0 +1,215 @@
+"""SMHI impact-based weather warnings and their spatial index.
+
+The national feed lists every warning with one or more warning areas, each
+a GeoJSON polygon. The areas are packed into a static R-tree of bounding
+boxes once per download; a location is matched by walking only the boxes
+that contain it and running an exact point-in-polygon test on those.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import math
+
+from .adapters import parse_time
+
+WARNINGS_URL = "https://opendata-download-warnings.smhi.se/ibww/api/version/1/warning.json"
+
+# Warning level codes, from least to most severe
+WARNING_LEVELS = ("MESSAGE", "YELLOW", "ORANGE", "RED")
+
+# Maximum children of an R-tree node
+NODE_CAPACITY = 8
+
+# A polygon is a list of rings (exterior first, then holes) of (lon, lat)
+Polygon = list[list[tuple[float, float]]]
+BBox = tuple[float, float, float, float]  # min_lon, min_lat, max_lon, max_lat
+
+
+@dataclass(frozen=True, slots=True)
+class WarningArea:
+    """One area of a warning, with the details shown on the entities."""
+
+    warning_id: str
+    event: str
+    level: str
+    area_name: str
+    description: str
+    start: datetime | None
+    end: datetime | None
+    polygons: tuple
+    bbox: BBox
+
+    @property
+    def is_warning(self) -> bool:
+        """Return False for informational messages, which warn of nothing."""
+        return self.level != WARNING_LEVELS[0]
+
+    def is_active(self, now: datetime) -> bool:
+        """Return True if the warning applies at the given time."""
+        return (self.start is None or self.start <= now) and (
+            self.end is None or now < self.end
+        )
+
+    def as_dict(self, now: datetime) -> dict:
+        """Return the attributes of this area for an entity."""
+        return {
+            "event": self.event,
+            "level": self.level,
+            "area": self.area_name,
+            "description": self.description,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "active": self.is_active(now),
+        }
+
+
+def _text(value, language: str = "en") -> str:
+    """Return the text of a {sv, en, code} object or a plain string."""
+    if isinstance(value, dict):
+        return value.get(language) or value.get("sv") or value.get("code") or ""
+    return str(value) if value is not None else ""
+
+
+def _polygons(geojson) -> list[Polygon]:
+    """Return the polygons of a GeoJSON geometry, feature or collection."""
+    if not isinstance(geojson, dict):
+        return []
+    kind = geojson.get("type")
+    if kind == "FeatureCollection":
+        return [p for f in geojson.get("features", ()) for p in _polygons(f)]
+    if kind == "Feature":
+        return _polygons(geojson.get("geometry"))
+    if kind == "GeometryCollection":
+        return [p for g in geojson.get("geometries", ()) for p in _polygons(g)]
+    if kind == "Polygon":
+        return [[[(float(x), float(y)) for x, y, *_ in ring] for ring in geojson["coordinates"]]]
+    if kind == "MultiPolygon":
+        return [
+            [[(float(x), float(y)) for x, y, *_ in ring] for ring in polygon]
+            for polygon in geojson["coordinates"]
+        ]
+    return []
+
+
+def _bbox(polygons: list[Polygon]) -> BBox:
+    """Return the bounding box of the exterior rings of some polygons."""
+    xs = [x for polygon in polygons for x, _ in polygon[0]]
+    ys = [y for polygon in polygons for _, y in polygon[0]]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def parse_warnings(payload) -> list[WarningArea]:
+    """Flatten the warnings feed into warning areas with geometry."""
+    areas = []
+    for warning in payload or ():
+        event = _text(warning.get("event"))
+        for area in warning.get("warningAreas") or ():
+            try:
+                polygons = _polygons(area.get("area"))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not polygons:
+                continue
+            level = area.get("warningLevel") or {}
+            areas.append(
+                WarningArea(
+                    warning_id=str(warning.get("id", "")),
+                    event=event,
+                    level=(level.get("code") if isinstance(level, dict) else None) or "",
+                    area_name=_text(area.get("areaName")),
+                    description=_text(area.get("eventDescription")),
+                    start=parse_time(area.get("approximateStart")),
+                    end=parse_time(area.get("approximateEnd")),
+                    polygons=tuple(polygons),
+                    bbox=_bbox(polygons),
+                )
+            )
+    return areas
+
+
+def _in_ring(lon: float, lat: float, ring: list[tuple[float, float]]) -> bool:
+    """Ray casting test of a point against one ring."""
+    inside = False
+    j = len(ring) - 1
+    for i, (xi, yi) in enumerate(ring):
+        xj, yj = ring[j]
+        if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def point_in_polygon(lon: float, lat: float, polygon: Polygon) -> bool:
+    """Return True if a point is inside the exterior ring and no hole."""
+    if not _in_ring(lon, lat, polygon[0]):
+        return False
+    return not any(_in_ring(lon, lat, hole) for hole in polygon[1:])
+
+
+def _contains(bbox: BBox, lon: float, lat: float) -> bool:
+    """Return True if a bounding box contains a point."""
+    return bbox[0] <= lon <= bbox[2] and bbox[1] <= lat <= bbox[3]
+
+
+def _union(boxes: list[BBox]) -> BBox:
+    """Return the bounding box of some boxes."""
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    )
+
+
+class WarningIndex:
+    """A static, Sort-Tile-Recursive packed R-tree of warning areas."""
+
+    def __init__(self, areas: list[WarningArea]) -> None:
+        """Pack the areas' bounding boxes into a tree, bottom up."""
+        self.areas = areas
+        # A node is (bbox, children, is_leaf); leaf children are area indexes
+        level = [(area.bbox, [i], True) for i, area in enumerate(areas)]
+        while len(level) > 1:
+            level = self._pack(level)
+        self._root = level[0] if level else None
+
+    @staticmethod
+    def _pack(nodes: list) -> list:
+        """Group nodes into parents of at most NODE_CAPACITY children."""
+        parent_count = math.ceil(len(nodes) / NODE_CAPACITY)
+        slices = math.ceil(math.sqrt(parent_count))
+        by_x = sorted(nodes, key=lambda n: (n[0][0] + n[0][2]) / 2)
+        slice_size = slices * NODE_CAPACITY
+        parents = []
+        for s in range(0, len(by_x), slice_size):
+            column = sorted(by_x[s : s + slice_size], key=lambda n: (n[0][1] + n[0][3]) / 2)
+            for c in range(0, len(column), NODE_CAPACITY):
+                children = column[c : c + NODE_CAPACITY]
+                parents.append((_union([n[0] for n in children]), children, False))
+        return parents
+
+    def lookup(self, lat: float, lon: float) -> list[WarningArea]:
+        """Return the warning areas containing a location."""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            bbox, children, is_leaf = stack.pop()
+            if not _contains(bbox, lon, lat):
+                continue
+            if is_leaf:
+                area = self.areas[children[0]]
+                if any(point_in_polygon(lon, lat, p) for p in area.polygons):
+                    found.append(area)
+            else:
+                stack.extend(children)
+        return found
+
+
+def highest_level(areas: list[WarningArea]) -> str | None:
+    """Return the most severe level among some warning areas."""
+    ranks = [WARNING_LEVELS.index(a.level) for a in areas if a.level in WARNING_LEVELS]
+    return WARNING_LEVELS[max(ranks)].lower() if ranks else None
@@ -0,0 +1,234 @@
+"""Best time windows for outdoor tasks, scored over the forecast.
+
+A window is a run of consecutive time steps covering exactly the wanted
+number of hours, so windows follow the hourly steps at first and the
+longer steps later on. Every candidate window is scored from its mean
+temperature, humidity and wind and its precipitation total, weighted by
+the caller, and windows breaking a threshold on their worst step are
+left out.
+
+All windows are evaluated in one pass: the step ranges come from two
+pointers that only move forward, sums and means from prefix sums, and
+the worst step of each window from monotonic deques, so the cost grows
+linearly with the forecast length whatever the window size.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+from .model import SmhiForecast
+
+
+@dataclass(frozen=True, slots=True)
+class WindowCriteria:
+    """Weights and thresholds of a window search.
+
+    A window's score is the sum of each weight times its value: points per
+    °C of mean temperature, minus points per mm of precipitation, per % of
+    mean relative humidity and per m/s of mean wind speed.
+    """
+
+    temperature_weight: float = 0.5
+    precipitation_weight: float = 10.0
+    humidity_weight: float = 0.1
+    wind_weight: float = 1.0
+    # Thresholds on the whole window (precipitation) or its worst step
+    max_precipitation: float | None = None
+    max_humidity: float | None = None
+    max_wind_speed: float | None = None
+    min_temperature: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TimeWindow:
+    """One scored window of the forecast."""
+
+    start: datetime
+    end: datetime
+    score: float
+    temperature: float
+    temperature_min: float
+    # Total in mm
+    precipitation: float
+    humidity: float
+    humidity_max: float
+    wind_speed: float
+    wind_speed_max: float
+
+    def as_dict(self) -> dict:
+        """Return the window as service response data."""
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "score": self.score,
+            "temperature": self.temperature,
+            "temperature_min": self.temperature_min,
+            "precipitation": self.precipitation,
+            "humidity": self.humidity,
+            "humidity_max": self.humidity_max,
+            "wind_speed": self.wind_speed,
+            "wind_speed_max": self.wind_speed_max,
+        }
+
+
+def window_bounds(step_hours: list[float], hours: float) -> list[tuple[int, int]]:
+    """Return the (start, end) step ranges covering exactly some hours."""
+    bounds = []
+    end = 0
+    covered = 0.0
+    for start in range(len(step_hours)):
+        while end < len(step_hours) and covered < hours:
+            covered += step_hours[end]
+            end += 1
+        if covered == hours:
+            bounds.append((start, end))
+        covered -= step_hours[start]
+    return bounds
+
+
+def sliding_max(values: list[float], bounds: list[tuple[int, int]]) -> list[float]:
+    """Return the largest value of each range.
+
+    The ranges must be ordered with both ends never moving backwards, as
+    `window_bounds` returns them.
+    """
+    window: deque[int] = deque()
+    result = []
+    added = 0
+    for start, end in bounds:
+        for i in range(added, end):
+            while window and values[window[-1]] <= values[i]:
+                window.pop()
+            window.append(i)
+        added = max(added, end)
+        while window[0] < start:
+            window.popleft()
+        result.append(values[window[0]])
+    return result
+
+
+def _prefix(values: list[float]) -> list[float]:
+    """Return the running sums of some values, starting at zero."""
+    return list(accumulate(values, initial=0.0))
+
+
+def find_windows(
+    forecast: SmhiForecast,
+    now: datetime,
+    hours: float,
+    horizon: float,
+    count: int,
+    criteria: WindowCriteria = WindowCriteria(),
+) -> list[TimeWindow]:
+    """Return the best non-overlapping windows starting within the horizon.
+
+    Windows are ranked by score, best first. They start no earlier than
+    `now`, so the step under way is left out, and windows with a missing
+    value in any step are not scored.
+    """
+    first = bisect_right(forecast.times, now)
+    last = bisect_right(forecast.times, now + timedelta(hours=horizon + hours))
+    steps = forecast.step_hours[first:last]
+    columns = {
+        name: forecast.column(name)[first:last]
+        for name in ("air_temperature", "relative_humidity", "wind_speed")
+    }
+    amounts = forecast.amounts["precipitation"][first:last]
+
+    missing = _prefix(
+        [
+            float(any(column[i] is None for column in columns.values()))
+            + float(amounts[i] is None)
+            for i in range(len(steps))
+        ]
+    )
+    # Gaps are zero-filled; windows touching them are dropped below
+    filled = {
+        name: [value if value is not None else 0.0 for value in column]
+        for name, column in columns.items()
+    }
+    weighted = {
+        name: _prefix([value * step for value, step in zip(column, steps)])
+        for name, column in filled.items()
+    }
+    rain = _prefix([amount or 0.0 for amount in amounts])
+
+    bounds = window_bounds(steps, hours)
+    lowest_temperature = [
+        -value
+        for value in sliding_max(
+            [-value for value in filled["air_temperature"]], bounds
+        )
+    ]
+    highest_humidity = sliding_max(filled["relative_humidity"], bounds)
+    highest_wind = sliding_max(filled["wind_speed"], bounds)
+
+    candidates = []
+    for n, (start, end) in enumerate(bounds):
+        window_start = forecast.times[first + start] - timedelta(hours=steps[start])
+        if (
+            missing[end] - missing[start]
+            or window_start < now
+            or window_start >= now + timedelta(hours=horizon)
+        ):
+            continue
+        mean = {
+            name: (prefix[end] - prefix[start]) / hours
+            for name, prefix in weighted.items()
+        }
+        precipitation = rain[end] - rain[start]
+        if (
+            (
+                criteria.max_precipitation is not None
+                and precipitation > criteria.max_precipitation
+            )
+            or (
+                criteria.max_humidity is not None
+                and highest_humidity[n] > criteria.max_humidity
+            )
+            or (
+                criteria.max_wind_speed is not None
+                and highest_wind[n] > criteria.max_wind_speed
+            )
+            or (
+                criteria.min_temperature is not None
+                and lowest_temperature[n] < criteria.min_temperature
+            )
+        ):
+            continue
+        score = (
+            criteria.temperature_weight * mean["air_temperature"]
+            - criteria.precipitation_weight * precipitation
+            - criteria.humidity_weight * mean["relative_humidity"]
+            - criteria.wind_weight * mean["wind_speed"]
+        )
+        candidates.append(
+            TimeWindow(
+                start=window_start,
+                end=forecast.times[first + end - 1],
+                score=round(score, 2),
+                temperature=round(mean["air_temperature"], 1),
+                temperature_min=lowest_temperature[n],
+                precipitation=round(precipitation, 1),
+                humidity=round(mean["relative_humidity"]),
+                humidity_max=highest_humidity[n],
+                wind_speed=round(mean["wind_speed"], 1),
+                wind_speed_max=highest_wind[n],
+            )
+        )
+
+    candidates.sort(key=lambda window: (-window.score, window.start))
+    best: list[TimeWindow] = []
+    for window in candidates:
+        if len(best) == count:
+            break
+        if all(
+            window.end <= other.start or window.start >= other.end for other in best
+        ):
+            best.append(window)
+    return best
@@ -0,0 +1,137 @@
+"""HTTP export of every location's forecast series for metrics databases.
+
+`GET /api/smhi_odp/metrics` returns OpenMetrics text for Prometheus and
+VictoriaMetrics, and `?format=influx` InfluxDB line protocol. Like the
+rest of the API it needs a long-lived access token.
+
+The series are rendered from the published snapshots (see api.py) and
+cached as encoded bytes until the location's next forecast generation,
+so a scrape only renders the locations that changed since the last one,
+in one executor job, and streams the cached parts. The refresh timings
+are small and rendered on every request.
+"""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .api import async_get_snapshots
+from .const import DOMAIN
+from .core.export import (
+    LINE_PROTOCOL_CONTENT_TYPE,
+    OPENMETRICS_CONTENT_TYPE,
+    Timings,
+    line_protocol,
+    openmetrics_families,
+    render_openmetrics,
+    timings_line_protocol,
+)
+from .core.snapshot import ForecastSnapshot
+
+FORMAT_OPENMETRICS = "openmetrics"
+FORMAT_INFLUX = "influx"
+
+
+class _Rendered:
+    """Encoded export of one snapshot."""
+
+    __slots__ = ("snapshot", "families", "lines")
+
+    def __init__(self, snapshot: ForecastSnapshot) -> None:
+        """Render a snapshot in both formats (runs in the executor)."""
+        self.snapshot = snapshot
+        self.families = openmetrics_families(snapshot)
+        self.lines = line_protocol(snapshot)
+
+
+class SmhiMetricsView(HomeAssistantView):
+    """Serve the forecast series of all locations."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self) -> None:
+        """Initialize the per-generation render cache."""
+        self._rendered: dict[str, _Rendered] = {}
+
+    async def _async_rendered(self, hass: HomeAssistant) -> list[_Rendered]:
+        """Return the rendering of every current snapshot.
+
+        Locations whose snapshot is unchanged reuse their cached bytes, and
+        unloaded locations are dropped from the cache.
+        """
+        snapshots = async_get_snapshots(hass)
+        stale = [
+            snapshot
+            for entry_id, snapshot in snapshots.items()
+            if (rendered := self._rendered.get(entry_id)) is None
+            or rendered.snapshot is not snapshot
+        ]
+        if stale:
+            fresh = await hass.async_add_executor_job(
+                lambda: [_Rendered(snapshot) for snapshot in stale]
+            )
+            for item in fresh:
+                self._rendered[item.snapshot.entry_id] = item
+        for entry_id in self._rendered.keys() - snapshots.keys():
+            del self._rendered[entry_id]
+        return [
+            self._rendered[entry_id]
+            for entry_id in snapshots
+            if entry_id in self._rendered
+        ]
+
+    @staticmethod
+    def _timings(hass: HomeAssistant, rendered: list[_Rendered]) -> list[Timings]:
+        """Return the refresh timings of the rendered locations."""
+        timings = []
+        for item in rendered:
+            snapshot = item.snapshot
+            coordinator = hass.data[DOMAIN].get(snapshot.entry_id)
+            timings.append(
+                Timings(
+                    entry_id=snapshot.entry_id,
+                    name=snapshot.name,
+                    generation=snapshot.generation,
+                    fetch=getattr(coordinator, "fetch_duration", None),
+                    parse=getattr(coordinator, "parse_duration", None),
+                )
+            )
+        return timings
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream the series in the requested format."""
+        hass = request.app[KEY_HASS]
+        output = request.query.get("format", FORMAT_OPENMETRICS)
+        if output not in (FORMAT_OPENMETRICS, FORMAT_INFLUX):
+            return self.json_message(f"Unknown format {output}", HTTPStatus.BAD_REQUEST)
+
+        rendered = await self._async_rendered(hass)
+        timings = self._timings(hass, rendered)
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": (
+                    LINE_PROTOCOL_CONTENT_TYPE
+                    if output == FORMAT_INFLUX
+                    else OPENMETRICS_CONTENT_TYPE
+                )
+            }
+        )
+        await response.prepare(request)
+
+        if output == FORMAT_INFLUX:
+            for item in rendered:
+                await response.write(item.lines)
+            await response.write(timings_line_protocol(timings))
+        else:
+            for chunk in render_openmetrics(
+                (item.families for item in rendered), timings
+            ):
+                await response.write(chunk)
+        await response.write_eof()
+        return response
@@ -0,0 +1,68 @@
+"""Coordinator polling the SMHI precipitation nowcast of one location.
+
+The nowcast is polled every few minutes with conditional requests, so an
+unchanged nowcast costs a 304 without a body. Entities are only notified
+when the derived summary changes.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+
+import httpx
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import httpx_client
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .core.client import SmhiClient
+from .core.nowcast import NOWCAST_URL, NowcastBuffer, NowcastSummary, summarize
+
+_LOGGER = logging.getLogger(__name__)
+
+# The nowcast is issued every 15 minutes; polling more often than that
+# picks up a new issue sooner and is cheap thanks to conditional requests
+NOWCAST_INTERVAL = timedelta(minutes=5)
+
+
+class SmhiNowcastCoordinator(DataUpdateCoordinator[NowcastSummary]):
+    """Poll the precipitation nowcast of a config entry's location."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        self.entry = entry
+        lat = entry.data.get(CONF_LATITUDE)
+        lon = entry.data.get(CONF_LONGITUDE)
+        self.client = SmhiClient(httpx_client.get_async_client(hass))
+        self.url = NOWCAST_URL.format(lat=lat, lon=lon)
+        self.buffer = NowcastBuffer()
+        # ETag / Last-Modified of the last response, sent back to get a 304
+        self._validators: dict[str, str] = {}
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_nowcast",
+            update_interval=NOWCAST_INTERVAL,
+            # Equal summaries do not notify the entities
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> NowcastSummary:
+        """Fetch the nowcast if it changed and summarize it."""
+        try:
+            payload, self._validators = await self.client.get_json_if_modified(
+                self.url, self._validators
+            )
+            if payload is not None:
+                self.buffer.update(payload)
+        except (httpx.HTTPError, ValueError) as err:
+            raise UpdateFailed(f"Error fetching SMHI nowcast: {err}") from err
+
+        # Re-summarize even on a 304, as steps that passed drop out
+        return summarize(self.buffer.steps(dt_util.utcnow()))
@@ -0,0 +1,162 @@
+"""Real-time observations from the nearest SMHI metobs stations.
+
+One coordinator is shared by all config entries that enable observations.
+It loads each parameter's station catalog once, and per refresh fetches the
+latest hour of every station with a single station-set request per
+parameter, regardless of how many locations use it. The nearest stations
+of each location are looked up in the spatial index once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+
+import httpx
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import httpx_client
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .core.client import SmhiClient
+from .core.model import EntityValue, SmhiView
+from .core.stations import (
+    LATEST_HOUR_URL,
+    OBSERVATION_PARAMETERS,
+    STATIONS_URL,
+    Reading,
+    Station,
+    StationIndex,
+    parse_latest,
+    parse_stations,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# metobs publishes the latest hour shortly after each full hour
+OBSERVATIONS_INTERVAL = timedelta(minutes=30)
+
+# Readings older than this are ignored in favour of the forecast
+OBSERVATION_MAX_AGE = timedelta(hours=2)
+
+
+class SmhiObservationsCoordinator(DataUpdateCoordinator):
+    """Fetch the latest metobs readings once for all config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coordinator."""
+        self.client = SmhiClient(httpx_client.get_async_client(hass))
+        # Station index per sensor key, built once from the catalogs
+        self._indexes: dict[str, StationIndex] = {}
+        # Registered locations and their nearest stations per sensor key
+        self._locations: dict[str, tuple[float, float]] = {}
+        self._nearest: dict[str, dict[str, list[tuple[Station, float]]]] = {}
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_observations",
+            update_interval=OBSERVATIONS_INTERVAL,
+        )
+
+    @callback
+    def async_register(self, entry_id: str, lat: float, lon: float) -> None:
+        """Add a location to look up the nearest stations for."""
+        self._locations[entry_id] = (lat, lon)
+        self._nearest.pop(entry_id, None)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Remove a location. Returns True if no locations remain."""
+        self._locations.pop(entry_id, None)
+        self._nearest.pop(entry_id, None)
+        return not self._locations
+
+    async def _async_load_catalogs(self) -> None:
+        """Load and index the station catalogs that are not loaded yet."""
+        missing = [key for key in OBSERVATION_PARAMETERS if key not in self._indexes]
+        if not missing:
+            return
+        payloads = await asyncio.gather(
+            *(
+                self.client.get_json(
+                    STATIONS_URL.format(parameter=OBSERVATION_PARAMETERS[key])
+                )
+                for key in missing
+            )
+        )
+        for key, payload in zip(missing, payloads):
+            self._indexes[key] = StationIndex(parse_stations(payload))
+
+    def _stations_for(self, entry_id: str) -> dict[str, list[tuple[Station, float]]]:
+        """Return the nearest stations of a location, looked up once."""
+        nearest = self._nearest.get(entry_id)
+        if nearest is None and entry_id in self._locations:
+            lat, lon = self._locations[entry_id]
+            nearest = self._nearest[entry_id] = {
+                key: index.nearest(lat, lon) for key, index in self._indexes.items()
+            }
+        return nearest or {}
+
+    async def _async_update_data(self) -> dict[str, dict[str, Reading]]:
+        """Fetch the latest hour of all stations, one request per parameter.
+
+        The station-set covers every station, so locations registered later
+        are served from the same data without another download.
+        """
+        try:
+            await self._async_load_catalogs()
+            payloads = await asyncio.gather(
+                *(
+                    self.client.get_json(LATEST_HOUR_URL.format(parameter=parameter))
+                    for parameter in OBSERVATION_PARAMETERS.values()
+                )
+            )
+        except (httpx.HTTPError, ValueError) as err:
+            raise UpdateFailed(f"Error fetching SMHI observations: {err}") from err
+
+        return {
+            key: parse_latest(payload)
+            for key, payload in zip(OBSERVATION_PARAMETERS, payloads)
+        }
+
+    def readings_for(self, entry_id: str) -> dict[str, tuple[Station, float, Reading]]:
+        """Return the freshest reading of the nearest reporting station per key."""
+        if not self.data:
+            return {}
+        oldest = dt_util.utcnow() - OBSERVATION_MAX_AGE
+        result = {}
+        for key, stations in self._stations_for(entry_id).items():
+            readings = self.data.get(key, {})
+            for station, distance in stations:
+                reading = readings.get(station.key)
+                if reading is not None and reading.time >= oldest:
+                    result[key] = (station, distance, reading)
+                    break
+        return result
+
+
+def apply_observations(
+    view: SmhiView, readings: dict[str, tuple[Station, float, Reading]]
+) -> None:
+    """Replace current forecast values in a view with observed ones.
+
+    The forecast value stays available in the `forecast` attribute.
+    """
+    for key, (station, distance, reading) in readings.items():
+        forecast_value = view.value(key)
+        view.entities[key] = EntityValue(
+            reading.value,
+            {
+                **(forecast_value.attributes or {}),
+                "source": "observation",
+                "station": station.name,
+                "station_id": station.key,
+                "distance_km": round(distance, 1),
+                "observed_at": reading.time.isoformat(),
+                "forecast": forecast_value.native_value,
+            },
+        )
@@ -0,0 +1,199 @@
+"""Coordinator polling the optional SMHI products of every location.
+
+One coordinator is shared by all config entries that enable a product, so
+more products do not add timers or connections. Every tick fetches only
+the (product, location) pairs that are due, once per distinct URL, through
+Home Assistant's shared HTTP client and a disk cache that survives
+restarts, and parses everything the tick loaded in one executor job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import timedelta
+import logging
+from pathlib import Path
+import time
+from typing import Any
+
+import httpx
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import httpx_client
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .core.cache import DiskCache
+from .core.client import SmhiClient
+from .core.products import PRODUCTS, Product, parse_payloads
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often due products are looked for; each product has its own interval
+PRODUCTS_TICK = timedelta(minutes=5)
+
+# (product, entry ID, latitude, longitude) of one poll
+_Job = tuple[Product, str, float, float]
+
+
+class SmhiProductsCoordinator(DataUpdateCoordinator[dict[tuple[str, str], Any]]):
+    """Poll every enabled product of every location from one scheduler.
+
+    The data maps (product key, entry ID) to the product's parsed result.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coordinator."""
+        self.client = SmhiClient(httpx_client.get_async_client(hass))
+        self.cache_dir = Path(hass.config.path(".storage", f"{DOMAIN}.cache"))
+        self.cache: DiskCache | None = None
+        # Registered locations and their enabled product keys
+        self._locations: dict[str, tuple[float, float, tuple[str, ...]]] = {}
+        # Monotonic time each (product key, entry ID) is polled again
+        self._next_poll: dict[tuple[str, str], float] = {}
+        # Failed polls in a row of each (product key, entry ID)
+        self._failures: dict[tuple[str, str], int] = {}
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_products",
+            update_interval=PRODUCTS_TICK,
+            # Unchanged results do not notify the entities
+            always_update=False,
+        )
+
+    @callback
+    def async_register(
+        self, entry_id: str, lat: float, lon: float, products: Iterable[str]
+    ) -> None:
+        """Poll some products for a location."""
+        self._locations[entry_id] = (
+            lat,
+            lon,
+            tuple(key for key in products if key in PRODUCTS),
+        )
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Remove a location. Returns True if no locations remain."""
+        self._locations.pop(entry_id, None)
+        for key in [key for key in self._next_poll if key[1] == entry_id]:
+            del self._next_poll[key]
+        for key in [key for key in self._failures if key[1] == entry_id]:
+            del self._failures[key]
+        return not self._locations
+
+    def result(self, product_key: str, entry_id: str) -> Any:
+        """Return the parsed result of a product for a location, if any."""
+        return (self.data or {}).get((product_key, entry_id))
+
+    async def _async_update_data(self) -> dict[tuple[str, str], Any]:
+        """Fetch and parse the products that are due."""
+        now = time.monotonic()
+        results = {
+            key: value
+            for key, value in (self.data or {}).items()
+            if key[1] in self._locations
+        }
+        jobs: list[_Job] = [
+            (PRODUCTS[key], entry_id, lat, lon)
+            for entry_id, (lat, lon, keys) in self._locations.items()
+            for key in keys
+            if self._next_poll.get((key, entry_id), 0.0) <= now
+        ]
+        if not jobs:
+            return results
+
+        payloads = await self.hass.async_add_executor_job(self._read_cache, jobs)
+
+        # Download what the cache did not have, once per URL
+        urls: dict[str, list[int]] = {}
+        for i, (product, _, lat, lon) in enumerate(jobs):
+            if payloads[i] is None:
+                urls.setdefault(product.url_for(lat, lon), []).append(i)
+        downloads = await asyncio.gather(
+            *(self.client.get_json(url) for url in urls), return_exceptions=True
+        )
+        fresh = []
+        errors = []
+        for (url, indexes), payload in zip(urls.items(), downloads):
+            if not payload and not isinstance(payload, BaseException):
+                # Nothing to parse, so it counts as a failure to back off
+                payload = ValueError("empty response")
+            if isinstance(payload, (httpx.HTTPError, ValueError)):
+                self._back_off([jobs[i] for i in indexes], now, url, payload)
+                errors.append(payload)
+                continue
+            if isinstance(payload, BaseException):
+                raise payload
+            for i in indexes:
+                payloads[i] = payload
+            fresh.append(indexes[0])
+
+        loaded = [(job, payload) for job, payload in zip(jobs, payloads) if payload]
+        parsed = await self.hass.async_add_executor_job(
+            self._store_and_parse, loaded, [(jobs[i], payloads[i]) for i in fresh]
+        )
+        for (job, _), result in zip(loaded, parsed):
+            product, entry_id, _, _ = job
+            self._next_poll[(product.key, entry_id)] = (
+                now + product.interval.total_seconds()
+            )
+            self._failures.pop((product.key, entry_id), None)
+            results[(product.key, entry_id)] = result
+
+        if errors and not results:
+            raise UpdateFailed(f"Error fetching SMHI products: {errors[0]}")
+        return results
+
+    def _back_off(
+        self, jobs: list[_Job], now: float, url: str, error: Exception
+    ) -> None:
+        """Delay the next poll of failed jobs.
+
+        The delay starts at two ticks and doubles with every failure in a
+        row, up to the product's interval, so a product that is out of
+        season is not requested every tick.
+        """
+        first_failure = False
+        longest = 0.0
+        for product, entry_id, _, _ in jobs:
+            key = (product.key, entry_id)
+            failures = self._failures.get(key, 0)
+            self._failures[key] = failures + 1
+            delay = min(
+                PRODUCTS_TICK.total_seconds() * 2 ** (failures + 1),
+                product.interval.total_seconds(),
+            )
+            self._next_poll[key] = now + delay
+            first_failure = first_failure or failures == 0
+            longest = max(longest, delay)
+        _LOGGER.log(
+            logging.WARNING if first_failure else logging.DEBUG,
+            "SMHI product %s failed, retrying in up to %d minutes: %s",
+            url,
+            longest / 60,
+            error,
+        )
+
+    def _read_cache(self, jobs: list[_Job]) -> list:
+        """Return the cached payload of every job, or None (in the executor)."""
+        if self.cache is None:
+            self.cache = DiskCache(self.cache_dir, PRODUCTS_TICK)
+        return [
+            self.cache.get((product.key, lat, lon), max_age=product.interval)
+            for product, _, lat, lon in jobs
+        ]
+
+    def _store_and_parse(
+        self, loaded: list[tuple[_Job, Any]], fresh: list[tuple[_Job, Any]]
+    ) -> list:
+        """Cache new downloads and parse every payload (in the executor)."""
+        for (product, _, lat, lon), payload in fresh:
+            try:
+                self.cache.put((product.key, lat, lon), payload)
+            except OSError as err:
+                _LOGGER.debug("Could not cache SMHI %s: %s", product.key, err)
+        return parse_payloads([(job[0], payload) for job, payload in loaded])
@@ -1,20 +1,21 @@
 import logging
-from datetime import timedelta
-from homeassistant.util import dt as dt_util
-
-from homeassistant.core import callback
 
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
     SensorDeviceClass,
 )
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 from homeassistant.const import (
     CONF_LATITUDE,
     CONF_LONGITUDE,
     CONF_NAME,
     PERCENTAGE,
+    UnitOfPrecipitationDepth,
+    UnitOfVolumetricFlux,
     UnitOfTemperature,
     UnitOfPressure,
     UnitOfSpeed,
@@ -22,10 +23,31 @@ from homeassistant.const import (
 )
 
 # This import now correctly references the smhi_odp domain
-from .const import DOMAIN, ATTRIBUTION
+from .const import (
+    DOMAIN,
+    ATTRIBUTION,
+    CONF_DEGREE_DAYS,
+    CONF_FROST_RISK,
+    CONF_PRODUCTS,
+    SIGNAL_VERIFICATION,
+)
+from .core.archive import VERIFICATION_LEADS
+from .core.fire_risk import FIRE_RISK_LEVELS
+from .core.model import FORECAST_DAYS, daily_key, snowfall_key
+from .core.products import FIRE_RISK
+from .core.snow import SNOW_WINDOWS
+from .core.warning_areas import WARNING_LEVELS, highest_level
 
 _LOGGER = logging.getLogger(__name__)
 
+# Daily forecast sensors enabled by default (today and tomorrow)
+ENABLED_FORECAST_DAYS = 2
+
+# Nights with a frost risk sensor, and how many are enabled by default
+# (tonight and tomorrow night)
+FROST_NIGHTS = 3
+ENABLED_FROST_NIGHTS = 2
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the SMHI ODP sensor platform."""
@@ -53,11 +75,61 @@ async def async_setup_entry(hass, entry, async_add_entities):
         # --- Daily Forecast Sensors ---
         # Add 10 daily forecast sensors (Today, Tomorrow, +2, ... +9)
         # _LOGGER.warning("SMHI_ODP: Entering loop to create 10 daily sensors...")
-        for i in range(10):
+        for i in range(FORECAST_DAYS):
             # _LOGGER.warning(f"SMHI_ODP: Loop {i}: Creating SmhiDailyForecastSensor({i})")
             sensors_to_add.append(SmhiDailyForecastSensor(coordinator, entry, i))
             # _LOGGER.warning(f"SMHI_ODP: Loop {i}: Successfully appended sensor.")
 
+        # --- Snowfall Sensors ---
+        for hours in SNOW_WINDOWS:
+            sensors_to_add.append(SmhiSnowfallSensor(coordinator, entry, hours))
+
+        # --- Weather Warning Sensor ---
+        if coordinator.warnings is not None:
+            sensors_to_add.append(
+                SmhiWarningLevelSensor(coordinator.warnings, entry)
+            )
+
+        # --- Nowcast Sensors ---
+        if coordinator.nowcast is not None:
+            sensors_to_add.extend(
+                [
+                    SmhiNowcastNextHourSensor(coordinator.nowcast, entry),
+                    SmhiNowcastStartSensor(coordinator.nowcast, entry),
+                    SmhiNowcastIntensitySensor(coordinator.nowcast, entry),
+                ]
+            )
+
+        # --- Degree-Day Sensors ---
+        if entry.options.get(CONF_DEGREE_DAYS):
+            for i in range(FORECAST_DAYS):
+                sensors_to_add.append(
+                    SmhiDegreeDaySensor(coordinator, entry, "heating", i)
+                )
+                sensors_to_add.append(
+                    SmhiDegreeDaySensor(coordinator, entry, "cooling", i)
+                )
+
+        # --- Frost Risk Sensors ---
+        if entry.options.get(CONF_FROST_RISK):
+            sensors_to_add.extend(
+                SmhiFrostRiskSensor(coordinator, entry, i) for i in range(FROST_NIGHTS)
+            )
+
+        # --- SMHI Product Sensors ---
+        if coordinator.products is not None:
+            for key in entry.options.get(CONF_PRODUCTS, []):
+                factory = PRODUCT_SENSORS.get(key)
+                if factory is not None:
+                    sensors_to_add.extend(factory(coordinator.products, entry))
+
+        # --- Forecast Verification Sensors ---
+        if coordinator.archive is not None:
+            sensors_to_add.extend(
+                SmhiVerificationSensor(coordinator, entry, lead)
+                for lead in VERIFICATION_LEADS
+            )
+
         async_add_entities(sensors_to_add)
 
     except Exception as e:
@@ -69,12 +141,15 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class SmhiBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for SMHI ODP sensors."""
 
-    def __init__(self, coordinator, entry, name):
+    def __init__(self, coordinator, entry, name, key):
         """Initialize the sensor."""
         super().__init__(coordinator)
         # self._name is set in the child class (e.g., "Temperature")
         self._name = name
 
+        # Slot of this sensor in the coordinator's precomputed view
+        self._key = key
+
         # Get the name from the config entry (e.g., "home")
         config_name = entry.data.get(CONF_NAME)
 
@@ -100,34 +175,26 @@ class SmhiBaseSensor(CoordinatorEntity, SensorEntity):
         }
         self._attr_attribution = ATTRIBUTION
 
+    async def async_added_to_hass(self) -> None:
+        """Have the coordinator compute this sensor's value."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_track_key(self._key))
+
     @property
-    def current_data(self):
-        """
-        Helper to get the data for the current time entry.
-        """
-        try:
-            # Add checks to prevent crash if data is missing
-            if not self.coordinator.data:
-                # _LOGGER.debug("Coordinator has no data")
-                return None
-
-            time_series = self.coordinator.data.get("timeSeries")
-            if not time_series or len(time_series) == 0:
-                # _LOGGER.debug("API returned no timeSeries")
-                return None
-
-            # This is the data object: {"air_temperature": 10.5, ...}
-            return time_series[0].get("data")
-
-        except (IndexError, KeyError, TypeError) as err:
-            # _LOGGER.warning("Error parsing SMHI data: %s", err)
-            return None
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.coordinator.view.value(self._key).native_value
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return self.coordinator.view.value(self._key).attributes
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
         # An entity is available if the coordinator updated successfully
-        # and the current_data helper returns a valid dict.
+        # and holds data to compute the view from.
         return super().available and self.coordinator.data is not None
 
 
@@ -139,122 +206,77 @@ class SmhiTemperatureSensor(SmhiBaseSensor):
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "Temperature")
+        super().__init__(coordinator, entry, "Temperature", "temperature")
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.current_data:
-            return self.current_data.get("air_temperature")
-        return None
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        if self.current_data:
-            # Return all other data points as attributes
-            # This copies the whole dictionary of data
-            return self.current_data
-        return {}
-
 
 class SmhiHumiditySensor(SmhiBaseSensor):
     """Representation of an SMHI ODP Humidity Sensor."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "Humidity")
+        super().__init__(coordinator, entry, "Humidity", "humidity")
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_device_class = SensorDeviceClass.HUMIDITY
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.current_data:
-            return self.current_data.get("relative_humidity")
-        return None
-
 
 class SmhiWindSpeedSensor(SmhiBaseSensor):
     """Representation of an SMHI ODP Wind Speed Sensor."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "Wind Speed")
+        super().__init__(coordinator, entry, "Wind Speed", "wind_speed")
         self._attr_native_unit_of_measurement = UnitOfSpeed.METERS_PER_SECOND
         self._attr_device_class = SensorDeviceClass.WIND_SPEED
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.current_data:
-            return self.current_data.get("wind_speed")
-        return None
-
 
 class SmhiWindDirectionSensor(SmhiBaseSensor):
     """Representation of an SMHI ODP Wind Direction Sensor."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "Wind Direction")
+        super().__init__(coordinator, entry, "Wind Direction", "wind_direction")
         self._attr_native_unit_of_measurement = DEGREE
+        # Rarely used on its own; the weather entity shows the bearing
+        self._attr_entity_registry_enabled_default = False
         # Wind direction doesn't have a device_class in current HA versions
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.current_data:
-            return self.current_data.get("wind_from_direction")
-        return None
-
 
 class SmhiPressureSensor(SmhiBaseSensor):
     """Representation of an SMHI ODP Pressure Sensor."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "Pressure")
+        super().__init__(coordinator, entry, "Pressure", "pressure")
         self._attr_native_unit_of_measurement = UnitOfPressure.HPA
         self._attr_device_class = SensorDeviceClass.ATMOSPHERIC_PRESSURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.current_data:
-            return self.current_data.get("air_pressure_at_mean_sea_level")
-        return None
-
 
 class SmhiPrecipitationSensor(SmhiBaseSensor):
     """Representation of an SMHI ODP Precipitation Sensor."""
 
     def __init__(self, coordinator, entry):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "Precipitation")
+        super().__init__(coordinator, entry, "Precipitation", "precipitation")
         self._attr_native_unit_of_measurement = "mm"  # kg/m2 is equivalent to mm
         self._attr_device_class = SensorDeviceClass.PRECIPITATION
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.current_data:
-            return self.current_data.get("precipitation_amount_mean")
-        return None
-
 
 # --- Daily Forecast Sensor ---
 
 
 class SmhiDailyForecastSensor(SmhiBaseSensor):
-    """Representation of an SMHI ODP Daily Forecast Sensor."""
+    """Representation of an SMHI ODP Daily Forecast Sensor.
+
+    The state is the max temperature for the day, with all data for the max
+    temperature time as attributes.
+    """
 
     def __init__(self, coordinator, entry, day_offset):
         """Initialize the daily forecast sensor."""
@@ -268,173 +290,432 @@ class SmhiDailyForecastSensor(SmhiBaseSensor):
         else:
             name = f"Day +{day_offset}"
 
-        super().__init__(coordinator, entry, name)
+        super().__init__(coordinator, entry, name, daily_key(day_offset))
+
+        # Only today and tomorrow are enabled by default; later days can be
+        # enabled in the entity settings
+        self._attr_entity_registry_enabled_default = (
+            day_offset < ENABLED_FORECAST_DAYS
+        )
 
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = SensorDeviceClass.TEMPERATURE
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-        # Store data for this day
-        self._max_temp = None
-        self._max_temp_data = {}
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes (all data for the max temp time)."""
+        return self.coordinator.view.value(self._key).attributes or {}
+
 
-        # _LOGGER.warning(f"SMHI_ODP: Initializing daily sensor: {self._name}")
+# --- Snowfall Sensors ---
 
-        # --- FIX REMOVED ---
-        # Removed manual listener: self.coordinator.async_add_listener(self._handle_coordinator_update)
-        # We will rely on the base CoordinatorEntity to set up the listener in async_added_to_hass
-        # --- END FIX REMOVED ---
 
-    # --- NEW DEBUGGING METHOD ---
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        # Call the base CoordinatorEntity's method which adds the listener
-        await super().async_added_to_hass()
-        # Calculate the initial temperature value
-        self._find_daily_max_temp()
+class SmhiSnowfallSensor(SmhiBaseSensor):
+    """Fresh snow expected within the next hours.
+
+    The attributes give the snowfall's water equivalent (mm, equal to the
+    added snow load in kg/m²), the potential melt and the new snow
+    expected to be left at the end of the window.
+    """
+
+    def __init__(self, coordinator, entry, hours):
+        """Initialize the snowfall sensor of a window."""
+        super().__init__(coordinator, entry, f"Snowfall {hours}h", snowfall_key(hours))
+        # Only the shortest window is enabled by default
+        self._attr_entity_registry_enabled_default = hours == min(SNOW_WINDOWS)
+        self._attr_native_unit_of_measurement = UnitOfPrecipitationDepth.CENTIMETERS
+        self._attr_device_class = SensorDeviceClass.PRECIPITATION
+
+
+# --- Weather Warning Sensor ---
+
+
+class SmhiWarningLevelSensor(CoordinatorEntity, SensorEntity):
+    """The most severe SMHI weather warning level active at the location."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = ["none", *(level.lower() for level in WARNING_LEVELS)]
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry_id = entry.entry_id
+        self._attr_name = "Warning Level"
+        self._attr_unique_id = f"{entry.entry_id}_warning_level"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
 
     @property
     def native_value(self):
-        """Return the state of the sensor (max temp for the day)."""
-        return self._max_temp
+        """Return the highest active level, or "none"."""
+        now = dt_util.utcnow()
+        active = [
+            area
+            for area in self.coordinator.warnings_for(self._entry_id)
+            if area.is_active(now)
+        ]
+        return highest_level(active) or "none"
 
     @property
     def extra_state_attributes(self):
-        """Return the state attributes (all data for the max temp time)."""
-        # --- FIX: Added underscore to match the variable in __init__ ---
-        return self._max_temp_data
-
-    def _find_daily_max_temp(self):
-        """
-        Parses the full timeSeries to find the max temp for the specific day offset.
-        This is called by the _handle_coordinator_update method.
-        """
-        try:
-            if not self.coordinator.data:
-                # _LOGGER.warning(f"[{self._name}] No coordinator data, clearing max temp")
-                self._max_temp = None
-                self._max_temp_data = {}
-                return
-
-            time_series = self.coordinator.data.get("timeSeries")
-            if not time_series:
-                # _LOGGER.warning(f"[{self._name}] No timeSeries in coordinator data, clearing max temp")
-                self._max_temp = None
-                self._max_temp_data = {}
-                return
-
-            # Get the current time in Home Assistant's configured timezone
-            now_local = dt_util.now()
-            today_local = now_local.date()
-
-            # Calculate the target date (not datetime, just date)
-            target_date = today_local + timedelta(days=self._day_offset)
-
-            # _LOGGER.warning(f"[{self._name}] Finding max temp for day_offset {self._day_offset}")
-            # --- FIX: Corrected variable name from target_key_end to target_day_start ---
-            # _LOGGER.warning(f"[{self._name}] Target day start (local): {target_day_start}")
-            # _LOGGER.warning(f"[{self._name}] Target day end (local): {target_day_end}")
-
-            # --- NEW DEBUG LOG ---
-            # _LOGGER.warning(f"[{self._name}] Current HA time (local): {now_local}")
-            # _LOGGER.warning(f"[{self._name}] Total timeSeries entries: {len(time_series)}")
-            # --- END DEBUG LOG ---
-
-            max_temp = -float("inf")
-            max_temp_entry_data = None
-
-            # --- NEW DEBUG LOG ---
-            # Add a counter for loop logging
-            loop_counter = 0
-            # --- END DEBUG LOG ---
-
-            # Find the max temperature in the time entries for the target day
-            for entry in time_series:
-                # --- NEW DEBUG LOG ---
-                loop_counter += 1
-                # --- END DEBUG LOG ---
-
-                # Parse the entry time (it's in UTC)
-                time_str = entry.get("time") or entry.get("validTime")
-                entry_time_utc = dt_util.parse_datetime(time_str) if time_str else None
-                if not entry_time_utc:
-                    # _LOGGER.warning(f"[{self._name}] ERROR: FAILED to parse entry time: {entry.get('time')}")
-                    continue
-
-                # Convert UTC time to local timezone, then get just the date
-                entry_time_local = dt_util.as_local(entry_time_utc)
-                entry_date = entry_time_local.date()
-
-                # Check if this entry is for our target date
-                if entry_date == target_date:
-                    data = entry.get("data")
-                    if not data:
-                        continue
-
-                    temp = data.get("air_temperature")
-                    if temp is not None and temp > max_temp:
-                        max_temp = temp
-                        max_temp_entry_data = data
-                    # else:
-                    #    _LOGGER.warning(f"[{self._name}] MATCH: Entry {entry_time_utc} (UTC) is in range, but 'air_temperature' is missing or None.")
-                # else:
-                #    # Log the first 5 entries that *don't* match
-                #    if loop_counter <= 5:
-                #        _LOGGER.warning(
-                #            f"[{self._name}] REJECT: Entry {entry_time_utc} (UTC) is NOT in range "
-                #            f"({target_day_start} to {target_day_end})"
-                #        )
-
-            if max_temp_entry_data:
-                # _LOGGER.warning(f"[{self._name}] SUCCESS: Setting max temp to {max_temp}")
-                self._max_temp = max_temp
-                self._max_temp_data = max_temp_entry_data
-            else:
-                # No data found for this day
-                # _LOGGER.warning(f"[{self._name}] FAILED: No matching entries found. Clearing max temp.")
-                self._max_temp = None
-                self._max_temp_data = {}
-
-        except Exception as err:
-            _LOGGER.error(
-                f"Error parsing daily forecast data for {self._name}: {err}",
-                exc_info=True,
+        """Return the number of active warnings."""
+        now = dt_util.utcnow()
+        return {
+            "count": sum(
+                area.is_active(now)
+                for area in self.coordinator.warnings_for(self._entry_id)
             )
-            self._max_temp = None
-            self._max_temp_data = {}
+        }
+
+
+# --- Nowcast Sensors ---
+
+
+class SmhiNowcastSensor(CoordinatorEntity, SensorEntity):
+    """Base class for sensors reading the nowcast summary."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, entry, name, field):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._field = field
+        self._attr_name = name
+        self._attr_unique_id = f"{entry.entry_id}_{name.lower().replace(' ', '_')}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
 
     @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # This sensor is available if the coordinator has data
-        return super().available and self.coordinator.data is not None
+    def native_value(self):
+        """Return the field of the nowcast summary."""
+        if self.coordinator.data is None:
+            return None
+        return getattr(self.coordinator.data, self._field)
+
+
+class SmhiNowcastNextHourSensor(SmhiNowcastSensor):
+    """Precipitation expected during the next hour."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "Precipitation Next Hour", "next_hour")
+        self._attr_native_unit_of_measurement = UnitOfPrecipitationDepth.MILLIMETERS
+        self._attr_device_class = SensorDeviceClass.PRECIPITATION
+
+
+class SmhiNowcastStartSensor(SmhiNowcastSensor):
+    """When precipitation is expected to start within the nowcast."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "Precipitation Start", "starts_at")
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+
+
+class SmhiNowcastIntensitySensor(SmhiNowcastSensor):
+    """Highest precipitation intensity within the nowcast."""
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, entry, "Max Precipitation Intensity", "max_intensity"
+        )
+        self._attr_native_unit_of_measurement = (
+            UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR
+        )
+        self._attr_device_class = SensorDeviceClass.PRECIPITATION_INTENSITY
+
+
+# --- Degree-Day Sensors ---
 
-    # --- FIX: Add @callback decorator ---
-    @callback
-    # --- END FIX ---
-    # --- SYNTAX FIX: Removed erroneous 'f' ---
-    # --- SYNTAX FIX: Removed erroneous 'Main' ---
-    def _handle_coordinator_update(self) -> None:
-        """
-        Handle updated data from the coordinator.
-        This is called by the CoordinatorEntity base class.
-        """
-        # --- NEW DEBUG LOG: Wrap in try/except to catch all errors ---
-        # _LOGGER.warning(f"SMHI_ODP: _handle_coordinator_update ENTERED for {self._name}")
-        try:
-            # --- NEW DEBUG LOG ---
-            # _LOGGER.warning(f"SMHI_ODP: Handling coordinator update for {self._name}")
-            # --- END DEBUG LOG ---
-
-            # Find the max temp for this sensor's day
-            # --- FIX: Added parentheses to call the method ---
-            self._find_daily_max_temp()
-
-            self.async_write_ha_state()
-            # _LOGGER.warning(f"SMHI_ODP: _handle_coordinator_update EXITED for {self._name}")
-
-        except Exception as e:
-            _LOGGER.error(
-                f"SMHI_ODP: CRITICAL ERROR in _handle_coordinator_update for {self._name}: {e}",
-                exc_info=True,
+
+class SmhiDegreeDaySensor(CoordinatorEntity, SensorEntity):
+    """Heating or cooling degree-days forecast for one day.
+
+    The coordinator computes the degree-days of all days once per forecast
+    generation; the sensor only looks up its day.
+    """
+
+    _attr_has_entity_name = True
+    _attr_native_unit_of_measurement = "°C·d"
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator, entry, kind, day_offset):
+        """Initialize the sensor for "heating" or "cooling"."""
+        super().__init__(coordinator)
+        self._kind = kind
+        self._day_offset = day_offset
+        if day_offset == 0:
+            day_name = "Today"
+        elif day_offset == 1:
+            day_name = "Tomorrow"
+        else:
+            day_name = f"Day +{day_offset}"
+        self._attr_name = f"{kind.capitalize()} Degree Days {day_name}"
+        self._attr_unique_id = f"{entry.entry_id}_{kind}_degree_days_{day_offset}"
+        # Heating for today and tomorrow is enabled by default; cooling is
+        # rarely needed in Sweden
+        self._attr_entity_registry_enabled_default = (
+            kind == "heating" and day_offset < ENABLED_FORECAST_DAYS
+        )
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
+
+    @property
+    def native_value(self):
+        """Return the degree-days of the day."""
+        day = self.coordinator.degree_day(self._day_offset)
+        return getattr(day, self._kind) if day is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the day, its mean temperature and the base used."""
+        day = self.coordinator.degree_day(self._day_offset)
+        if day is None:
+            return None
+        settings = self.coordinator.degree_day_settings
+        return {
+            "date": day.date.isoformat(),
+            "mean_temperature": day.mean_temperature,
+            "hours": day.hours,
+            "base_temperature": getattr(settings, f"{self._kind}_base"),
+            "wind_chill": settings.wind_chill,
+        }
+
+
+class SmhiFrostRiskSensor(CoordinatorEntity, SensorEntity):
+    """Probability of ground frost during one night.
+
+    The coordinator computes the risk of every night once per forecast
+    generation; the sensor only looks up its night.
+    """
+
+    _attr_has_entity_name = True
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:snowflake-thermometer"
+
+    def __init__(self, coordinator, entry, night_offset):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._night_offset = night_offset
+        if night_offset == 0:
+            night_name = "Tonight"
+        elif night_offset == 1:
+            night_name = "Tomorrow Night"
+        else:
+            night_name = f"Night +{night_offset}"
+        self._attr_name = f"Frost Risk {night_name}"
+        self._attr_unique_id = f"{entry.entry_id}_frost_risk_{night_offset}"
+        self._attr_entity_registry_enabled_default = (
+            night_offset < ENABLED_FROST_NIGHTS
+        )
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
+
+    @property
+    def native_value(self):
+        """Return the frost probability of the night."""
+        night = self.coordinator.frost_night(self._night_offset)
+        return night.probability if night is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the night's window, severity and coldest conditions."""
+        night = self.coordinator.frost_night(self._night_offset)
+        return night.as_dict() if night is not None else None
+
+
+# --- SMHI Product Sensors ---
+
+
+class SmhiProductSensor(CoordinatorEntity, SensorEntity):
+    """Base class for sensors reading a product of the shared coordinator."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, entry, product_key, name):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry_id = entry.entry_id
+        self._product_key = product_key
+        self._attr_name = name
+        self._attr_unique_id = f"{entry.entry_id}_{name.lower().replace(' ', '_')}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
+
+    @property
+    def result(self):
+        """Return the parsed product for this location."""
+        return self.coordinator.result(self._product_key, self._entry_id)
+
+
+class SmhiFireRiskBaseSensor(SmhiProductSensor):
+    """Base class for sensors of the fire risk forecast."""
+
+    def __init__(self, coordinator, entry, name):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, FIRE_RISK.key, name)
+
+    def _today(self):
+        """Return today's forecast, if the product has one."""
+        today = dt_util.now().date()
+        return next((day for day in self.result or () if day.date >= today), None)
+
+
+class SmhiFireRiskSensor(SmhiFireRiskBaseSensor):
+    """Today's SMHI fire risk level, with the coming days as an attribute."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = list(FIRE_RISK_LEVELS.values())
+    _unrecorded_attributes = frozenset({"forecast"})
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "Fire Risk")
+
+    @property
+    def native_value(self):
+        """Return today's fire risk level."""
+        day = self._today()
+        return day.level if day is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return today's index values and the daily forecast."""
+        day = self._today()
+        if day is None:
+            return None
+        today = dt_util.now().date()
+        return {
+            **day.as_dict(),
+            "forecast": [
+                item.as_dict() for item in self.result if item.date >= today
+            ],
+        }
+
+
+class SmhiFireWeatherIndexSensor(SmhiFireRiskBaseSensor):
+    """Today's Fire Weather Index."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator, entry):
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "Fire Weather Index")
+
+    @property
+    def native_value(self):
+        """Return today's FWI."""
+        day = self._today()
+        return day.fwi if day is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the FWI components of today."""
+        day = self._today()
+        if day is None:
+            return None
+        return {
+            key: value
+            for key, value in day.as_dict().items()
+            if key in ("date", "isi", "bui", "ffmc", "dmc", "dc")
+        }
+
+
+# Product key -> the sensors a location gets for it
+PRODUCT_SENSORS = {
+    FIRE_RISK.key: lambda coordinator, entry: [
+        SmhiFireRiskSensor(coordinator, entry),
+        SmhiFireWeatherIndexSensor(coordinator, entry),
+    ],
+}
+
+
+# --- Forecast Verification Sensors ---
+
+
+class SmhiVerificationSensor(SensorEntity):
+    """Mean absolute error of the temperature forecast at one lead time.
+
+    Bias and MAE of every archived parameter are in the `verification`
+    attribute, which is kept out of the recorder.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _unrecorded_attributes = frozenset({"verification"})
+
+    def __init__(self, coordinator, entry, lead):
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self._entry_id = entry.entry_id
+        self._lead = lead
+        self._attr_name = f"Temperature Forecast Error {lead}h"
+        self._attr_unique_id = f"{entry.entry_id}_forecast_error_{lead}h"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": f"SMHI ODP ({entry.data.get(CONF_NAME)})",
+            "manufacturer": "SMHI",
+            "model": "ODP Forecast",
+            "entry_type": "service",
+        }
+        self._attr_attribution = ATTRIBUTION
+
+    async def async_added_to_hass(self) -> None:
+        """Update when the verification is recomputed."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_VERIFICATION.format(self._entry_id),
+                self.async_write_ha_state,
             )
+        )
+
+    @property
+    def native_value(self):
+        """Return the temperature MAE at this lead time."""
+        result = self.coordinator.verification.get(self._lead, {})
+        return result.get("air_temperature", {}).get("mae")
+
+    @property
+    def extra_state_attributes(self):
+        """Return bias, MAE and sample count per parameter."""
+        return {
+            "lead_hours": self._lead,
+            "verification": self.coordinator.verification.get(self._lead, {}),
+        }
@@ -0,0 +1,268 @@
+"""Services of the SMHI ODP integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from pathlib import Path
+
+import voluptuous as vol
+
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntryState
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, httpx_client
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_SEEDS, DOMAIN
+from .core.adapters import grid_point, in_coverage
+from .core.batch import read_locations
+from .core.client import SmhiClient
+from .core.model import FORECAST_DAYS
+from .core.windows import WindowCriteria, find_windows
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_GET_DEGREE_DAYS = "get_degree_days"
+SERVICE_IMPORT_LOCATIONS = "import_locations"
+SERVICE_FIND_BEST_WINDOWS = "find_best_windows"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DAYS = "days"
+ATTR_LOCATIONS = "locations"
+ATTR_FILE = "file"
+ATTR_CONCURRENCY = "concurrency"
+ATTR_HOURS = "hours"
+ATTR_HORIZON = "horizon"
+ATTR_COUNT = "count"
+
+# Forecast requests in flight at once during an import
+IMPORT_CONCURRENCY = 4
+
+GET_DEGREE_DAYS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DAYS, default=FORECAST_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=FORECAST_DAYS)
+        ),
+    }
+)
+
+# Service fields -> WindowCriteria fields
+WINDOW_CRITERIA = (
+    "temperature_weight",
+    "precipitation_weight",
+    "humidity_weight",
+    "wind_weight",
+    "max_precipitation",
+    "max_humidity",
+    "max_wind_speed",
+    "min_temperature",
+)
+
+FIND_BEST_WINDOWS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_HOURS, default=3): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=24)
+        ),
+        vol.Optional(ATTR_HORIZON, default=48): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=FORECAST_DAYS * 24)
+        ),
+        vol.Optional(ATTR_COUNT, default=3): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10)
+        ),
+        **{vol.Optional(key): vol.Coerce(float) for key in WINDOW_CRITERIA},
+    }
+)
+
+IMPORT_LOCATIONS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_LOCATIONS): [
+                vol.Schema(
+                    {
+                        vol.Optional(CONF_NAME): cv.string,
+                        vol.Required(CONF_LATITUDE): cv.latitude,
+                        vol.Required(CONF_LONGITUDE): cv.longitude,
+                    }
+                )
+            ],
+            vol.Optional(ATTR_FILE): cv.string,
+            vol.Optional(ATTR_CONCURRENCY, default=IMPORT_CONCURRENCY): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=16)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_LOCATIONS, ATTR_FILE),
+)
+
+
+def _coordinator(hass: HomeAssistant, entry_id: str):
+    """Return the coordinator of a loaded config entry."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return hass.data[DOMAIN][entry_id]
+
+
+async def _async_get_degree_days(call: ServiceCall) -> ServiceResponse:
+    """Return the degree-days of the next days of one location."""
+    coordinator = _coordinator(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    settings = coordinator.degree_day_settings
+    today = dt_util.now().date()
+    last = today + timedelta(days=call.data[ATTR_DAYS] - 1)
+    return {
+        "heating_base": settings.heating_base,
+        "cooling_base": settings.cooling_base,
+        "wind_chill": settings.wind_chill,
+        "days": [
+            day.as_dict()
+            for day_date, day in sorted(coordinator.degree_days.items())
+            if today <= day_date <= last
+        ],
+    }
+
+
+async def _async_find_best_windows(call: ServiceCall) -> ServiceResponse:
+    """Return the best time windows of one location's forecast."""
+    coordinator = _coordinator(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    forecast = coordinator.view.forecast
+    if forecast is None:
+        return {"windows": []}
+    criteria = WindowCriteria(
+        **{key: call.data[key] for key in WINDOW_CRITERIA if key in call.data}
+    )
+    windows = find_windows(
+        forecast,
+        dt_util.utcnow(),
+        call.data[ATTR_HOURS],
+        call.data[ATTR_HORIZON],
+        call.data[ATTR_COUNT],
+        criteria,
+    )
+    return {"windows": [window.as_dict() for window in windows]}
+
+
+def _read_file(hass: HomeAssistant, path: str) -> list[dict]:
+    """Read the locations of a CSV file (runs in the executor)."""
+    if not hass.config.is_allowed_path(path):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="path_not_allowed",
+            translation_placeholders={"path": path},
+        )
+    return [
+        {
+            CONF_NAME: location.key,
+            CONF_LATITUDE: location.latitude,
+            CONF_LONGITUDE: location.longitude,
+        }
+        for location in read_locations(Path(path))
+    ]
+
+
+async def _async_import_locations(call: ServiceCall) -> ServiceResponse:
+    """Validate, fetch and add many locations in one go.
+
+    Locations outside the SMHI grid are rejected without a request. The
+    rest are fetched a few at a time, and every forecast is handed to its
+    new entry so setup does not download it again.
+    """
+    hass = call.hass
+    locations = list(call.data.get(ATTR_LOCATIONS, []))
+    if ATTR_FILE in call.data:
+        locations += await hass.async_add_executor_job(
+            _read_file, hass, call.data[ATTR_FILE]
+        )
+
+    failed = []
+    valid = []
+    for location in locations:
+        lat, lon = location[CONF_LATITUDE], location[CONF_LONGITUDE]
+        location.setdefault(CONF_NAME, f"{lat},{lon}")
+        if in_coverage(lat, lon):
+            valid.append(location)
+        else:
+            failed.append({**location, "reason": "outside_coverage"})
+
+    client = SmhiClient(httpx_client.get_async_client(hass))
+    payloads = await client.forecasts(
+        [(loc[CONF_LATITUDE], loc[CONF_LONGITUDE]) for loc in valid],
+        call.data[ATTR_CONCURRENCY],
+    )
+
+    configured = {
+        entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    seeds = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SEEDS, {})
+    created = []
+    skipped = []
+    for location, payload in zip(valid, payloads):
+        if isinstance(payload, Exception):
+            _LOGGER.warning("Could not import %s: %s", location[CONF_NAME], payload)
+            failed.append({**location, "reason": "cannot_connect"})
+            continue
+        grid_lat, grid_lon = grid_point(
+            payload, location[CONF_LATITUDE], location[CONF_LONGITUDE]
+        )
+        unique_id = f"{grid_lat}-{grid_lon}"
+        if unique_id in configured:
+            skipped.append({**location, "reason": "already_configured"})
+            continue
+        configured.add(unique_id)
+        seeds[unique_id] = (dt_util.utcnow(), payload)
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_IMPORT},
+            data={**location, "unique_id": unique_id},
+        )
+        if result["type"] is not FlowResultType.CREATE_ENTRY:
+            seeds.pop(unique_id, None)
+            skipped.append({**location, "reason": result.get("reason")})
+            continue
+        created.append(location)
+
+    return {"created": created, "skipped": skipped, "failed": failed}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DEGREE_DAYS,
+        _async_get_degree_days,
+        schema=GET_DEGREE_DAYS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_LOCATIONS,
+        _async_import_locations,
+        schema=IMPORT_LOCATIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_BEST_WINDOWS,
+        _async_find_best_windows,
+        schema=FIND_BEST_WINDOWS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,108 @@
+"""Import forecast series into Home Assistant long-term statistics.
+
+When enabled in the options, every new forecast is written as external
+statistics in one batch per series instead of being charted through the
+recorder history of the sensor states:
+
+* ``smhi_odp:<entry>_<parameter>_forecast`` holds the latest forecast for
+  every hour. Each refresh overwrites the hours it covers, so past hours keep
+  the last forecast that was issued before them.
+* ``smhi_odp:<entry>_<parameter>_issued_<lead>h`` is a snapshot of the value
+  the forecast issued at its reference time predicted `lead` hours ahead,
+  written at the valid hour. Plotted against the sensor it shows forecast
+  versus actual for that lead time.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .core.model import SmhiForecast
+
+_LOGGER = logging.getLogger(__name__)
+
+# SMHI parameter -> (statistic name suffix, unit)
+STATISTICS_PARAMETERS = {
+    "air_temperature": ("temperature", "°C"),
+    "wind_speed": ("wind_speed", "m/s"),
+    "precipitation_amount_mean": ("precipitation", "mm/h"),
+}
+
+# Lead times (hours after the reference time) kept as issued-at snapshots
+STATISTICS_LEADS = (24,)
+
+
+def statistic_id(entry_id: str, suffix: str) -> str:
+    """Return the external statistic ID for one series of a config entry."""
+    return f"{DOMAIN}:{entry_id.lower()}_{suffix}"
+
+
+def _hour(value: datetime) -> datetime:
+    """Truncate a timestamp to the start of its hour."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def forecast_statistics(forecast: SmhiForecast) -> dict[str, tuple[str, list[dict]]]:
+    """Build the rows of every series from a forecast.
+
+    Returns statistic suffix -> (unit, rows), where a row is a
+    ``{"start", "mean", "min", "max"}`` dict for one hour.
+    """
+    series = {}
+    hours = [_hour(t) for t in forecast.times]
+    for parameter, (name, unit) in STATISTICS_PARAMETERS.items():
+        values = forecast.column(parameter)
+        rows = [
+            {"start": start, "mean": value, "min": value, "max": value}
+            for start, value in zip(hours, values)
+            if value is not None
+        ]
+        if rows:
+            series[f"{name}_forecast"] = (unit, rows)
+
+        if forecast.reference_time is None:
+            continue
+        for lead in STATISTICS_LEADS:
+            target = _hour(forecast.reference_time + timedelta(hours=lead))
+            snapshot = [row for row in rows if row["start"] == target]
+            if snapshot:
+                series[f"{name}_issued_{lead}h"] = (unit, snapshot)
+    return series
+
+
+@callback
+def async_import_forecast(hass: HomeAssistant, entry, forecast: SmhiForecast) -> None:
+    """Queue one statistics import per series for a new forecast."""
+    if "recorder" not in hass.config.components:
+        _LOGGER.debug("Recorder is not loaded, skipping forecast statistics")
+        return
+
+    # Imported lazily so the recorder is only needed when the option is on
+    from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    try:
+        from homeassistant.components.recorder.models import StatisticMeanType
+    except ImportError:  # Home Assistant < 2025.4 only knows has_mean
+        mean_type = {}
+    else:
+        mean_type = {"mean_type": StatisticMeanType.ARITHMETIC}
+
+    name = entry.data.get("name", entry.title)
+    for suffix, (unit, rows) in forecast_statistics(forecast).items():
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"SMHI ODP {name} {suffix.replace('_', ' ')}",
+            source=DOMAIN,
+            statistic_id=statistic_id(entry.entry_id, suffix),
+            unit_of_measurement=unit,
+            **mean_type,
+        )
+        async_add_external_statistics(
+            hass, metadata, [StatisticData(**row) for row in rows]
+        )
@@ -1,6 +1,5 @@
 """Support for SMHI ODP weather service."""
 
-from datetime import datetime, timedelta
 import logging
 
 from homeassistant.components.weather import (
@@ -17,46 +16,11 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, ATTRIBUTION
+from .const import DOMAIN, ATTRIBUTION, CONF_FORECAST_ATTRIBUTE
 
 _LOGGER = logging.getLogger(__name__)
 
-# SMHI Wsymb2 code mapping to HA conditions
-CONDITION_CLASSES = {
-    "clear-night": [1],  # Clear sky
-    "sunny": [1, 2],  # Clear sky, Nearly clear sky
-    "partlycloudy": [3, 4],  # Variable cloudiness, Halfclear sky
-    "cloudy": [5, 6],  # Cloudy sky, Overcast
-    "fog": [7],  # Fog
-    "rainy": [
-        8,
-        9,
-        10,
-        18,
-        19,
-        20,
-    ],  # Light rain showers, Moderate rain showers, Heavy rain showers, Light rain, Moderate rain, Heavy rain
-    "lightning-rainy": [11, 21],  # Thunderstorm, Thunder
-    "snowy-rainy": [
-        12,
-        13,
-        14,
-        22,
-        23,
-        24,
-    ],  # Light sleet showers, Moderate sleet showers, Heavy sleet showers, Light sleet, Moderate sleet, Heavy sleet
-    "snowy": [
-        15,
-        16,
-        17,
-        25,
-        26,
-        27,
-    ],  # Light snow showers, Moderate snow showers, Heavy snow showers, Light snowfall, Moderate snowfall, Heavy snowfall
-}
-
 
 async def async_setup_entry(
     hass: HomeAssistant, entry, async_add_entities: AddEntitiesCallback
@@ -67,7 +31,12 @@ async def async_setup_entry(
 
 
 class SmhiWeather(CoordinatorEntity, WeatherEntity):
-    """Representation of a weather entity."""
+    """Representation of a weather entity.
+
+    All values are read from the coordinator's precomputed view, which is
+    rebuilt once per refresh. Subscribers to `weather/subscribe_forecast` are
+    only notified for the forecast types whose content actually changed.
+    """
 
     _attr_native_pressure_unit = UnitOfPressure.HPA
     _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
@@ -75,13 +44,17 @@ class SmhiWeather(CoordinatorEntity, WeatherEntity):
     _attr_native_precipitation_unit = UnitOfPrecipitationDepth.MILLIMETERS
     _attr_native_wind_speed_unit = UnitOfSpeed.METERS_PER_SECOND
     _attr_attribution = ATTRIBUTION
-    _attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
+    _attr_supported_features = (
+        WeatherEntityFeature.FORECAST_DAILY | WeatherEntityFeature.FORECAST_HOURLY
+    )
 
     def __init__(self, coordinator, entry) -> None:
         """Initialize the weather entity."""
         super().__init__(coordinator)
         self._attr_name = entry.data.get("name", "SMHI")
         self._attr_unique_id = f"{entry.entry_id}_weather"
+        # The legacy `forecast` attribute can be dropped by option
+        self._forecast_attribute = entry.options.get(CONF_FORECAST_ATTRIBUTE, True)
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
             "name": f"SMHI ODP ({self._attr_name})",
@@ -93,37 +66,7 @@ class SmhiWeather(CoordinatorEntity, WeatherEntity):
     @property
     def condition(self) -> str | None:
         """Return the current condition."""
-        if not self.coordinator.data:
-            _LOGGER.warning("Weather: No coordinator data available")
-            return None
-
-        # Get the symbol from the first time series entry
-        time_series = self.coordinator.data.get("timeSeries")
-        if not time_series:
-            _LOGGER.warning("Weather: No timeSeries in coordinator data")
-            return None
-
-        if not time_series[0].get("data"):
-            _LOGGER.warning("Weather: No data in first timeSeries entry")
-            return None
-
-        symbol = self._get_symbol(time_series[0]["data"])
-        _LOGGER.info(
-            "Weather: Got symbol: %s, available keys: %s",
-            symbol,
-            list(time_series[0]["data"].keys()),
-        )
-
-        if symbol is None:
-            _LOGGER.warning("Weather: symbol is None in API data")
-            return None
-
-        condition = next(
-            (k for k, v in CONDITION_CLASSES.items() if symbol in v),
-            None,
-        )
-        _LOGGER.info(f"Weather: Mapped symbol {symbol} to condition: {condition}")
-        return condition
+        return self.coordinator.view.condition
 
     @property
     def native_temperature(self) -> float | None:
@@ -158,221 +101,51 @@ class SmhiWeather(CoordinatorEntity, WeatherEntity):
         Home Assistant itself prefers `weather.get_forecasts`, but exposing a
         small (<=10 days) forecast attribute keeps dashboards compatible.
         """
+        if not self._forecast_attribute:
+            return {}
         forecast = self.forecast
         if not forecast:
             return {}
         return {"forecast": forecast}
 
-    @staticmethod
-    def _get_entry_time(entry: dict) -> datetime | None:
-        """Parse the timestamp for a time series entry."""
-        time_str = entry.get("time") or entry.get("validTime")
-        if not time_str:
-            return None
-        return dt_util.parse_datetime(time_str)
-
-    @staticmethod
-    def _get_symbol(day_data: dict) -> int | None:
-        """Get the SMHI symbol code from a data dict.
-
-        Different SMHI endpoints / versions may use different keys.
-        """
-        symbol = day_data.get("symbol_code")
-        if symbol is None:
-            symbol = day_data.get("weather_symbol")
-        if symbol is None:
-            symbol = day_data.get("Wsymb2")
-        try:
-            return int(symbol) if symbol is not None else None
-        except (TypeError, ValueError):
-            return None
-
     @property
     def forecast(self) -> list[dict] | None:
         """Return the forecast array for dashboard cards compatibility."""
-        if not self.coordinator.data:
-            return None
-
-        time_series = self.coordinator.data.get("timeSeries")
-        if not time_series:
-            return None
-
-        forecast_data = []
-        processed_days = set()
-
-        now = dt_util.now()
-        today = now.date()
-
-        for entry in time_series:
-            entry_time = self._get_entry_time(entry)
-            if not entry_time:
-                continue
-
-            entry_local = dt_util.as_local(entry_time)
-            entry_date = entry_local.date()
-
-            if entry_date < today:
-                continue
-
-            if entry_date not in processed_days:
-                noon_entry = self._find_noon_entry(time_series, entry_date)
-                day_data = noon_entry["data"] if noon_entry else entry["data"]
-
-                max_temp = self._get_daily_max_temp(time_series, entry_date)
-                min_temp = self._get_daily_min_temp(time_series, entry_date)
-
-                symbol = self._get_symbol(day_data)
-                condition = next(
-                    (k for k, v in CONDITION_CLASSES.items() if symbol in v),
-                    None,
-                )
-
-                forecast_data.append(
-                    {
-                        "datetime": entry_date.isoformat(),
-                        "temperature": max_temp,
-                        "templow": min_temp,
-                        "condition": condition,
-                        "precipitation": day_data.get("precipitation_amount_mean", 0)
-                        * 24,
-                    }
-                )
-                processed_days.add(entry_date)
-
-                if len(forecast_data) >= 10:
-                    break
-
+        forecast_data = [
+            {
+                "datetime": day["datetime"],
+                "temperature": day["native_temperature"],
+                "templow": day["native_templow"],
+                "condition": day["condition"],
+                "precipitation": day["native_precipitation"],
+            }
+            for day in self.coordinator.view.daily_forecast
+        ]
         return forecast_data if forecast_data else None
 
     def _get_current_data(self, key):
         """Helper to get current data."""
-        if self.coordinator.data and self.coordinator.data.get("timeSeries"):
-            return self.coordinator.data["timeSeries"][0]["data"].get(key)
-        return None
+        return self.coordinator.view.current.get(key)
 
     async def async_forecast_daily(self) -> list[dict] | None:
         """Return the daily forecast in native units."""
         if not self.coordinator.data:
             return None
+        return list(self.coordinator.view.daily_forecast)
 
-        time_series = self.coordinator.data.get("timeSeries")
-        if not time_series:
+    async def async_forecast_hourly(self) -> list[dict] | None:
+        """Return the hourly forecast in native units."""
+        if not self.coordinator.data:
             return None
-
-        forecast_data = []
-        processed_days = set()
-
-        now = dt_util.now()
-        today = now.date()
-
-        for entry in time_series:
-            entry_time = self._get_entry_time(entry)
-            if not entry_time:
-                continue
-
-            entry_local = dt_util.as_local(entry_time)
-            entry_date = entry_local.date()
-
-            # Skip past data, but include today
-            if entry_date < today:
-                continue
-
-            # We want one entry per day, ideally around noon (12:00) to represent the day
-            # simpler approach: aggregate max temp for the day, and use noon symbol
-            if entry_date not in processed_days:
-                # Find noon entry for symbol, fallback to current entry
-                noon_entry = self._find_noon_entry(time_series, entry_date)
-                day_data = noon_entry["data"] if noon_entry else entry["data"]
-
-                # Find max temp for the day
-                max_temp = self._get_daily_max_temp(time_series, entry_date)
-                min_temp = self._get_daily_min_temp(
-                    time_series, entry_date
-                )  # Added min temp
-
-                symbol = self._get_symbol(day_data)
-                condition = next(
-                    (k for k, v in CONDITION_CLASSES.items() if symbol in v),
-                    None,
-                )
-
-                forecast_data.append(
-                    {
-                        "datetime": entry_date.isoformat(),
-                        "native_temperature": max_temp,
-                        "native_templow": min_temp,
-                        "condition": condition,
-                        "native_precipitation": day_data.get(
-                            "precipitation_amount_mean", 0
-                        )
-                        * 24,  # Rough daily estimate
-                        "wind_bearing": day_data.get("wind_from_direction"),
-                        "native_wind_speed": day_data.get("wind_speed"),
-                    }
-                )
-                processed_days.add(entry_date)
-
-                # Limit to 10 days
-                if len(forecast_data) >= 10:
-                    break
-
-        return forecast_data
-
-    def _find_noon_entry(self, time_series, date):
-        """Find the entry closest to 12:00 for a given date."""
-        target_time = datetime.combine(
-            date, datetime.min.time().replace(hour=12)
-        ).replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-
-        best_entry = None
-        min_diff = float("inf")
-
-        for entry in time_series:
-            entry_time = self._get_entry_time(entry)
-            if not entry_time:
-                continue
-
-            entry_local = dt_util.as_local(entry_time)
-            if entry_local.date() == date:
-                diff = abs((entry_local - target_time).total_seconds())
-                if diff < min_diff:
-                    min_diff = diff
-                    best_entry = entry
-
-        return best_entry
-
-    def _get_daily_max_temp(self, time_series, date):
-        """Find max temperature for a given date."""
-        max_temp = -float("inf")
-        found = False
-        for entry in time_series:
-            entry_time = self._get_entry_time(entry)
-            if not entry_time:
-                continue
-
-            entry_local = dt_util.as_local(entry_time)
-            if entry_local.date() == date:
-                temp = entry["data"].get("air_temperature")
-                if temp is not None:
-                    if temp > max_temp:
-                        max_temp = temp
-                        found = True
-        return max_temp if found else None
-
-    def _get_daily_min_temp(self, time_series, date):
-        """Find min temperature for a given date."""
-        min_temp = float("inf")
-        found = False
-        for entry in time_series:
-            entry_time = self._get_entry_time(entry)
-            if not entry_time:
-                continue
-
-            entry_local = dt_util.as_local(entry_time)
-            if entry_local.date() == date:
-                temp = entry["data"].get("air_temperature")
-                if temp is not None:
-                    if temp < min_temp:
-                        min_temp = temp
-                        found = True
-        return min_temp if found else None
+        return list(self.coordinator.view.hourly_forecast)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, then push changed forecasts to subscribers."""
+        super()._handle_coordinator_update()
+        if self.coordinator.changed_forecasts:
+            self.coordinator.entry.async_create_background_task(
+                self.hass,
+                self.async_update_listeners(tuple(self.coordinator.changed_forecasts)),
+                "smhi_odp.weather.async_update_listeners",
+            )
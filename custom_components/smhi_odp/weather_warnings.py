@@ -0,0 +1,85 @@
+"""SMHI impact-based weather warnings for every configured location.
+
+One coordinator is shared by all config entries that enable warnings. The
+national feed is downloaded and indexed once per refresh, and each location
+is then matched against the index once instead of scanning every area.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+
+import httpx
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import httpx_client
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .core.client import SmhiClient
+from .core.warning_areas import (
+    WARNINGS_URL,
+    WarningArea,
+    WarningIndex,
+    parse_warnings,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Warnings are issued and updated at irregular times during the day
+WARNINGS_INTERVAL = timedelta(minutes=15)
+
+
+class SmhiWarningsCoordinator(DataUpdateCoordinator):
+    """Fetch and index the national warnings feed once for all entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coordinator."""
+        self.client = SmhiClient(httpx_client.get_async_client(hass))
+        # Registered locations and their matched areas for the current data
+        self._locations: dict[str, tuple[float, float]] = {}
+        self._matches: dict[str, list[WarningArea]] = {}
+        self._matches_source = None
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_warnings",
+            update_interval=WARNINGS_INTERVAL,
+        )
+
+    @callback
+    def async_register(self, entry_id: str, lat: float, lon: float) -> None:
+        """Add a location to match against the warning areas."""
+        self._locations[entry_id] = (lat, lon)
+        self._matches.pop(entry_id, None)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Remove a location. Returns True if no locations remain."""
+        self._locations.pop(entry_id, None)
+        self._matches.pop(entry_id, None)
+        return not self._locations
+
+    async def _async_update_data(self) -> WarningIndex:
+        """Fetch the warnings feed and index its areas."""
+        try:
+            payload = await self.client.get_json(WARNINGS_URL)
+        except (httpx.HTTPError, ValueError) as err:
+            raise UpdateFailed(f"Error fetching SMHI warnings: {err}") from err
+
+        return WarningIndex(parse_warnings(payload))
+
+    def warnings_for(self, entry_id: str) -> list[WarningArea]:
+        """Return the warning areas covering a location, looked up once per refresh."""
+        if self.data is None or entry_id not in self._locations:
+            return []
+        if self._matches_source is not self.data:
+            self._matches = {}
+            self._matches_source = self.data
+        matches = self._matches.get(entry_id)
+        if matches is None:
+            lat, lon = self._locations[entry_id]
+            matches = self._matches[entry_id] = self.data.lookup(lat, lon)
+        return matches
@@ -10,7 +10,8 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from datetime import datetime, timezone
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 import pytest
 
@@ -35,6 +36,40 @@ def skip_notifications_fixture():
         yield
 
 
+@pytest.fixture(name="forecast_payload")
+def forecast_payload_fixture():
+    """Return a factory of snow1g payloads from per-step `data` dicts."""
+
+    def build(
+        steps: list[dict],
+        start: datetime,
+        hours: Iterable[float] | None = None,
+        reference: datetime | None = None,
+    ) -> dict:
+        """Return steps ending `hours` after `start`, hourly by default.
+
+        `reference` is the model run's reference time, if any.
+        """
+        if hours is None:
+            hours = range(1, len(steps) + 1)
+        payload = {
+            "timeSeries": [
+                {
+                    "time": (start + timedelta(hours=hour))
+                    .isoformat()
+                    .replace("+00:00", "Z"),
+                    "data": data,
+                }
+                for hour, data in zip(hours, steps)
+            ]
+        }
+        if reference is not None:
+            payload["referenceTime"] = reference.isoformat().replace("+00:00", "Z")
+        return payload
+
+    return build
+
+
 @pytest.fixture(name="mock_smhi_api")
 def mock_smhi_api_fixture():
     """Mock the SMHI API client."""
@@ -0,0 +1,72 @@
+"""Test the SMHI ODP payload schema adapters."""
+import pytest
+
+from custom_components.smhi_odp.core.adapters import (
+    Pmp3gAdapter,
+    SchemaAdapter,
+    Snow1gAdapter,
+    detect_adapter,
+    in_coverage,
+)
+
+SNOW1G = {
+    "timeSeries": [
+        {"time": "2026-10-19T12:00:00Z", "data": {"air_temperature": 15.0, "symbol_code": 3}},
+        {"time": "2026-10-19T13:00:00Z", "data": {"air_temperature": 16.0, "symbol_code": 4}},
+    ]
+}
+
+PMP3G = {
+    "timeSeries": [
+        {
+            "validTime": "2026-10-19T12:00:00Z",
+            "parameters": [
+                {"name": "t", "values": [15.0]},
+                {"name": "pmean", "values": [0.4]},
+                {"name": "Wsymb2", "values": [18]},
+            ],
+        }
+    ]
+}
+
+
+def test_detect_and_extract() -> None:
+    """Test both formats are detected and extracted to snow1g names."""
+    assert isinstance(detect_adapter(SNOW1G), Snow1gAdapter)
+    assert isinstance(detect_adapter(PMP3G), Pmp3gAdapter)
+    assert detect_adapter({"timeSeries": []}) is None
+
+    times, rows, symbols = detect_adapter(SNOW1G).extract(SNOW1G)
+    assert len(times) == 2
+    assert symbols == [3, 4]
+
+    times, rows, symbols = detect_adapter(PMP3G).extract(PMP3G)
+    assert rows == [
+        {
+            "air_temperature": 15.0,
+            "precipitation_amount_mean": 0.4,
+            "symbol_code": 18,
+        }
+    ]
+    assert symbols == [18]
+
+
+def test_incomplete_adapter_is_rejected() -> None:
+    """Test an adapter missing part of the interface cannot be created."""
+
+    class MatchOnly(SchemaAdapter):
+        name = "match-only"
+
+        def matches(self, payload: dict) -> bool:
+            return True
+
+    with pytest.raises(TypeError):
+        MatchOnly()
+
+
+def test_in_coverage() -> None:
+    """Test coordinates are checked against the forecast area."""
+    assert in_coverage(59.3293, 18.0686)
+    assert in_coverage(68.35, 18.83)
+    assert not in_coverage(48.85, 2.35)
+    assert not in_coverage(59.33, 45.0)
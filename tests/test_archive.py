@@ -0,0 +1,72 @@
+"""Test the forecast archive and its verification."""
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import tempfile
+
+from custom_components.smhi_odp.core.archive import ForecastArchive, verify
+from custom_components.smhi_odp.core.model import build_forecast
+
+START = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _run(forecast_payload, issued: datetime, bias: float) -> dict:
+    """Return an hourly run whose temperature error grows with lead time.
+
+    The true temperature is 10 °C plus the hour of day; each run is off by
+    `bias` per 24 hours of lead time.
+    """
+    return forecast_payload(
+        [
+            {
+                "air_temperature": 10.0
+                + (issued + timedelta(hours=h)).hour
+                + bias * h / 24,
+                "wind_speed": 5.0,
+            }
+            for h in range(1, 80)
+        ],
+        issued,
+        reference=issued,
+    )
+
+
+def test_archive_ring_and_verification(forecast_payload) -> None:
+    """Test runs are archived once, wrap around, and are verified."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, "archive")
+        archive = ForecastArchive(path, capacity=8000)
+        for run in range(96):
+            issued = START + timedelta(hours=run)
+            forecast = build_forecast(_run(forecast_payload, issued, 1.0), timezone.utc)
+            assert archive.append_run(forecast) == 72
+            # The same run is not archived twice
+            assert archive.append_run(forecast) == 0
+        assert len(archive) == 96 * 72
+        results = verify(archive.records(START + timedelta(days=4)))
+        archive.close()
+
+        # Reopening keeps the records; a different layout starts over
+        reopened = ForecastArchive(path, capacity=8000)
+        assert len(reopened) == 96 * 72
+        reopened.close()
+        small = ForecastArchive(path, capacity=100)
+        assert len(small) == 0
+
+        # A full ring overwrites the oldest records
+        for run in range(3):
+            issued = START + timedelta(hours=run)
+            payload = _run(forecast_payload, issued, 0.0)
+            small.append_run(build_forecast(payload, timezone.utc))
+        assert len(small) == 100
+        assert min(record[0] for record in small.records(START)) == int(
+            (START + timedelta(hours=1)).timestamp()
+        )
+        small.close()
+
+    # Truth is the value forecast 1 h ahead, itself 1/24 °C too warm
+    temperature = results[24]["air_temperature"]
+    assert temperature["samples"] > 0
+    assert abs(temperature["bias"] - (1.0 - 1 / 24)) < 0.01
+    assert abs(results[48]["air_temperature"]["mae"] - (2.0 - 1 / 24)) < 0.01
+    assert results[24]["wind_speed"]["bias"] == 0.0
+    assert results[24]["relative_humidity"]["samples"] == 0
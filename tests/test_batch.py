@@ -0,0 +1,107 @@
+"""Test the batch forecast command line engine."""
+from datetime import datetime, timedelta, timezone
+import io
+import json
+from pathlib import Path
+import tempfile
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.smhi_odp.core.batch import (
+    DAILY_FIELDS,
+    LOCATION_FIELDS,
+    CsvWriter,
+    DiskCache,
+    NdjsonWriter,
+    read_locations,
+    run_batch,
+)
+
+PAYLOAD = {
+    "timeSeries": [
+        {
+            "time": (
+                datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+                + timedelta(hours=h)
+            ).isoformat(),
+            "data": {"air_temperature": float(h), "symbol_code": 1},
+        }
+        for h in range(48)
+    ]
+}
+
+
+def test_read_locations() -> None:
+    """Test files with and without a header are read."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with_header = Path(tmp, "a.csv")
+        with_header.write_text("name,latitude,longitude\nhome,59.3,18.0\nbad,x,1\n")
+        plain = Path(tmp, "b.csv")
+        plain.write_text("59.3,18.0\n\n60.1,15.2\n")
+
+        assert [(loc.key, loc.latitude) for loc in read_locations(with_header)] == [
+            ("home", 59.3)
+        ]
+        assert [loc.key for loc in read_locations(plain)] == ["59.3,18.0", "60.1,15.2"]
+
+
+async def test_run_batch_streams_rows_and_caches() -> None:
+    """Test every location is written and cached payloads are reused."""
+    with tempfile.TemporaryDirectory() as tmp:
+        locations_file = Path(tmp, "locations.csv")
+        locations_file.write_text(
+            "\n".join(f"{59 + i / 10},{18 + i / 10}" for i in range(5))
+        )
+        client = MagicMock()
+        client.forecast = AsyncMock(return_value=PAYLOAD)
+        cache = DiskCache(Path(tmp, "cache"), timedelta(hours=1))
+
+        out = io.StringIO()
+        done, failed = await run_batch(
+            read_locations(locations_file),
+            NdjsonWriter(out, LOCATION_FIELDS + DAILY_FIELDS),
+            client=client,
+            tz=timezone.utc,
+            concurrency=2,
+            rate=0,
+            cache=cache,
+        )
+        assert (done, failed) == (5, 0)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert {row["location"] for row in rows} == {
+            f"{59 + i / 10},{18 + i / 10}" for i in range(5)
+        }
+        assert client.forecast.await_count == 5
+
+        # The second run is served from the cache
+        out = io.StringIO()
+        writer = CsvWriter(out, LOCATION_FIELDS + DAILY_FIELDS)
+        await run_batch(
+            read_locations(locations_file),
+            writer,
+            client=client,
+            tz=timezone.utc,
+            rate=0,
+            cache=cache,
+        )
+        assert client.forecast.await_count == 5
+        assert out.getvalue().splitlines()[0].startswith("location,latitude")
+
+
+async def test_run_batch_continues_after_failures() -> None:
+    """Test a failing location is counted and the rest are written."""
+    with tempfile.TemporaryDirectory() as tmp:
+        locations_file = Path(tmp, "locations.csv")
+        locations_file.write_text("59.0,18.0\n60.0,18.0\n")
+        client = MagicMock()
+        client.forecast = AsyncMock(side_effect=[ValueError("bad"), PAYLOAD])
+
+        out = io.StringIO()
+        done, failed = await run_batch(
+            read_locations(locations_file),
+            NdjsonWriter(out, ()),
+            client=client,
+            tz=timezone.utc,
+            concurrency=1,
+            rate=0,
+        )
+        assert (done, failed) == (1, 1)
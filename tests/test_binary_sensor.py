@@ -0,0 +1,38 @@
+"""Test the SMHI ODP weather warning binary sensor."""
+from unittest.mock import MagicMock
+
+from custom_components.smhi_odp.binary_sensor import SmhiWarningBinarySensor
+from custom_components.smhi_odp.core.warning_areas import WarningArea
+
+
+def _warnings(*levels: str) -> list[WarningArea]:
+    """Return warning areas of some levels without an end time."""
+    return [
+        WarningArea(
+            warning_id=str(i),
+            event="Wind",
+            level=level,
+            area_name=f"Area {i}",
+            description="",
+            start=None,
+            end=None,
+            polygons=(),
+            bbox=(17.0, 59.0, 19.0, 61.0),
+        )
+        for i, level in enumerate(levels)
+    ]
+
+
+def test_messages_do_not_turn_the_sensor_on() -> None:
+    """Test only warning levels turn the safety sensor on."""
+    coordinator = MagicMock()
+    entry = MagicMock(entry_id="abc", data={"name": "Home"})
+    sensor = SmhiWarningBinarySensor(coordinator, entry)
+
+    coordinator.warnings_for.return_value = _warnings("MESSAGE")
+    assert not sensor.is_on
+    assert sensor.extra_state_attributes["level"] == "message"
+
+    coordinator.warnings_for.return_value = _warnings("MESSAGE", "YELLOW")
+    assert sensor.is_on
+    assert sensor.extra_state_attributes["level"] == "yellow"
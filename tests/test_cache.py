@@ -0,0 +1,53 @@
+"""Test the disk cache shared by the batch engine and the integration."""
+from datetime import timedelta
+import os
+from pathlib import Path
+import tempfile
+import time
+
+import pytest
+
+from custom_components.smhi_odp.core import cache as cache_module
+from custom_components.smhi_odp.core.cache import DiskCache
+
+
+def test_put_and_get() -> None:
+    """Test payloads are stored atomically and expire."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(Path(tmp), timedelta(minutes=10))
+        key = ("forecast", "off", 59.3293, 18.0686)
+
+        assert cache.get(key) is None
+        cache.put(key, {"timeSeries": [1]})
+        cache.put(key, {"timeSeries": [2]})
+
+        assert cache.get(key) == {"timeSeries": [2]}
+        # No temporary files are left behind
+        assert [p.suffix for p in Path(tmp).iterdir()] == [".json"]
+
+        # Older than the allowed age
+        path = next(Path(tmp).iterdir())
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+        assert cache.get(key) is None
+        assert cache.get(key, max_age=timedelta(hours=2)) == {"timeSeries": [2]}
+
+
+@pytest.mark.skipif(cache_module.fcntl is None, reason="needs fcntl")
+def test_lock_is_exclusive() -> None:
+    """Test a held key lock makes others wait and give up after the timeout."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskCache(Path(tmp), timedelta(minutes=10))
+        key = ("forecast", "off", 59.0, 18.0)
+
+        with cache.lock(key) as lock:
+            assert lock is not None
+            assert cache.lock(key, timeout=0.2) is None
+            # Other keys are not affected
+            other = cache.lock(("forecast", "off", 60.0, 18.0), timeout=0)
+            assert other is not None
+            other.release()
+
+        again = cache.lock(key, timeout=0)
+        assert again is not None
+        again.release()
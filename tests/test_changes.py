@@ -0,0 +1,82 @@
+"""Test forecast change detection between generations."""
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from custom_components.smhi_odp.core.changes import ChangeThresholds, diff_forecasts
+from custom_components.smhi_odp.core.model import build_forecast
+
+START = datetime(2026, 10, 19, 0, tzinfo=timezone.utc)
+
+
+def _forecast(
+    forecast_payload, hours: int, offset: int, temperature, precipitation, gust
+):
+    """Build an hourly forecast whose values are functions of the hour."""
+    steps = range(offset, offset + hours)
+    payload = forecast_payload(
+        [
+            {
+                "air_temperature": temperature(h),
+                "precipitation_amount_mean": precipitation(h),
+                "wind_speed_of_gust": gust(h),
+            }
+            for h in steps
+        ],
+        START,
+        steps,
+    )
+    return build_forecast(payload, ZoneInfo("UTC"))
+
+
+def test_no_changes(forecast_payload) -> None:
+    """Test identical forecasts produce no events."""
+    forecast = _forecast(
+        forecast_payload, 48, 0, lambda h: 5.0, lambda h: 0.0, lambda h: 5.0
+    )
+    assert diff_forecasts(forecast, forecast, ChangeThresholds()) == []
+    assert diff_forecasts(None, forecast, ChangeThresholds()) == []
+
+
+def test_changes_on_aligned_timestamps(forecast_payload) -> None:
+    """Test onset shifts, frost and gusts are reported for shared steps."""
+    previous = _forecast(
+        forecast_payload,
+        48,
+        0,
+        lambda h: 5.0,
+        lambda h: 1.0 if h >= 30 else 0.0,
+        lambda h: 5.0,
+    )
+    # The new generation starts an hour later and moves rain 6 h earlier,
+    # adds a frost night on the 20th and a gusty afternoon
+    current = _forecast(
+        forecast_payload,
+        48,
+        1,
+        lambda h: -2.0 if h == 27 else 5.0,
+        lambda h: 1.0 if h >= 24 else 0.0,
+        lambda h: 20.0 if 14 <= h < 16 else 5.0,
+    )
+
+    changes = diff_forecasts(previous, current, ChangeThresholds())
+
+    assert changes == [
+        {
+            "type": "precipitation_onset",
+            "previous": "2026-10-20T06:00:00+00:00",
+            "current": "2026-10-20T00:00:00+00:00",
+        },
+        {
+            "type": "frost",
+            "date": "2026-10-20",
+            "expected": True,
+            "previous_min_temperature": 5.0,
+            "min_temperature": -2.0,
+        },
+        {
+            "type": "wind_gust",
+            "expected": True,
+            "start": "2026-10-19T14:00:00+00:00",
+            "max_gust": 20.0,
+        },
+    ]
@@ -0,0 +1,99 @@
+"""Test the SMHI core client."""
+from datetime import timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from custom_components.smhi_odp.core.client import SmhiClient, async_fetch_payload
+from custom_components.smhi_odp.core.model import build_forecast
+
+PMP3G = {
+    "timeSeries": [
+        {
+            "validTime": "2025-01-01T12:00:00Z",
+            "parameters": [{"name": "t", "values": [1.5]}],
+        }
+    ]
+}
+
+
+async def test_fetch_falls_back_to_pmp3g() -> None:
+    """Test a failing snow1g endpoint falls back to pmp3g."""
+    failing = MagicMock()
+    failing.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "503", request=MagicMock(), response=MagicMock()
+    )
+    working = MagicMock()
+    working.json.return_value = PMP3G
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=[failing, working])
+
+    assert await async_fetch_payload(client, 59.3293, 18.0686) == PMP3G
+    assert "pmp3g" in client.get.mock_calls[1].args[0]
+
+
+async def test_fetch_raises_when_all_endpoints_fail() -> None:
+    """Test the last error is raised when no endpoint works."""
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=httpx.ConnectError("down"))
+
+    with pytest.raises(httpx.ConnectError):
+        await async_fetch_payload(client, 59.3293, 18.0686)
+
+
+async def test_conditional_request() -> None:
+    """Test validators are sent back and a 304 returns no payload."""
+    first = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+    first.json.return_value = {"timeSeries": []}
+    unchanged = MagicMock(status_code=httpx.codes.NOT_MODIFIED)
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=[first, unchanged])
+    smhi = SmhiClient(client)
+
+    payload, validators = await smhi.get_json_if_modified("https://x", {})
+    assert payload == {"timeSeries": []}
+    assert validators == {"ETag": '"abc"'}
+
+    payload, validators = await smhi.get_json_if_modified("https://x", validators)
+    assert payload is None
+    assert validators == {"ETag": '"abc"'}
+    assert client.get.mock_calls[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+
+async def test_forecast_parses_without_home_assistant() -> None:
+    """Test the client and model work on their own."""
+    client = MagicMock()
+    response = MagicMock()
+    response.json.return_value = PMP3G
+    failing = MagicMock()
+    failing.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "404", request=MagicMock(), response=MagicMock()
+    )
+    client.get = AsyncMock(side_effect=[failing, response])
+
+    async with SmhiClient(client) as smhi:
+        forecast = build_forecast(await smhi.forecast(59.3, 18.0), timezone.utc)
+    assert forecast.column("air_temperature") == [1.5]
+    client.aclose.assert_not_called()
+
+
+async def test_forecasts_returns_errors_per_point() -> None:
+    """Test many locations are fetched and a failing one does not fail the rest."""
+    response = MagicMock()
+    response.json.return_value = PMP3G
+    client = MagicMock()
+
+    async def get(url, **kwargs):
+        if "lat/60" in url:
+            raise httpx.ConnectError("down")
+        return response
+
+    client.get = AsyncMock(side_effect=get)
+
+    results = await SmhiClient(client).forecasts(
+        [(59.0, 18.0), (60.0, 18.0), (61.0, 18.0)], concurrency=2
+    )
+    assert results[0] == PMP3G
+    assert isinstance(results[1], httpx.ConnectError)
+    assert results[2] == PMP3G
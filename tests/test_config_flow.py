@@ -23,11 +23,16 @@ async def test_form(hass: HomeAssistant) -> None:
         "custom_components.smhi_odp.config_flow.httpx_client.get_async_client"
     ) as mock_get_client:
         # Create a mock HTTP client that returns a successful response
-        from unittest.mock import AsyncMock
+        from unittest.mock import AsyncMock, MagicMock
         mock_client = AsyncMock()
-        mock_response = AsyncMock()
+        mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.raise_for_status = AsyncMock()
+        mock_response.json.return_value = {
+            "geometry": {"type": "Point", "coordinates": [18.071093, 59.331257]},
+            "timeSeries": [
+                {"time": "2026-10-19T12:00:00Z", "data": {"air_temperature": 15.0}}
+            ],
+        }
         mock_client.get = AsyncMock(return_value=mock_response)
         mock_get_client.return_value = mock_client
         
@@ -51,4 +56,33 @@ async def test_form(hass: HomeAssistant) -> None:
         "longitude": 18.0686,
     }
     assert len(mock_setup_entry.mock_calls) == 1
+    assert len(mock_client.get.mock_calls) == 1
 
+    # The unique ID is the SMHI grid point, not the raw user coordinates
+    assert result2["result"].unique_id == "59.331257-18.071093"
+
+    # The validated payload is kept to seed the coordinator's first refresh
+    assert "59.331257-18.071093" in hass.data[DOMAIN]["seeds"]
+
+
+async def test_options_flow(hass: HomeAssistant) -> None:
+    """Test the opt-in features can be enabled from the options flow."""
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 59.3293, "longitude": 18.0686},
+    )
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.smhi_odp.async_setup_entry", return_value=True):
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "init"
+
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {"import_statistics": True}
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options == {"import_statistics": True}
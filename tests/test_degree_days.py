@@ -0,0 +1,49 @@
+"""Test the degree-day calculation."""
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.smhi_odp.core.degree_days import (
+    DegreeDaySettings,
+    degree_days,
+    wind_chill,
+)
+from custom_components.smhi_odp.core.model import build_forecast
+
+START = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+def test_degree_days_weight_time_steps(forecast_payload) -> None:
+    """Test degree-hours are weighted by step length and grouped by day."""
+    # Hourly steps at 7 °C, then a 6 hour step at 29 °C
+    hours = [*range(1, 13), 18]
+    steps = [{"air_temperature": 7.0, "wind_speed": 0.0}] * 12 + [
+        {"air_temperature": 29.0, "wind_speed": 0.0}
+    ]
+    forecast = build_forecast(forecast_payload(steps, START, hours), timezone.utc)
+
+    (day,) = degree_days(forecast, DegreeDaySettings(heating_base=17.0))
+
+    assert day.hours == 18
+    # 12 h at 10 degrees below the base
+    assert day.heating == pytest.approx(120 / 24, abs=0.01)
+    # 6 h at 9 degrees above the cooling base
+    assert day.cooling == pytest.approx(54 / 24, abs=0.01)
+    assert day.mean_temperature == pytest.approx((12 * 7 + 6 * 29) / 18, abs=0.1)
+
+
+def test_wind_chill_adjustment(forecast_payload) -> None:
+    """Test cold, windy steps count with their wind chill temperature."""
+    assert wind_chill(-10.0, 10.0) == pytest.approx(-20.3, abs=0.1)
+    # Not defined in warm weather or calm air
+    assert wind_chill(15.0, 10.0) == 15.0
+    assert wind_chill(-10.0, 0.5) == -10.0
+
+    forecast = build_forecast(
+        forecast_payload([{"air_temperature": -10.0, "wind_speed": 10.0}] * 4, START),
+        timezone.utc,
+    )
+    plain = degree_days(forecast)[0]
+    adjusted = degree_days(forecast, DegreeDaySettings(wind_chill=True))[0]
+    assert adjusted.heating > plain.heating
+    assert adjusted.mean_temperature < plain.mean_temperature
@@ -0,0 +1,66 @@
+"""Test weather event detection and the event index."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.smhi_odp.core.events import (
+    EVENT_FROST,
+    EVENT_RAIN,
+    EVENT_SNOW,
+    EVENT_WIND,
+    EventIndex,
+    detect_events,
+)
+from custom_components.smhi_odp.core.model import build_forecast
+
+START = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+def _step(temperature: float, rate: float, gust: float) -> dict:
+    """Return the data of a step from its precipitation mm/h and gust m/s."""
+    return {
+        "air_temperature": temperature,
+        "precipitation_amount_mean": rate,
+        "wind_speed_of_gust": gust,
+    }
+
+
+def test_detect_events(forecast_payload) -> None:
+    """Test runs of flagged steps become one event each."""
+    steps = (
+        [_step(-2.0, 0.0, 5.0)] * 3  # frost
+        + [_step(-1.0, 1.0, 5.0)] * 2  # frost and snow
+        + [_step(5.0, 2.0, 20.0)] * 2  # rain and wind
+        + [_step(5.0, 0.0, 5.0)] * 2
+        + [_step(5.0, 0.5, 5.0)]  # rain
+    )
+    events = detect_events(
+        build_forecast(forecast_payload(steps, START), timezone.utc)
+    )
+
+    assert [(e.kind, e.start, e.end) for e in events] == [
+        (EVENT_FROST, START, START + timedelta(hours=5)),
+        (EVENT_SNOW, START + timedelta(hours=3), START + timedelta(hours=5)),
+        (EVENT_RAIN, START + timedelta(hours=5), START + timedelta(hours=7)),
+        (EVENT_WIND, START + timedelta(hours=5), START + timedelta(hours=7)),
+        (EVENT_RAIN, START + timedelta(hours=9), START + timedelta(hours=10)),
+    ]
+    assert events[0].peak == -2.0
+    assert events[2].peak == 4.0
+    assert events[3].summary == "Strong wind (gusts up to 20 m/s)"
+
+
+def test_event_index_range_queries(forecast_payload) -> None:
+    """Test overlapping events are found, including long earlier ones."""
+    steps = [_step(-2.0, 0.0, 5.0)] * 48 + [_step(5.0, 1.0, 5.0)] * 2
+    forecast = build_forecast(forecast_payload(steps, START), timezone.utc)
+    index = EventIndex(detect_events(forecast))
+    assert len(index) == 2
+
+    # The long frost event started before the range but overlaps it
+    found = index.between(START + timedelta(hours=40), START + timedelta(hours=41))
+    assert [e.kind for e in found] == [EVENT_FROST]
+    found = index.between(START + timedelta(hours=47), START + timedelta(hours=60))
+    assert [e.kind for e in found] == [EVENT_FROST, EVENT_RAIN]
+    assert index.between(START + timedelta(hours=60), START + timedelta(hours=70)) == []
+
+    assert index.current_or_next(START + timedelta(hours=48)).kind == EVENT_RAIN
+    assert index.current_or_next(START + timedelta(hours=60)) is None
@@ -0,0 +1,79 @@
+"""Test the OpenMetrics and line protocol export."""
+from datetime import datetime, timezone
+
+from custom_components.smhi_odp.core.export import (
+    Timings,
+    line_protocol,
+    openmetrics_families,
+    render_openmetrics,
+    timings_line_protocol,
+)
+from custom_components.smhi_odp.core.model import build_forecast, build_view
+from custom_components.smhi_odp.core.snapshot import build_snapshot
+
+PAYLOAD = {
+    "referenceTime": "2026-10-01T00:00:00Z",
+    "timeSeries": [
+        {
+            "time": f"2026-10-01T{hour:02d}:00:00Z",
+            "data": {"air_temperature": 5.0 + hour, "wind_speed": 3.0},
+        }
+        for hour in range(1, 3)
+    ],
+}
+
+
+def _snapshot(entry_id: str, name: str):
+    """Return the snapshot of the test payload for one location."""
+    forecast = build_forecast(PAYLOAD, timezone.utc)
+    view = build_view(forecast, datetime(2026, 10, 1, tzinfo=timezone.utc), ())
+    return build_snapshot(
+        forecast,
+        view,
+        entry_id=entry_id,
+        name=name,
+        latitude=59.3,
+        longitude=18.0,
+        generation=1,
+    )
+
+
+def test_openmetrics_groups_families_across_locations() -> None:
+    """Test every family is written once, with all locations' samples."""
+    home = openmetrics_families(_snapshot("a", "Home"))
+    cabin = openmetrics_families(_snapshot("b", 'The "cabin"'))
+    timings = [Timings("a", "Home", 1, 0.25, None)]
+
+    document = b"".join(render_openmetrics([home, cabin], timings)).decode()
+    lines = document.splitlines()
+
+    assert lines.count("# TYPE smhi_odp_forecast_air_temperature gauge") == 1
+    start = lines.index("# TYPE smhi_odp_forecast_air_temperature gauge")
+    assert lines[start + 1 : start + 5] == [
+        'smhi_odp_forecast_air_temperature{entry_id="a",location="Home",lead_hours="1"} 6.0',
+        'smhi_odp_forecast_air_temperature{entry_id="a",location="Home",lead_hours="2"} 7.0',
+        'smhi_odp_forecast_air_temperature{entry_id="b",location="The \\"cabin\\"",lead_hours="1"} 6.0',
+        'smhi_odp_forecast_air_temperature{entry_id="b",location="The \\"cabin\\"",lead_hours="2"} 7.0',
+    ]
+    assert (
+        'smhi_odp_fetch_duration_seconds{entry_id="a",location="Home"} 0.25' in lines
+    )
+    assert not any(line.startswith("smhi_odp_parse_duration_seconds{") for line in lines)
+    assert lines[-1] == "# EOF"
+
+
+def test_line_protocol() -> None:
+    """Test one line per step, stamped with its valid time."""
+    lines = line_protocol(_snapshot("a", "My home")).decode().splitlines()
+
+    assert len(lines) == 2
+    assert lines[0].startswith("smhi_odp_forecast,entry_id=a,location=My\\ home ")
+    assert "air_temperature=6.0" in lines[0]
+    assert "wind_speed=3.0" in lines[0]
+    assert lines[0].endswith(" 1790816400000000000")
+
+    timings = timings_line_protocol([Timings("a", None, 4, 0.5, 0.01)]).decode()
+    assert timings == (
+        "smhi_odp_timings,entry_id=a,location=- "
+        "generation=4i,fetch_seconds=0.5,parse_seconds=0.01\n"
+    )
@@ -0,0 +1,86 @@
+"""Test the night frost risk."""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.smhi_odp.core.frost import (
+    dew_point,
+    frost_nights,
+    probability,
+    severity,
+    surface_temperatures,
+)
+from custom_components.smhi_odp.core.model import build_forecast
+
+START = datetime(2026, 5, 10, 12, tzinfo=timezone.utc)
+
+
+def _steps(temperature: float, cloud: float, wind: float) -> list[dict]:
+    """Return the data of 24 hourly steps with the same conditions."""
+    step = {
+        "air_temperature": temperature,
+        "relative_humidity": 60.0,
+        "cloud_area_fraction": cloud,
+        "wind_speed": wind,
+    }
+    return [step] * 24
+
+
+def test_dew_point() -> None:
+    """Test the Magnus formula against tabulated values."""
+    assert dew_point(20.0, 100.0) == pytest.approx(20.0)
+    assert dew_point(20.0, 50.0) == pytest.approx(9.3, abs=0.1)
+
+
+def test_surface_cooling() -> None:
+    """Test clear calm nights cool most, limited by the dew point."""
+    assert surface_temperatures(
+        [3.0, 3.0, 3.0, 3.0, None],
+        [None, None, None, 2.5, None],
+        [0.0, 8.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 6.0, 0.0, 0.0],
+    ) == [-1.0, 3.0, 3.0, 1.5, None]
+
+
+def test_probability_and_severity() -> None:
+    """Test the logistic probability and the severity bands."""
+    assert probability(0.0) == 50
+    assert probability(-5.0) == 99
+    assert probability(100.0) == 0
+    assert [severity(t) for t in (1.0, -1.0, -3.0, -5.0)] == [
+        "none",
+        "light",
+        "moderate",
+        "severe",
+    ]
+
+
+def test_frost_nights(forecast_payload) -> None:
+    """Test a clear calm night is at risk and a cloudy windy one is not."""
+    night = (
+        date(2026, 5, 10),
+        datetime(2026, 5, 10, 19, tzinfo=timezone.utc),
+        datetime(2026, 5, 11, 3, tzinfo=timezone.utc),
+    )
+    clear = build_forecast(
+        forecast_payload(_steps(2.0, 0.0, 0.0), START), timezone.utc
+    )
+    cloudy = build_forecast(
+        forecast_payload(_steps(2.0, 8.0, 8.0), START), timezone.utc
+    )
+
+    # At 60 % humidity the dew point is far too low to limit the cooling
+    clear_night = frost_nights(clear, [night])[0]
+    assert clear_night.surface_temperature == pytest.approx(-2.0)
+    assert clear_night.min_temperature == 2.0
+    assert clear_night.probability == 88
+    assert clear_night.severity == "light"
+
+    cloudy_night = frost_nights(cloudy, [night])[0]
+    assert cloudy_night.surface_temperature == 2.0
+    assert cloudy_night.probability == 12
+    assert cloudy_night.severity == "none"
+
+    # Nights beyond the forecast are left out
+    later = (night[0] + timedelta(days=5), *(t + timedelta(days=5) for t in night[1:]))
+    assert frost_nights(clear, [later]) == []
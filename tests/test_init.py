@@ -1,6 +1,10 @@
 """Test component setup."""
+from unittest.mock import patch
+
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from custom_components.smhi_odp import build_forecast
 from custom_components.smhi_odp.const import DOMAIN
 
 async def test_async_setup_entry(hass: HomeAssistant, mock_smhi_api) -> None:
@@ -30,3 +34,83 @@ async def test_async_setup_entry(hass: HomeAssistant, mock_smhi_api) -> None:
     # Ensure it's removed from data (except if integration leaves empty dict, but standard is to clean up)
     # Based on our __init__.py code: hass.data[DOMAIN].pop(entry.entry_id)
     assert entry.entry_id not in hass.data.get("smhi_odp", {})
+
+
+async def test_setup_entry_uses_config_flow_seed(hass: HomeAssistant, mock_smhi_api) -> None:
+    """Test a payload validated by the config flow is not fetched again."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="59.331257-18.071093",
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+    )
+    entry.add_to_hass(hass)
+    hass.data.setdefault(DOMAIN, {})["seeds"] = {
+        entry.unique_id: (dt_util.utcnow(), mock_smhi_api.return_value)
+    }
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state.name == "LOADED"
+    assert mock_smhi_api.call_count == 0
+    assert hass.data[DOMAIN][entry.entry_id].data == mock_smhi_api.return_value
+    assert entry.unique_id not in hass.data[DOMAIN]["seeds"]
+
+
+async def test_listener_updates_reuse_the_parsed_forecast(
+    hass: HomeAssistant, mock_smhi_api
+) -> None:
+    """Test unchanged data is not parsed again on every listener update."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    parse_duration = coordinator.parse_duration
+
+    with patch(
+        "custom_components.smhi_odp.build_forecast", wraps=build_forecast
+    ) as parse:
+        coordinator.async_update_listeners()
+        coordinator.async_update_listeners()
+        assert parse.call_count == 0
+        assert coordinator.parse_duration == parse_duration
+
+        coordinator.async_set_updated_data(dict(mock_smhi_api.return_value))
+        assert parse.call_count == 1
+
+
+async def test_setup_migrates_coordinate_unique_id(
+    hass: HomeAssistant, mock_smhi_api
+) -> None:
+    """Test an entry keyed by raw coordinates is rekeyed to its grid point."""
+    mock_smhi_api.return_value = {
+        **mock_smhi_api.return_value,
+        "geometry": {"type": "Point", "coordinates": [18.071093, 59.331257]},
+    }
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="59.3293-18.0686",
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.unique_id == "59.331257-18.071093"
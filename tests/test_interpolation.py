@@ -0,0 +1,131 @@
+"""Test forecasts blended from neighbouring grid points."""
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.smhi_odp.core.interpolation import (
+    PointCache,
+    async_fetch_interpolated,
+    bilinear_weights,
+    blend,
+    lattice_corners,
+)
+
+
+START = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _point(
+    forecast_payload,
+    lon: float,
+    lat: float,
+    temperature: float,
+    direction: float,
+    hours=3,
+):
+    """Return a snow1g-style payload of one grid point."""
+    payload = forecast_payload(
+        [
+            {
+                "air_temperature": temperature,
+                "wind_from_direction": direction,
+                "symbol_code": int(temperature),
+            }
+            for _ in range(hours)
+        ],
+        START,
+        range(hours),
+    )
+    payload["geometry"] = {"type": "Point", "coordinates": [lon, lat]}
+    return payload
+
+
+def test_lattice_corners_surround_the_location() -> None:
+    """Test the corners enclose the location and the weights sum to one."""
+    corners, north, east = lattice_corners(59.3293, 18.0686)
+    (south, west), _, _, (top, right) = corners
+    assert south <= 59.3293 <= top
+    assert west <= 18.0686 <= right
+    assert 0 <= north <= 1 and 0 <= east <= 1
+    assert sum(bilinear_weights(north, east)) == pytest.approx(1)
+    assert bilinear_weights(0, 0) == [1, 0, 0, 0]
+
+
+def test_blend_aligns_and_weights(forecast_payload) -> None:
+    """Test shared timestamps are blended and directions wrap around north."""
+    payload = blend(
+        [
+            _point(forecast_payload, 18.0, 59.0, 0.0, 350.0, hours=3),
+            _point(forecast_payload, 18.1, 59.0, 10.0, 10.0, hours=2),
+        ],
+        [0.75, 0.25],
+        59.0,
+        18.02,
+    )
+    series = payload["timeSeries"]
+    assert len(series) == 2
+    data = series[0]["data"]
+    assert data["air_temperature"] == 2.5
+    assert data["wind_from_direction"] == pytest.approx(355.0, abs=0.1)
+    # The symbol comes from the heaviest point rather than being averaged
+    assert data["symbol_code"] == 0
+    assert payload["geometry"]["coordinates"] == [18.02, 59.0]
+
+
+def test_blend_drops_fill_values(forecast_payload) -> None:
+    """Test a neighbour's -9 fill value drops out of the weighted mean."""
+    points = [
+        _point(forecast_payload, 18.0, 59.0, 0.0, 0.0),
+        _point(forecast_payload, 18.1, 59.0, 0.0, 0.0),
+    ]
+    points[0]["timeSeries"][0]["data"]["precipitation_frozen_part"] = -9
+    points[1]["timeSeries"][0]["data"]["precipitation_frozen_part"] = 0.8
+
+    data = blend(points, [0.5, 0.5], 59.0, 18.05)["timeSeries"][0]["data"]
+    assert data["precipitation_frozen_part"] == 0.8
+    # Temperatures below zero are values, not fill values
+    points[0]["timeSeries"][0]["data"]["air_temperature"] = -9.0
+    data = blend(points, [0.5, 0.5], 59.0, 18.05)["timeSeries"][0]["data"]
+    assert data["air_temperature"] == -4.5
+
+
+def test_blend_keeps_category_codes(forecast_payload) -> None:
+    """Test precipitation types come from the heaviest point, not a mean."""
+    points = [
+        _point(forecast_payload, 18.0, 59.0, 0.0, 0.0),
+        _point(forecast_payload, 18.1, 59.0, 0.0, 0.0),
+    ]
+    points[0]["timeSeries"][0]["data"]["predominant_precipitation_type_at_surface"] = 1
+    points[1]["timeSeries"][0]["data"]["predominant_precipitation_type_at_surface"] = 3
+
+    data = blend(points, [0.4, 0.6], 59.0, 18.05)["timeSeries"][0]["data"]
+    assert data["predominant_precipitation_type_at_surface"] == 3
+    # A point without a code leaves it to the next heaviest
+    del points[1]["timeSeries"][0]["data"]["predominant_precipitation_type_at_surface"]
+    data = blend(points, [0.4, 0.6], 59.0, 18.05)["timeSeries"][0]["data"]
+    assert data["predominant_precipitation_type_at_surface"] == 1
+
+
+async def test_neighbours_share_corner_downloads(forecast_payload) -> None:
+    """Test two nearby locations download their shared corners once."""
+
+    async def get(url):
+        response = MagicMock()
+        lon = float(url.split("/lon/")[1].split("/")[0])
+        lat = float(url.split("/lat/")[1].split("/")[0])
+        response.json.return_value = _point(forecast_payload, lon, lat, lat, 180.0)
+        return response
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=get)
+    cache = PointCache()
+
+    first, second = await asyncio.gather(
+        async_fetch_interpolated(client, 59.3293, 18.0686, "bilinear", cache),
+        async_fetch_interpolated(client, 59.3300, 18.0690, "idw", cache),
+    )
+    assert client.get.await_count == 4
+    assert 59.3 < first["timeSeries"][0]["data"]["air_temperature"] < 59.35
+    assert second["timeSeries"][0]["data"]["wind_from_direction"] == 180.0
@@ -0,0 +1,41 @@
+"""Test the metrics export view."""
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.smhi_odp.const import DOMAIN
+
+
+async def test_metrics_view(
+    hass: HomeAssistant, hass_client, hass_client_no_auth, mock_smhi_api
+) -> None:
+    """Test the series are served in both formats to authenticated clients."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_client()
+    response = await client.get("/api/smhi_odp/metrics")
+    assert response.status == 200
+    assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+    body = await response.text()
+    assert f'smhi_odp_forecast_air_temperature{{entry_id="{entry.entry_id}"' in body
+    assert body.endswith("# EOF\n")
+
+    response = await client.get("/api/smhi_odp/metrics?format=influx")
+    assert response.status == 200
+    assert "air_temperature=15.0" in await response.text()
+
+    response = await client.get("/api/smhi_odp/metrics?format=csv")
+    assert response.status == 400
+
+    unauthenticated = await hass_client_no_auth()
+    response = await unauthenticated.get("/api/smhi_odp/metrics")
+    assert response.status == 401
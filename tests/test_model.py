@@ -0,0 +1,101 @@
+"""Test the SMHI ODP forecast model and entity view."""
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+from custom_components.smhi_odp.core.model import build_forecast, build_view
+
+TZ = ZoneInfo("Europe/Stockholm")
+
+
+START = datetime(2026, 10, 19, 10, tzinfo=timezone.utc)
+
+
+def _steps(hours: int) -> list[dict]:
+    """Return the data of hourly steps from START."""
+    return [
+        {
+            "air_temperature": 10.0 + h % 24,
+            "symbol_code": 3,
+            "precipitation_amount_mean": 0.0,
+        }
+        for h in range(hours)
+    ]
+
+
+def test_view_precomputes_entity_values(forecast_payload) -> None:
+    """Test every entity slot is computed from one parse of the payload."""
+    forecast = build_forecast(forecast_payload(_steps(48), START, range(48)), TZ)
+    view = build_view(forecast, datetime(2026, 10, 19, 12, tzinfo=TZ))
+
+    # Days are grouped by local date: 12:00-23:00 local is the rest of today
+    assert [day.date for day in forecast.days] == [
+        date(2026, 10, 19),
+        date(2026, 10, 20),
+        date(2026, 10, 21),
+    ]
+    assert view.condition == "partlycloudy"
+    assert view.value("temperature").native_value == 10.0
+    assert view.value("day_0").native_value == 21.0
+    assert view.value("day_1").native_value == 33.0
+    assert view.value("day_5").native_value is None
+    assert view.daily_forecast[0]["native_templow"] == 10.0
+
+
+def test_view_without_data() -> None:
+    """Test an empty payload yields an empty view."""
+    view = build_view(
+        build_forecast({"timeSeries": []}, TZ), datetime(2026, 10, 19, 12, tzinfo=TZ)
+    )
+    assert view.value("temperature").native_value is None
+    assert view.daily_forecast == []
+
+
+def test_daily_precipitation_integrates_time_steps(forecast_payload) -> None:
+    """Test daily totals use each entry's step instead of a x24 estimate."""
+    start = datetime(2026, 10, 19, 22, tzinfo=timezone.utc)  # 00:00 local
+    offsets = [0, 1, 2, 3, 6, 12]  # hourly, then 3 h and 6 h steps
+    payload = forecast_payload(
+        [
+            {
+                "air_temperature": 5.0,
+                "precipitation_amount_mean": 1.0,
+                "precipitation_amount_min": 0.0,
+                "precipitation_amount_max": 2.0,
+                "probability_of_precipitation": 5 * h,
+            }
+            for h in offsets
+        ],
+        start,
+        offsets,
+    )
+    forecast = build_forecast(payload, TZ)
+    assert forecast.step_hours == [1.0, 1.0, 1.0, 1.0, 3.0, 6.0]
+
+    day = build_view(forecast, datetime(2026, 10, 20, tzinfo=TZ)).daily_forecast[0]
+    assert day["native_precipitation"] == 13.0
+    assert day["precipitation_min"] == 0.0
+    assert day["precipitation_max"] == 26.0
+    assert day["precipitation_median"] is None
+    assert day["precipitation_probability"] == 60
+
+
+def test_hourly_forecast_starts_this_hour(forecast_payload) -> None:
+    """Test the hourly forecast skips steps before the current hour."""
+    forecast = build_forecast(forecast_payload(_steps(48), START, range(48)), TZ)
+    view = build_view(forecast, datetime(2026, 10, 19, 14, 30, tzinfo=TZ))
+
+    assert len(view.hourly_forecast) == 46
+    assert view.hourly_forecast[0]["datetime"] == "2026-10-19T12:00:00+00:00"
+    assert view.hourly_forecast[0]["native_temperature"] == 12.0
+    assert view.hourly_forecast[0]["native_precipitation"] == 0.0
+
+
+def test_view_only_computes_tracked_keys(forecast_payload) -> None:
+    """Test entity slots of disabled entities are not computed."""
+    forecast = build_forecast(forecast_payload(_steps(72), START, range(72)), TZ)
+    view = build_view(forecast, datetime(2026, 10, 19, 12, tzinfo=TZ), {"day_0"})
+
+    assert set(view.entities) == {"day_0"}
+    assert view.value("day_2").native_value is None
+    # The weather entity's forecasts do not depend on the tracked keys
+    assert len(view.daily_forecast) == 4
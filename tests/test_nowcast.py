@@ -0,0 +1,43 @@
+"""Test the nowcast ring buffer and summary."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.smhi_odp.core.nowcast import NowcastBuffer, summarize
+
+START = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _nowcast(forecast_payload, start: datetime, rates: list[float]) -> dict:
+    """Return a nowcast with 15-minute steps from `start`."""
+    return forecast_payload(
+        [{"precipitation_amount_mean": rate} for rate in rates],
+        start,
+        [i / 4 for i in range(len(rates))],
+    )
+
+
+def test_buffer_overwrites_and_drops_passed_steps(forecast_payload) -> None:
+    """Test newer issues overwrite their slots and old steps drop out."""
+    buffer = NowcastBuffer()
+    buffer.update(_nowcast(forecast_payload, START, [0.0] * 9))
+    assert len(buffer.steps(START + timedelta(minutes=7))) == 9
+
+    later = START + timedelta(minutes=30)
+    buffer.update(_nowcast(forecast_payload, later, [0.0, 0.4, 1.2, 0.8] + [0.0] * 5))
+    steps = buffer.steps(later + timedelta(minutes=1))
+    assert steps[0][0] == later
+    assert [rate for _, rate in steps[:4]] == [0.0, 0.4, 1.2, 0.8]
+    assert len(steps) == 9
+
+
+def test_summary(forecast_payload) -> None:
+    """Test the summary of the next hour."""
+    buffer = NowcastBuffer()
+    buffer.update(_nowcast(forecast_payload, START, [0.0, 0.4, 1.2, 0.8, 2.0]))
+    summary = summarize(buffer.steps(START))
+    assert summary.next_hour == 0.6
+    assert summary.starts_at == START + timedelta(minutes=15)
+    assert summary.max_intensity == 2.0
+
+    # A nowcast that only starts with the next step still counts
+    assert len(buffer.steps(START - timedelta(minutes=10))) == 5
+    assert summarize([]).next_hour is None
@@ -0,0 +1,71 @@
+"""Test the coordinator polling the optional SMHI products."""
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.smhi_odp.core.products import FIRE_RISK
+from custom_components.smhi_odp.product_coordinator import (
+    PRODUCTS_TICK,
+    SmhiProductsCoordinator,
+)
+
+
+async def test_failed_product_backs_off(hass: HomeAssistant) -> None:
+    """Test a failing product is not requested again on the next tick."""
+    coordinator = SmhiProductsCoordinator(hass)
+    coordinator.async_register("entry", 59.3293, 18.0686, [FIRE_RISK.key])
+    coordinator.client.get_json = AsyncMock(side_effect=httpx.ConnectError("404"))
+
+    with (
+        patch.object(
+            coordinator, "_read_cache", side_effect=lambda jobs: [None] * len(jobs)
+        ),
+        patch(
+            "custom_components.smhi_odp.product_coordinator.time.monotonic"
+        ) as clock,
+    ):
+        clock.return_value = 1000.0
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert coordinator.client.get_json.call_count == 1
+
+        # Next tick: still backing off
+        clock.return_value += PRODUCTS_TICK.total_seconds()
+        assert await coordinator._async_update_data() == {}
+        assert coordinator.client.get_json.call_count == 1
+
+        # After the doubled delay it is tried again, and backs off further
+        clock.return_value += PRODUCTS_TICK.total_seconds()
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert coordinator.client.get_json.call_count == 2
+        assert coordinator._next_poll[(FIRE_RISK.key, "entry")] == min(
+            clock.return_value + 4 * PRODUCTS_TICK.total_seconds(),
+            clock.return_value + FIRE_RISK.interval.total_seconds(),
+        )
+
+
+async def test_empty_product_backs_off(hass: HomeAssistant) -> None:
+    """Test an empty response backs off like a failed one."""
+    coordinator = SmhiProductsCoordinator(hass)
+    coordinator.async_register("entry", 59.3293, 18.0686, [FIRE_RISK.key])
+    coordinator.client.get_json = AsyncMock(return_value={})
+
+    with (
+        patch.object(
+            coordinator, "_read_cache", side_effect=lambda jobs: [None] * len(jobs)
+        ),
+        patch(
+            "custom_components.smhi_odp.product_coordinator.time.monotonic"
+        ) as clock,
+    ):
+        clock.return_value = 1000.0
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+        clock.return_value += PRODUCTS_TICK.total_seconds()
+        assert await coordinator._async_update_data() == {}
+        assert coordinator.client.get_json.call_count == 1
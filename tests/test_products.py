@@ -0,0 +1,66 @@
+"""Test the SMHI product registry and the fire risk product."""
+from datetime import date, timedelta
+
+import pytest
+
+from custom_components.smhi_odp.core.products import (
+    FIRE_RISK,
+    PRODUCTS,
+    Product,
+    parse_payloads,
+    register_product,
+)
+
+FIRE_RISK_PAYLOAD = {
+    "approvedTime": "2026-06-01T05:00:00Z",
+    "referenceTime": "2026-06-01T00:00:00Z",
+    "geometry": {"type": "Point", "coordinates": [[18.07, 59.33]]},
+    "timeSeries": [
+        {
+            "validTime": f"2026-06-0{day}T12:00:00Z",
+            "parameters": [
+                {"name": "fwiindex", "values": [index]},
+                {"name": "fwi", "values": [fwi]},
+                {"name": "isi", "values": [3.2]},
+                {"name": "grassfire", "values": [-1]},
+            ],
+        }
+        for day, index, fwi in ((1, 3, 9.5), (2, 5, 21.0), (3, -1, -1))
+    ],
+}
+
+
+def test_fire_risk_is_registered() -> None:
+    """Test the built-in product and its location URL."""
+    assert PRODUCTS["fire_risk"] is FIRE_RISK
+    assert "fwif1g" in FIRE_RISK.url_for(59.33, 18.07)
+    assert "/lon/18.070000/lat/59.330000/" in FIRE_RISK.url_for(59.33, 18.07)
+
+    with pytest.raises(ValueError):
+        register_product(FIRE_RISK)
+
+
+def test_parse_fire_risk() -> None:
+    """Test daily values are parsed and fill values dropped."""
+    days = FIRE_RISK.parse(FIRE_RISK_PAYLOAD)
+
+    assert [day.date for day in days] == [
+        date(2026, 6, 1),
+        date(2026, 6, 2),
+        date(2026, 6, 3),
+    ]
+    assert days[0].level == "moderate"
+    assert days[0].fwi == 9.5
+    assert days[0].grass_fire is None
+    assert days[1].level == "very_high"
+    assert days[2].index is None and days[2].level is None
+
+
+def test_parse_payloads_isolates_failures() -> None:
+    """Test one unusable payload does not fail the others."""
+    broken = Product("broken", "Broken", "", timedelta(hours=1), lambda p: p["x"])
+
+    results = parse_payloads([(broken, {}), (FIRE_RISK, FIRE_RISK_PAYLOAD)])
+
+    assert results[0] is None
+    assert len(results[1]) == 3
@@ -1,6 +1,7 @@
 """Test SMHI sensors."""
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from custom_components.smhi_odp.const import DOMAIN
 
 async def test_sensors(hass: HomeAssistant, mock_smhi_api) -> None:
@@ -43,3 +44,36 @@ async def test_sensors(hass: HomeAssistant, mock_smhi_api) -> None:
     assert state
     assert state.state == "18.0"  # HA converts to km/h
 
+
+async def test_long_horizon_sensors_disabled_by_default(
+    hass: HomeAssistant, mock_smhi_api
+) -> None:
+    """Test later days and wind direction are registered but disabled."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    assert hass.states.get("sensor.smhi_odp_home_today")
+    assert hass.states.get("sensor.smhi_odp_home_tomorrow")
+    for entity_id in (
+        "sensor.smhi_odp_home_day_2",
+        "sensor.smhi_odp_home_wind_direction",
+    ):
+        assert hass.states.get(entity_id) is None
+        entity = registry.async_get(entity_id)
+        assert entity.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+
+    # Disabled sensors' values are not computed
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert "day_2" not in coordinator.view.entities
+    assert "day_0" in coordinator.view.entities
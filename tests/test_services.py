@@ -0,0 +1,102 @@
+"""Test the services of the integration."""
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.smhi_odp.const import DOMAIN
+
+
+async def test_get_degree_days(hass: HomeAssistant, mock_smhi_api) -> None:
+    """Test the degree-days of a location are returned in one call."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_degree_days",
+        {"config_entry_id": entry.entry_id, "days": 3},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["heating_base"] == 17.0
+    assert len(response["days"]) == 1
+    # One hour at 15 °C, 2 degrees below the base
+    assert response["days"][0]["heating_degree_days"] == 0.08
+    assert response["days"][0]["cooling_degree_days"] == 0.0
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "get_degree_days",
+            {"config_entry_id": "missing"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_import_locations(hass: HomeAssistant, mock_smhi_api) -> None:
+    """Test locations are imported once and uncovered ones are rejected."""
+    locations = [
+        {"name": "Home", "latitude": 59.3293, "longitude": 18.0686},
+        {"name": "Paris", "latitude": 48.85, "longitude": 2.35},
+    ]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "import_locations",
+        {"locations": locations},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+
+    assert [location["name"] for location in response["created"]] == ["Home"]
+    assert response["failed"][0]["reason"] == "outside_coverage"
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 1
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "import_locations",
+        {"locations": locations[:1]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["created"] == []
+    assert response["skipped"][0]["reason"] == "already_configured"
+
+
+async def test_find_best_windows(hass: HomeAssistant, mock_smhi_api) -> None:
+    """Test windows are searched in the loaded forecast."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "find_best_windows",
+        {"config_entry_id": entry.entry_id, "hours": 1, "max_wind_speed": 4},
+        blocking=True,
+        return_response=True,
+    )
+
+    # The only hour has 5 m/s of wind
+    assert response == {"windows": []}
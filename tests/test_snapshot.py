@@ -0,0 +1,53 @@
+"""Test the read-only forecast snapshot."""
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.smhi_odp.core.model import build_forecast, build_view
+from custom_components.smhi_odp.core.snapshot import build_snapshot
+
+PAYLOAD = {
+    "referenceTime": "2026-10-01T00:00:00Z",
+    "timeSeries": [
+        {
+            "time": f"2026-10-01T{hour:02d}:00:00Z",
+            "data": {
+                "air_temperature": 5.0 + hour,
+                "wind_speed": 3.0,
+                "precipitation_amount_mean": 0.5 if hour == 3 else 0.0,
+                "symbol_code": 3,
+            },
+        }
+        for hour in range(1, 7)
+    ],
+}
+
+
+def test_snapshot_is_frozen_and_complete() -> None:
+    """Test the snapshot carries the hourly series and daily aggregates."""
+    forecast = build_forecast(PAYLOAD, timezone.utc)
+    view = build_view(forecast, datetime(2026, 10, 1, tzinfo=timezone.utc), ())
+    snapshot = build_snapshot(
+        forecast,
+        view,
+        entry_id="abc",
+        name="Home",
+        latitude=59.3,
+        longitude=18.0,
+        generation=3,
+    )
+
+    assert snapshot.generation == 3
+    assert snapshot.reference_time == datetime(2026, 10, 1, tzinfo=timezone.utc)
+    assert len(snapshot.hourly) == 6
+    assert snapshot.hourly.values["air_temperature"] == (6, 7, 8, 9, 10, 11)
+    assert snapshot.hourly.conditions[0] == "partlycloudy"
+    assert sum(snapshot.hourly.precipitation["precipitation"]) == pytest.approx(0.5)
+    assert snapshot.daily[0].temperature_max == 11
+    assert snapshot.daily[0].temperature_min == 6
+
+    with pytest.raises(FrozenInstanceError):
+        snapshot.generation = 4
+    with pytest.raises(TypeError):
+        snapshot.hourly.values["air_temperature"] = ()
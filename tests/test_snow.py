@@ -0,0 +1,77 @@
+"""Test snowfall accumulation and melt."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.smhi_odp.core.model import build_forecast, build_view
+from custom_components.smhi_odp.core.snow import frozen_fractions, totals
+
+START = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+def test_frozen_fractions() -> None:
+    """Test published fractions, percentages and the temperature fallback."""
+    assert frozen_fractions([0.5, None, None, None], [5.0, -1.0, 1.0, 3.0]) == [
+        0.5,
+        1.0,
+        0.5,
+        0.0,
+    ]
+    # A fill value falls back to the temperature
+    assert frozen_fractions([1.0, 0.4, -9], [0.0, 0.0, 5.0]) == [1.0, 0.4, 0.0]
+
+
+def test_pmp3g_frozen_part_is_percent() -> None:
+    """Test pmp3g percentages of 0 and 1 are not read as fractions."""
+    payload = {
+        "timeSeries": [
+            {
+                "validTime": (START + timedelta(hours=h + 1)).isoformat(),
+                "parameters": [
+                    {"name": "t", "values": [3.0]},
+                    {"name": "pmean", "values": [1.0]},
+                    {"name": "spp", "values": [part]},
+                ],
+            }
+            for h, part in enumerate((-9, 0, 1))
+        ]
+    }
+    forecast = build_forecast(payload, timezone.utc)
+
+    assert forecast.column("precipitation_frozen_part") == [-9, 0.0, 0.01]
+    # The fill value is rain at 3 °C, 0 % is rain and 1 % is 1 % snow
+    assert forecast.snowfall == [0.0, 0.0, pytest.approx(0.01)]
+
+
+def test_running_accumulation_with_melt() -> None:
+    """Test melt only removes snow that has fallen."""
+    # 2 mm snow, then 24 h at +8 °C melt 24 mm potential, then 1 mm snow
+    result = totals([2.0, 0.0, 1.0], [0.0, 24.0, 0.0])
+
+    assert result.snowfall == 3.0
+    assert result.depth == 3.0
+    assert result.melt == 24.0
+    assert result.accumulation == 1.0
+
+
+def test_snow_windows_and_daily_forecast(forecast_payload) -> None:
+    """Test window sensors and daily totals from the forecast."""
+    # 12 cold hours of 1 mm/h snow, then 12 mild hours of rain
+    steps = [{"air_temperature": -3.0, "precipitation_amount_mean": 1.0}] * 12 + [
+        {
+            "air_temperature": 4.0,
+            "precipitation_amount_mean": 1.0,
+            "precipitation_frozen_part": 0.0,
+        }
+    ] * 12
+    forecast = build_forecast(forecast_payload(steps, START), timezone.utc)
+    view = build_view(forecast, START)
+
+    window = view.entities["snowfall_24h"]
+    assert window.native_value == 12.0
+    assert window.attributes["snowfall_water_equivalent"] == 12.0
+    # 12 h at +4 °C melt 6 mm of the new snow
+    assert window.attributes["melt"] == pytest.approx(6.0)
+    assert window.attributes["accumulation"] == pytest.approx(6.0)
+
+    assert view.daily_forecast[0]["snowfall"] == 12.0
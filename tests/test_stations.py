@@ -0,0 +1,66 @@
+"""Test the metobs station index and payload parsing."""
+import random
+
+from custom_components.smhi_odp.core.stations import (
+    Station,
+    StationIndex,
+    distance_km,
+    parse_latest,
+    parse_stations,
+)
+
+
+def test_nearest_matches_brute_force() -> None:
+    """Test the grid lookup returns the same stations as a full scan."""
+    rng = random.Random(4)
+    stations = [
+        Station(str(i), f"Station {i}", rng.uniform(55, 69), rng.uniform(11, 24))
+        for i in range(300)
+    ]
+    index = StationIndex(stations)
+    assert len(index) == 300
+
+    for lat, lon in ((59.3293, 18.0686), (67.85, 20.22), (55.6, 13.0)):
+        expected = sorted(
+            stations, key=lambda s: distance_km(lat, lon, s.latitude, s.longitude)
+        )[:3]
+        assert [s for s, _ in index.nearest(lat, lon)] == expected
+
+
+def test_parse_catalog_and_latest_hour() -> None:
+    """Test inactive stations and missing values are skipped."""
+    stations = parse_stations(
+        {
+            "station": [
+                {
+                    "key": 98230,
+                    "name": "Stockholm A",
+                    "latitude": 59.34,
+                    "longitude": 18.05,
+                    "active": True,
+                },
+                {
+                    "key": 98210,
+                    "name": "Old",
+                    "latitude": 59.3,
+                    "longitude": 18.0,
+                    "active": False,
+                },
+            ]
+        }
+    )
+    assert stations == [Station("98230", "Stockholm A", 59.34, 18.05)]
+
+    readings = parse_latest(
+        {
+            "station": [
+                {
+                    "key": "98230",
+                    "value": [{"date": 1792411200000, "value": "7.4", "quality": "G"}],
+                },
+                {"key": "98210", "value": None},
+            ]
+        }
+    )
+    assert list(readings) == ["98230"]
+    assert readings["98230"].value == 7.4
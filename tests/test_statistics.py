@@ -0,0 +1,38 @@
+"""Test the SMHI ODP long-term statistics import."""
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from custom_components.smhi_odp.core.model import build_forecast
+from custom_components.smhi_odp.statistics import forecast_statistics, statistic_id
+
+
+def test_forecast_statistics(forecast_payload) -> None:
+    """Test forecast and issued-at series are built from one forecast."""
+    reference = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+    hours = range(0, 30, 3)
+    payload = forecast_payload(
+        [{"air_temperature": float(h), "wind_speed": 2.0} for h in hours],
+        reference,
+        hours,
+        reference=reference,
+    )
+    series = forecast_statistics(build_forecast(payload, ZoneInfo("UTC")))
+
+    unit, rows = series["temperature_forecast"]
+    assert unit == "°C"
+    assert len(rows) == 10
+    assert rows[1] == {
+        "start": reference + timedelta(hours=3),
+        "mean": 3.0,
+        "min": 3.0,
+        "max": 3.0,
+    }
+    # Only the value valid 24 h after the reference time is snapshotted
+    assert series["temperature_issued_24h"][1] == [
+        {"start": reference + timedelta(hours=24), "mean": 24.0, "min": 24.0, "max": 24.0}
+    ]
+    assert "precipitation_forecast" not in series
+
+    assert statistic_id("01ABC", "temperature_forecast") == (
+        "smhi_odp:01abc_temperature_forecast"
+    )
@@ -0,0 +1,38 @@
+"""Test the sunrise and sunset calculation."""
+from datetime import date, datetime, timedelta, timezone
+
+from custom_components.smhi_odp.core.sun import night_window, sun_times
+
+STOCKHOLM = (59.3293, 18.0686)
+KIRUNA = (67.8558, 20.2253)
+CET = timezone(timedelta(hours=1))
+
+
+def _near(actual: datetime, hour: int, minute: int) -> bool:
+    """Return True if a UTC time is within two minutes of hour:minute."""
+    expected = actual.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return abs(actual - expected) < timedelta(minutes=2)
+
+
+def test_sun_times() -> None:
+    """Test Stockholm's midsummer and midwinter sun."""
+    sunrise, sunset = sun_times(date(2026, 6, 21), *STOCKHOLM)
+    assert _near(sunrise, 1, 31)
+    assert _near(sunset, 20, 8)
+
+    sunrise, sunset = sun_times(date(2026, 12, 21), *STOCKHOLM)
+    assert _near(sunrise, 7, 44)
+    assert _near(sunset, 13, 48)
+
+
+def test_night_window_without_sunset() -> None:
+    """Test fixed local hours stand in for the night during midnight sun."""
+    assert sun_times(date(2026, 6, 21), *KIRUNA) == (None, None)
+    assert night_window(date(2026, 6, 21), *KIRUNA, CET) == (
+        datetime(2026, 6, 21, 18, tzinfo=CET),
+        datetime(2026, 6, 22, 6, tzinfo=CET),
+    )
+
+    start, end = night_window(date(2026, 10, 19), *STOCKHOLM, CET)
+    assert start.date() == date(2026, 10, 19)
+    assert end.date() == date(2026, 10, 20)
@@ -0,0 +1,115 @@
+"""Test the warnings feed parsing and its spatial index."""
+from datetime import datetime, timezone
+import random
+
+from custom_components.smhi_odp.core.warning_areas import (
+    WarningIndex,
+    highest_level,
+    parse_warnings,
+    point_in_polygon,
+)
+
+
+def _square(x: float, y: float, size: float) -> list:
+    """Return a closed square ring with its lower left corner at (x, y)."""
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+def _warning(warning_id: int, level: str, rings: list, **area) -> dict:
+    """Return a warning of the feed with one polygon area."""
+    return {
+        "id": warning_id,
+        "event": {"sv": "Vind", "en": "Wind", "code": "WIND"},
+        "warningAreas": [
+            {
+                "areaName": {"sv": f"Område {warning_id}", "en": f"Area {warning_id}"},
+                "warningLevel": {"sv": level, "en": level, "code": level},
+                "eventDescription": {"en": "Strong wind"},
+                "area": {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            "type": "Feature",
+                            "geometry": {"type": "Polygon", "coordinates": rings},
+                        }
+                    ],
+                },
+                **area,
+            }
+        ],
+    }
+
+
+def test_point_in_polygon_with_hole() -> None:
+    """Test points in a hole are outside the polygon."""
+    polygon = [
+        [tuple(p) for p in _square(0, 0, 10)],
+        [tuple(p) for p in _square(4, 4, 2)],
+    ]
+    assert point_in_polygon(1, 1, polygon)
+    assert not point_in_polygon(5, 5, polygon)
+    assert not point_in_polygon(11, 5, polygon)
+
+
+def test_parse_and_lookup() -> None:
+    """Test the feed is flattened and matched by location."""
+    payload = [
+        _warning(
+            1,
+            "YELLOW",
+            [_square(17, 59, 2)],
+            approximateStart="2025-01-01T00:00:00Z",
+            approximateEnd="2025-01-02T00:00:00Z",
+        ),
+        _warning(2, "ORANGE", [_square(18, 59, 1)]),
+        _warning(3, "RED", [_square(12, 55, 1)]),
+    ]
+    areas = parse_warnings(payload)
+    assert [a.area_name for a in areas] == ["Area 1", "Area 2", "Area 3"]
+
+    index = WarningIndex(areas)
+    found = index.lookup(59.33, 18.07)
+    assert sorted(a.warning_id for a in found) == ["1", "2"]
+    assert highest_level(found) == "orange"
+    assert index.lookup(65.0, 20.0) == []
+
+    now = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    later = datetime(2025, 1, 3, tzinfo=timezone.utc)
+    assert areas[0].is_active(now)
+    assert not areas[0].is_active(later)
+    assert areas[0].as_dict(now)["start"] == "2025-01-01T00:00:00+00:00"
+
+
+def test_messages_are_not_warnings() -> None:
+    """Test informational messages are told apart from warning levels."""
+    payload = [
+        _warning(1, "MESSAGE", [_square(17, 59, 2)]),
+        _warning(2, "YELLOW", [_square(17, 59, 2)]),
+    ]
+    message, yellow = parse_warnings(payload)
+    assert not message.is_warning
+    assert yellow.is_warning
+    assert highest_level([message]) == "message"
+
+
+def test_index_matches_full_scan() -> None:
+    """Test the R-tree finds the same areas as testing every polygon."""
+    rng = random.Random(7)
+    payload = [
+        _warning(
+            i,
+            "YELLOW",
+            [_square(rng.uniform(11, 23), rng.uniform(55, 68), rng.uniform(0.2, 2))],
+        )
+        for i in range(200)
+    ]
+    areas = parse_warnings(payload)
+    index = WarningIndex(areas)
+    for _ in range(50):
+        lat, lon = rng.uniform(55, 69), rng.uniform(11, 24)
+        expected = {
+            a.warning_id
+            for a in areas
+            if any(point_in_polygon(lon, lat, p) for p in a.polygons)
+        }
+        assert {a.warning_id for a in index.lookup(lat, lon)} == expected
@@ -35,3 +35,34 @@ async def test_weather_entity(hass: HomeAssistant, mock_smhi_api) -> None:
     # Forecast is exposed as a state attribute for Lovelace/dashboard compatibility
     assert "forecast" in state.attributes
     assert isinstance(state.attributes["forecast"], list)
+
+
+async def test_weather_forecast_attribute_option(hass: HomeAssistant, mock_smhi_api) -> None:
+    """Test the legacy forecast attribute can be dropped by option."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "name": "Home",
+            "latitude": 59.3293,
+            "longitude": 18.0686,
+        },
+        options={"forecast_attribute": False},
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("weather.home")
+    assert state
+    assert "forecast" not in state.attributes
+
+    # Forecasts are still available through the service
+    response = await hass.services.async_call(
+        "weather",
+        "get_forecasts",
+        {"entity_id": "weather.home", "type": "hourly"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["weather.home"]["forecast"]
@@ -0,0 +1,77 @@
+"""Test the best time window search."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.smhi_odp.core.model import build_forecast
+from custom_components.smhi_odp.core.windows import (
+    WindowCriteria,
+    find_windows,
+    sliding_max,
+    window_bounds,
+)
+
+START = datetime(2026, 6, 10, tzinfo=timezone.utc)
+
+
+def _step(temperature: float, humidity: float, wind: float, rate: float) -> dict:
+    """Return the data of a step from its humidity, wind and mm/h."""
+    return {
+        "air_temperature": temperature,
+        "relative_humidity": humidity,
+        "wind_speed": wind,
+        "precipitation_amount_mean": rate,
+    }
+
+
+def test_window_bounds_follow_step_lengths() -> None:
+    """Test windows only cover whole steps adding up to the wanted hours."""
+    assert window_bounds([1, 1, 1, 1], 2) == [(0, 2), (1, 3), (2, 4)]
+    assert window_bounds([1, 1, 3, 3], 3) == [(2, 3), (3, 4)]
+    assert window_bounds([1, 1, 1, 3, 3], 6) == [(0, 4), (3, 5)]
+
+
+def test_sliding_max() -> None:
+    """Test the largest value of every range."""
+    values = [3, 1, 4, 1, 5, 9, 2, 6]
+    bounds = window_bounds([1] * len(values), 3)
+    assert sliding_max(values, bounds) == [
+        max(values[start:end]) for start, end in bounds
+    ]
+
+
+def test_best_windows(forecast_payload) -> None:
+    """Test dry, calm hours win and the top windows do not overlap."""
+    wet = _step(15.0, 90.0, 2.0, 1.0)
+    dry = _step(20.0, 40.0, 2.0, 0.0)
+    windy = _step(20.0, 40.0, 12.0, 0.0)
+    steps = [wet] * 3 + [dry] * 4 + [wet] * 3 + [windy] * 3 + [wet] * 2
+    forecast = build_forecast(forecast_payload(steps, START), timezone.utc)
+
+    best = find_windows(forecast, START, hours=3, horizon=12, count=2)
+    assert [window.start for window in best] == [
+        START + timedelta(hours=3),
+        START + timedelta(hours=10),
+    ]
+    assert best[0].precipitation == 0.0
+    assert best[0].temperature == 20.0
+    assert best[0].score == 0.5 * 20 - 0.1 * 40 - 2.0
+
+    calm = find_windows(
+        forecast,
+        START,
+        hours=3,
+        horizon=12,
+        count=3,
+        criteria=WindowCriteria(max_wind_speed=5, max_precipitation=0.5),
+    )
+    assert [window.start for window in calm] == [START + timedelta(hours=3)]
+
+
+def test_windows_start_after_now(forecast_payload) -> None:
+    """Test the step under way is not offered as a window start."""
+    dry = _step(20.0, 40.0, 2.0, 0.0)
+    forecast = build_forecast(forecast_payload([dry] * 6, START), timezone.utc)
+
+    now = START + timedelta(minutes=30)
+    best = find_windows(forecast, now, hours=3, horizon=6, count=3)
+    assert [window.start for window in best] == [START + timedelta(hours=1)]
+    assert all(window.start >= now for window in best)